@@ -0,0 +1,82 @@
+"""
+Benchmark detector throughput across inference batch sizes.
+
+Scores a fixed set of random 224x224 face crops with each batch size and
+reports crops per second relative to batch size 1. The torchvision models
+need no download; use --model vit-deepfake to measure the HuggingFace
+model once it is cached. --backend onnx measures the ONNX Runtime backend.
+
+Usage:
+    python benchmarks/bench_batch_inference.py [--model efficientnet]
+        [--backend torch|onnx] [--num-crops N] [--batch-sizes 1 2 4 8 16 32 64]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceCrop
+from deepfake_detector.models.detector import DeepFakeDetector
+
+
+def make_crops(count: int) -> list[FaceCrop]:
+    """Create random 224x224 face crops."""
+    rng = np.random.default_rng(0)
+    box = BoundingBox(x=0, y=0, width=224, height=224, confidence=1.0)
+    return [
+        FaceCrop(
+            frame_index=i,
+            box=box,
+            image=rng.integers(0, 256, (224, 224, 3), dtype=np.uint8),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="efficientnet")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--backend", default="torch", choices=["torch", "onnx"])
+    parser.add_argument("--num-crops", type=int, default=64)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    detector = DeepFakeDetector(
+        model_name=args.model, device=args.device, backend=args.backend
+    )
+    detector.load_model()
+    if not detector.is_loaded:
+        raise SystemExit(f"Could not load model: {args.model}")
+
+    crops = make_crops(args.num_crops)
+    # Warm up allocator and kernels
+    detector.predict(crops[:2])
+
+    print(
+        f"torch threads: {torch.get_num_threads()}, model: {args.model}, "
+        f"backend: {args.backend}, "
+        f"crops: {len(crops)}"
+    )
+    print(f"{'batch':>6} {'time (s)':>9} {'crops/s':>8} {'speedup':>8}")
+    base_rate = None
+    for batch_size in args.batch_sizes:
+        detector.batch_size = batch_size
+        best = float("inf")
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            detector.predict(crops)
+            best = min(best, time.perf_counter() - start)
+        rate = len(crops) / best
+        base_rate = base_rate or rate
+        print(f"{batch_size:>6} {best:>9.3f} {rate:>8.1f} {rate / base_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
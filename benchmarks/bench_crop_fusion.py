@@ -0,0 +1,75 @@
+"""
+Benchmark cross-video crop fusion in batch mode.
+
+Analyzes copies of the sample videos with batch mode's analyze_videos,
+once per video at a time (per-video inference batches) and then with
+several videos in flight per worker, whose face crops are pooled into
+shared batches. A small --num-frames mimics short clips that yield only
+a few crops each. Reports videos per minute for each setting.
+
+Usage:
+    python benchmarks/bench_crop_fusion.py [--copies N] [--num-frames N]
+        [--streams 1 4] [--workers N] [--model efficientnet]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from deepfake_detector.batch import analyze_videos, collect_videos
+from deepfake_detector.utils.config import Config
+
+SAMPLE_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def make_videos(directory: Path, copies: int) -> list[str]:
+    """Link each sample video into directory ``copies`` times."""
+    videos = []
+    for index in range(copies):
+        for source in collect_videos([str(SAMPLE_DIR)]):
+            link = directory / f"{index}-{Path(source).name}"
+            link.symlink_to(Path(source).resolve())
+            videos.append(str(link))
+    return videos
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="efficientnet")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--num-frames", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    config = Config()
+    config.device = args.device
+    config.detection.model = args.model
+    config.detection.inference.batch_size = args.batch_size
+    config.detection.num_frames = args.num_frames
+    config.logging.level = "WARNING"
+
+    with tempfile.TemporaryDirectory() as directory:
+        videos = make_videos(Path(directory), args.copies)
+        print(
+            f"videos: {len(videos)}, frames per video: {args.num_frames}, "
+            f"workers: {args.workers}, batch size: {args.batch_size}"
+        )
+        print(f"{'streams':>7} {'time (s)':>9} {'videos/min':>10} {'failed':>6}")
+        for streams in args.streams:
+            start = time.perf_counter()
+            records = list(analyze_videos(videos, config, args.workers, streams))
+            elapsed = time.perf_counter() - start
+            failed = sum("error" in record for record in records)
+            print(
+                f"{streams:>7} {elapsed:>9.2f} {60 * len(videos) / elapsed:>10.1f} "
+                f"{failed:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark face detection recall and speed across detection scales.
+
+Detects faces on sampled frames at several resolution factors and compares
+each against full-resolution detection. Recall is the share of reference
+faces matched by a box with IoU of at least --min-iou.
+
+Usage:
+    python benchmarks/bench_detection_scale.py [VIDEO ...] [--num-frames N]
+        [--scales 1.0 0.5 0.25]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceAnalyzer
+from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+
+DEFAULT_VIDEOS = sorted(
+    (Path(__file__).resolve().parents[1] / "data" / "fake").glob("*.mp4")
+)
+
+
+def iou(first: BoundingBox, second: BoundingBox) -> float:
+    """Intersection over union of two boxes."""
+    left = max(first.x, second.x)
+    top = max(first.y, second.y)
+    right = min(first.x + first.width, second.x + second.width)
+    bottom = min(first.y + first.height, second.y + second.height)
+    inter = max(0, right - left) * max(0, bottom - top)
+    union = first.width * first.height + second.width * second.height - inter
+    return inter / union if union else 0.0
+
+
+def detect_all(frames: list, scale: float) -> tuple[float, list[list[BoundingBox]]]:
+    """Return the wall time and the boxes found in each frame."""
+    analyzer = FaceAnalyzer(detection_scale=scale)
+    start = time.perf_counter()
+    boxes = [analyzer.detect_faces(frame.image) for frame in frames]
+    return time.perf_counter() - start, boxes
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("videos", nargs="*", type=Path, default=DEFAULT_VIDEOS)
+    parser.add_argument("--num-frames", type=int, default=20)
+    parser.add_argument(
+        "--scales", type=float, nargs="+", default=[1.0, 0.75, 0.5, 0.35, 0.25]
+    )
+    parser.add_argument("--min-iou", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(
+        f"{'video':<24} {'scale':>6} {'faces':>6} {'recall':>7} "
+        f"{'mean IoU':>9} {'time (s)':>9} {'speedup':>8}"
+    )
+    for path in args.videos:
+        with VideoAnalyzer() as video:
+            video.load(str(path))
+            frames = video.extract_frames(num_frames=args.num_frames)
+
+        base_time, reference = detect_all(frames, 1.0)
+        for scale in args.scales:
+            if scale == 1.0:
+                elapsed, boxes = base_time, reference
+            else:
+                elapsed, boxes = detect_all(frames, scale)
+
+            # Best match for every reference face
+            matches = [
+                max((iou(ref, box) for box in found), default=0.0)
+                for refs, found in zip(reference, boxes)
+                for ref in refs
+            ]
+            matched = [m for m in matches if m >= args.min_iou]
+            recall = len(matched) / len(matches) if matches else 0.0
+            mean_iou = float(np.mean(matched)) if matched else 0.0
+            print(
+                f"{path.name:<24} {scale:>6.2f} {sum(map(len, boxes)):>6} "
+                f"{recall:>7.2f} {mean_iou:>9.3f} {elapsed:>9.3f} "
+                f"{base_time / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark face tracking and ROI search against per-frame Haar detection.
+
+Runs the face analyzer over densely sampled frames with different
+detection intervals, with and without ROI search around the previous
+face, and reports the time spent, the number of frames that were tracked
+instead of detected, and how closely the resulting boxes match per-frame
+full-frame detection (mean IoU).
+
+Usage:
+    python benchmarks/bench_face_tracking.py [VIDEO ...] [--num-frames N]
+        [--intervals 1 5 10]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceAnalyzer
+from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+
+DEFAULT_VIDEOS = sorted(
+    (Path(__file__).resolve().parents[1] / "data" / "fake").glob("*.mp4")
+)
+
+
+def iou(first: BoundingBox, second: BoundingBox) -> float:
+    """Intersection over union of two boxes."""
+    left = max(first.x, second.x)
+    top = max(first.y, second.y)
+    right = min(first.x + first.width, second.x + second.width)
+    bottom = min(first.y + first.height, second.y + second.height)
+    inter = max(0, right - left) * max(0, bottom - top)
+    union = first.width * first.height + second.width * second.height - inter
+    return inter / union if union else 0.0
+
+
+def run_interval(
+    frames: list, interval: int, roi_search: bool = False
+) -> tuple[float, dict, int]:
+    """Return the wall time, boxes by frame index and tracked frame count."""
+    analyzer = FaceAnalyzer(detect_interval=interval, roi_search=roi_search)
+    start = time.perf_counter()
+    crops = analyzer.extract_faces_from_frames(frames)
+    elapsed = time.perf_counter() - start
+    return elapsed, {c.frame_index: c.box for c in crops}, analyzer.frames_tracked
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("videos", nargs="*", type=Path, default=DEFAULT_VIDEOS)
+    parser.add_argument("--num-frames", type=int, default=60)
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 5, 10])
+    args = parser.parse_args()
+
+    print(
+        f"{'video':<24} {'interval':>8} {'roi':>4} {'frames':>6} {'tracked':>7} "
+        f"{'time (s)':>9} {'speedup':>8} {'mean IoU':>9}"
+    )
+    for path in args.videos:
+        with VideoAnalyzer() as video:
+            video.load(str(path))
+            frames = list(video.iter_frames(indices=range(args.num_frames)))
+
+        base_time, reference, _ = run_interval(frames, 1)
+        runs = [(interval, roi) for interval in args.intervals for roi in (False, True)]
+        for interval, roi in runs:
+            if interval == 1 and not roi:
+                elapsed, boxes, tracked = base_time, reference, 0
+            else:
+                elapsed, boxes, tracked = run_interval(frames, interval, roi)
+            overlaps = [
+                iou(boxes[index], box)
+                for index, box in reference.items()
+                if index in boxes
+            ]
+            mean_iou = float(np.mean(overlaps)) if overlaps else 0.0
+            print(
+                f"{path.name:<24} {interval:>8} {'on' if roi else 'off':>4} "
+                f"{len(frames):>6} {tracked:>7} "
+                f"{elapsed:>9.3f} {base_time / elapsed:>7.1f}x {mean_iou:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark bfloat16 against float32 inference throughput.
+
+Scores a fixed set of random 224x224 face crops at each precision and
+reports crops per second and the largest per-crop score change relative
+to fp32. The torchvision models are seeded so both precisions see the
+same random weights; use --models vit-deepfake to measure the HuggingFace
+model once it is cached. bf16 is only fast on CPUs with AMX or
+AVX-512-BF16 (or on GPUs with bfloat16 tensor cores).
+
+Usage:
+    python benchmarks/bench_precision.py [--models efficientnet resnet]
+        [--num-crops N] [--batch-size N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceCrop
+from deepfake_detector.models.detector import PRECISIONS, DeepFakeDetector
+
+
+def make_crops(count: int) -> list[FaceCrop]:
+    """Create random 224x224 face crops."""
+    rng = np.random.default_rng(0)
+    box = BoundingBox(x=0, y=0, width=224, height=224, confidence=1.0)
+    return [
+        FaceCrop(
+            frame_index=i,
+            box=box,
+            image=rng.integers(0, 256, (224, 224, 3), dtype=np.uint8),
+        )
+        for i in range(count)
+    ]
+
+
+def load_detector(args: argparse.Namespace, model: str, precision: str):
+    """Load the detector at one precision with reproducible weights."""
+    torch.manual_seed(0)
+    detector = DeepFakeDetector(
+        model_name=model,
+        device=args.device,
+        cache_dir=args.cache_dir,
+        batch_size=args.batch_size,
+        precision=precision,
+    )
+    detector.load_model()
+    if not detector.is_loaded:
+        raise SystemExit(f"Could not load model: {model}")
+    return detector
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", nargs="+", default=["efficientnet", "resnet"])
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--num-crops", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--cache-dir", default="./models/cache")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    crops = make_crops(args.num_crops)
+    print(f"torch threads: {torch.get_num_threads()}, crops: {len(crops)}")
+    print(
+        f"{'model':<14} {'precision':<9} {'time (s)':>9} {'crops/s':>8} "
+        f"{'speedup':>8} {'max |delta|':>11}"
+    )
+    for model in args.models:
+        baseline = None
+        for precision in PRECISIONS:
+            detector = load_detector(args, model, precision)
+            detector.predict(crops[:2])  # Warm up
+            best = float("inf")
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                scores = np.asarray(detector.predict(crops))
+                best = min(best, time.perf_counter() - start)
+
+            if baseline is None:
+                baseline = (best, scores)
+            delta = float(np.max(np.abs(scores - baseline[1])))
+            print(
+                f"{model:<14} {precision:<9} {best:>9.3f} "
+                f"{len(crops) / best:>8.1f} {baseline[0] / best:>7.2f}x "
+                f"{delta:>11.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark INT8 quantization against FP32 inference on the sample videos.
+
+Extracts the primary face crops from each video once, then scores them
+with the PyTorch, ONNX Runtime FP32 and ONNX Runtime INT8 backends. The
+report shows the time per backend, the largest per-crop score drift from
+PyTorch FP32 and the video verdict.
+
+The torchvision models are seeded so every backend sees the same random
+weights. Their drift therefore measures how far a backend moves the
+output, not detection accuracy; pass --model vit-deepfake to measure the
+trained detector once it is in the cache.
+
+Usage:
+    python benchmarks/bench_quantization.py [VIDEO ...] [--model efficientnet]
+        [--num-frames N] [--cache-dir DIR]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from deepfake_detector.analyzers.face_analyzer import FaceAnalyzer
+from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+from deepfake_detector.models.detector import DeepFakeDetector, ResultAggregator
+
+DEFAULT_VIDEOS = sorted(
+    (Path(__file__).resolve().parents[1] / "data" / "fake").glob("*.mp4")
+)
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def load_detector(args: argparse.Namespace, backend: str) -> DeepFakeDetector:
+    """Load the detector on one backend with reproducible weights."""
+    torch.manual_seed(0)
+    detector = DeepFakeDetector(
+        model_name=args.model,
+        device="cpu",
+        cache_dir=args.cache_dir,
+        batch_size=args.batch_size,
+        backend=backend,
+    )
+    detector.load_model()
+    if not detector.is_loaded:
+        raise SystemExit(f"Could not load model: {args.model}")
+    if detector.active_backend != backend:
+        raise SystemExit(f"Backend {backend} unavailable, see log")
+    return detector
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("videos", nargs="*", type=Path, default=DEFAULT_VIDEOS)
+    parser.add_argument("--model", default="efficientnet")
+    parser.add_argument("--num-frames", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--cache-dir", default="./models/cache")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    crops = {}
+    for path in args.videos:
+        with VideoAnalyzer() as video:
+            video.load(str(path))
+            frames = video.iter_frames(num_frames=args.num_frames)
+            crops[path.name] = FaceAnalyzer().extract_faces_to_store(frames)
+
+    detectors = {backend: load_detector(args, backend) for backend in BACKENDS}
+    aggregator = ResultAggregator()
+
+    print(
+        f"{'video':<24} {'backend':<10} {'crops':>5} {'time (s)':>9} "
+        f"{'speedup':>8} {'max drift':>11} {'confidence':>10} {'verdict':>9}"
+    )
+    for name, store in crops.items():
+        if len(store) == 0:
+            print(f"{name:<24} no faces found, skipped")
+            continue
+        baseline = None
+        for backend, detector in detectors.items():
+            detector.predict([store[0]])  # Warm up
+            best = float("inf")
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                scores = np.asarray(detector.predict(store))
+                best = min(best, time.perf_counter() - start)
+
+            if baseline is None:
+                baseline = (best, scores)
+            drift = float(np.max(np.abs(scores - baseline[1])))
+            result = aggregator.aggregate(scores.tolist(), store.frame_indices.tolist())
+            print(
+                f"{name:<24} {backend:<10} {len(store):>5} {best:>9.3f} "
+                f"{baseline[0] / best:>7.2f}x {drift:>11.4f} "
+                f"{result.confidence:>10.3f} {result.verdict:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark cross-request batching of the serve daemon under concurrent load.
+
+Client threads each send a series of small predict() requests (1 to
+--max-crops random 224x224 crops, as the early-stopping and
+coarse-to-fine pipelines do) to one shared detector, either through a
+lock, which is how requests took turns before batching, or through an
+InferenceScheduler that merges them. Reports throughput, p50/p99 request
+latency and the mean number of crops per forward pass.
+
+Usage:
+    python benchmarks/bench_server_batching.py [--model efficientnet]
+        [--clients N] [--requests N] [--max-crops N] [--max-delay-ms MS]
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+import torch
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceCrop
+from deepfake_detector.models.detector import DeepFakeDetector
+from deepfake_detector.models.scheduler import InferenceScheduler
+
+
+class LockedDetector:  # pylint: disable=too-few-public-methods
+    """Serialize predict() calls without merging them."""
+
+    def __init__(self, detector: DeepFakeDetector) -> None:
+        self.detector = detector
+        self.lock = threading.Lock()
+
+    def predict(self, face_crops) -> list[float]:
+        """Score crops once no other caller is using the model."""
+        with self.lock:
+            return self.detector.predict(face_crops)
+
+
+def make_requests(args: argparse.Namespace) -> list[list[list[FaceCrop]]]:
+    """Create each client's requests of random crops."""
+    rng = np.random.default_rng(0)
+    box = BoundingBox(x=0, y=0, width=224, height=224, confidence=1.0)
+    return [
+        [
+            [
+                FaceCrop(i, box, rng.integers(0, 256, (224, 224, 3), dtype=np.uint8))
+                for i in range(rng.integers(1, args.max_crops + 1))
+            ]
+            for _ in range(args.requests)
+        ]
+        for _ in range(args.clients)
+    ]
+
+
+def run_load(predictor, requests: list[list[list[FaceCrop]]]) -> tuple[float, list]:
+    """Run every client concurrently; return wall time and latencies."""
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def client(client_requests: list[list[FaceCrop]]) -> None:
+        for crops in client_requests:
+            start = time.perf_counter()
+            predictor.predict(crops)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(r,)) for r in requests]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="efficientnet")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--cache-dir", default="./models/cache")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=6)
+    parser.add_argument("--max-crops", type=int, default=3)
+    parser.add_argument("--max-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    detector = DeepFakeDetector(
+        model_name=args.model,
+        device=args.device,
+        cache_dir=args.cache_dir,
+        batch_size=args.batch_size,
+    )
+    detector.load_model()
+    if not detector.is_loaded:
+        raise SystemExit(f"Could not load model: {args.model}")
+
+    requests = make_requests(args)
+    num_crops = sum(len(crops) for client in requests for crops in client)
+    detector.predict(requests[0][0])  # Warm up
+    print(
+        f"torch threads: {torch.get_num_threads()}, clients: {args.clients}, "
+        f"requests: {args.clients * args.requests}, crops: {num_crops}"
+    )
+    print(
+        f"{'mode':<10} {'time (s)':>9} {'crops/s':>8} {'p50 (ms)':>9} "
+        f"{'p99 (ms)':>9} {'crops/batch':>11}"
+    )
+
+    for mode in ("lock", "scheduler"):
+        if mode == "lock":
+            predictor = LockedDetector(detector)
+        else:
+            predictor = InferenceScheduler(detector, max_delay=args.max_delay_ms / 1000)
+        elapsed, latencies = run_load(predictor, requests)
+
+        if mode == "lock":
+            per_batch = num_crops / len(latencies)
+        else:
+            predictor.close()
+            per_batch = predictor.stats.mean_batch_size
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        print(
+            f"{mode:<10} {elapsed:>9.2f} {num_crops / elapsed:>8.1f} "
+            f"{p50:>9.0f} {p99:>9.0f} {per_batch:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
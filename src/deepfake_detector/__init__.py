@@ -1,29 +1,46 @@
 """DeepFake Detector Core Package."""
 
-from deepfake_detector.analyzers import (
-    BoundingBox,
-    FaceAnalyzer,
-    FaceCrop,
-    Frame,
-    VideoAnalyzer,
-    VideoInfo,
-)
-from deepfake_detector.models import (
-    AggregatedResult,
-    DeepFakeDetector,
-    DetectionIndicator,
-    FrameResult,
-    ResultAggregator,
-)
-from deepfake_detector.utils import (
-    Config,
-    ValidationError,
-    load_config,
-    setup_logging,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from deepfake_detector.analyzers import (
+        BoundingBox,
+        CropStore,
+        FaceAnalyzer,
+        FaceCrop,
+        Frame,
+        PrefetchIterator,
+        PrefetchStats,
+        VideoAnalyzer,
+        VideoInfo,
+    )
+    from deepfake_detector.models import (
+        AggregatedResult,
+        DeepFakeDetector,
+        DetectionIndicator,
+        FrameResult,
+        ResultAggregator,
+        SequentialTest,
+    )
+    from deepfake_detector.utils import (
+        Config,
+        ValidationError,
+        load_config,
+        setup_logging,
+    )
 
 __version__ = "0.1.0"
 
+# Subpackages whose public names are re-exported here. Names are imported
+# on first access, and the subpackages defer their own heavy modules, so
+# importing the package (or the CLI) does not load OpenCV, NumPy or PyTorch.
+_SUBPACKAGES = (
+    "deepfake_detector.analyzers",
+    "deepfake_detector.models",
+    "deepfake_detector.utils",
+)
+
 __all__ = [
     # Version
     "__version__",
@@ -34,15 +51,36 @@ __all__ = [
     "FaceAnalyzer",
     "BoundingBox",
     "FaceCrop",
+    "CropStore",
+    "PrefetchIterator",
+    "PrefetchStats",
     # Models
     "DeepFakeDetector",
     "ResultAggregator",
     "FrameResult",
     "DetectionIndicator",
     "AggregatedResult",
+    "SequentialTest",
     # Utils
     "Config",
     "load_config",
     "setup_logging",
     "ValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its subpackage on first access."""
+    if name in __all__:
+        for package in _SUBPACKAGES:
+            module = importlib.import_module(package)
+            if name in module.__all__:
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,443 @@
+"""Analysis of one video: decoding, face detection, scoring and aggregation."""
+
+import logging
+import time
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from deepfake_detector.analyzers.prefetch import PrefetchIterator
+from deepfake_detector.models.sequential import SequentialTest
+
+# The analysis modules load OpenCV, NumPy and PyTorch, so they are imported
+# inside the functions that run them; importing this module stays cheap
+if TYPE_CHECKING:
+    from deepfake_detector.models.detector import DeepFakeDetector
+
+logger = logging.getLogger(__name__)
+
+# Interleaved rounds used to visit sampled frames when early stopping
+EARLY_STOP_ROUNDS = 4
+
+
+def _echo(message: str) -> None:
+    """Print a line of verbose progress output."""
+    print(message, flush=True)
+
+
+def result_to_json(result, video_path: str, processing_time: float) -> dict[str, Any]:
+    """Build the JSON output document of a detection result."""
+    return {
+        "verdict": result.verdict,
+        "confidence": result.confidence,
+        "reasoning": [
+            {
+                "indicator": ind.name,
+                "detected": ind.detected,
+                "score": ind.score,
+                "description": ind.description,
+            }
+            for ind in result.indicators
+        ],
+        "metadata": {
+            "video_path": video_path,
+            "frames_analyzed": len(result.frame_results),
+            "frames_consumed": result.frames_consumed,
+            "stopped_early": result.stopped_early,
+            "processing_time_seconds": round(processing_time, 3),
+        },
+    }
+
+
+def _detect_face_crops(frames, face_analyzer, config, verbose: bool) -> list:
+    """
+    Run face detection over a frame stream.
+
+    Args:
+        frames: Iterator of Frame objects.
+        face_analyzer: FaceAnalyzer to run.
+        config: Configuration object.
+        verbose: Enable verbose output.
+
+    Returns:
+        CropStore holding the face crops in frame order.
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepfake_detector.analyzers.face_analyzer import CropStore
+
+    # Crops are resized straight into one preallocated buffer that the
+    # detector batches from without copying
+    store = CropStore(
+        capacity=config.detection.num_frames or 32,
+        size=config.video.frame_size,
+    )
+
+    # Optionally decode ahead on a background thread while faces are
+    # detected on this one
+    prefetcher = None
+    if config.video.prefetch_depth > 0:
+        prefetcher = PrefetchIterator(frames, depth=config.video.prefetch_depth)
+        frames = prefetcher
+
+    try:
+        face_crops = face_analyzer.extract_faces_to_store(frames, store)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+    if verbose:
+        _echo(f"  Extracted {face_analyzer.frames_scanned} frames")
+        _echo(f"  Found {len(face_crops)} face crops")
+        if prefetcher is not None:
+            stats = prefetcher.stats
+            _echo(
+                f"  Prefetch: decode {stats.producer_busy:.2f}s "
+                f"(blocked {stats.producer_wait:.2f}s), "
+                f"detection starved {stats.consumer_wait:.2f}s, "
+                f"bottleneck: {stats.bottleneck}"
+            )
+
+    return face_crops
+
+
+def _run_coarse_to_fine(video, face_analyzer, loader, config, verbose: bool):
+    """
+    Score a sparse first pass, then densify around suspicious frames.
+
+    Args:
+        video: VideoAnalyzer with a loaded video.
+        face_analyzer: FaceAnalyzer to run.
+        loader: ModelLoader building the detector in the background.
+        config: Configuration object.
+        verbose: Enable verbose output.
+
+    Returns:
+        Tuple of (face crops, scores, frames decoded), crops and scores
+        ordered by frame index.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    import numpy as np
+
+    from deepfake_detector.analyzers.sampling import refine_indices
+
+    budget = config.detection.num_frames
+    coarse_frames = min(config.detection.sampling.coarse_frames, budget)
+
+    if verbose:
+        _echo(f"Step 2/4: Coarse pass over {coarse_frames} frames...")
+
+    coarse = video.sample_indices(
+        num_frames=coarse_frames,
+        sample_rate=config.detection.sample_rate,
+        sampling=config.detection.sampling.strategy,
+    )
+    face_crops = _detect_face_crops(
+        video.iter_frames(indices=coarse), face_analyzer, config, verbose
+    )
+    scanned = face_analyzer.frames_scanned
+
+    # The model is waited for only once there are faces to score
+    detector = None
+    scores: list[float] = []
+    if face_crops:
+        detector = _wait_for_detector(loader, verbose)
+        scores = detector.predict(face_crops)
+        refine = refine_indices(
+            [crop.frame_index for crop in face_crops],
+            scores,
+            video.max_frame,
+            budget - scanned,
+            exclude=coarse,
+        )
+    else:
+        # Nothing to focus on yet, so spend the rest of the budget evenly
+        # on frames the coarse pass did not decode
+        unseen = np.setdiff1d(np.arange(video.max_frame), coarse)
+        remaining = max(0, min(budget - scanned, len(unseen)))
+        spread = np.linspace(0, len(unseen) - 1, remaining, dtype=int)
+        refine = unseen[np.unique(spread)]
+
+    if verbose:
+        _echo(f"Step 3/4: Refining with {len(refine)} more frames...")
+
+    if len(refine) > 0:
+        frames = video.iter_frames(indices=refine)
+        refined_crops = _detect_face_crops(frames, face_analyzer, config, verbose)
+        scanned += face_analyzer.frames_scanned
+        if refined_crops:
+            if detector is None:
+                detector = _wait_for_detector(loader, verbose)
+            refined_scores = detector.predict(refined_crops)
+
+            # Merge both passes back into frame order
+            merged = sorted(
+                zip(list(face_crops) + list(refined_crops), scores + refined_scores),
+                key=lambda pair: pair[0].frame_index,
+            )
+            face_crops = [crop for crop, _ in merged]
+            scores = [score for _, score in merged]
+
+    if verbose:
+        _echo(
+            f"Step 4/4: Scored {len(scores)} faces from {scanned} frames "
+            f"(budget: {budget})"
+        )
+
+    return face_crops, scores, scanned
+
+
+def _score_until_settled(crops, loader, test, batch_size: int, verbose: bool) -> list:
+    """
+    Score crops in micro-batches until the sequential test decides.
+
+    Micro-batches rather than single crops let a padded compiled model or
+    a crop-pooling scheduler run one forward pass per batch. The model is
+    waited for only once there is a face to score.
+
+    Returns:
+        List of (crop, score) pairs scored.
+    """
+    scored: list = []
+    while chunk := list(islice(crops, batch_size)):
+        detector = _wait_for_detector(loader, verbose and not scored)
+        scores = detector.predict(chunk)
+        scored.extend(zip(chunk, scores))
+        if any(test.update(score) is not None for score in scores):
+            break
+    return scored
+
+
+def _run_early_stopping(video, face_analyzer, loader, config, verbose: bool):
+    """
+    Score frames in small batches until the verdict is settled.
+
+    Frames are visited in interleaved rounds that each span the whole
+    video, so an early stop still rests on evidence from across the clip.
+    Crops are scored batch_size at a time and fed to the sequential test
+    in frame order; a decision mid-batch keeps the batch's other scores.
+
+    Args:
+        video: VideoAnalyzer with a loaded video.
+        face_analyzer: FaceAnalyzer to run.
+        loader: ModelLoader building the detector in the background.
+        config: Configuration object.
+        verbose: Enable verbose output.
+
+    Returns:
+        Tuple of (face crops, scores, frames decoded, early decision), crops
+        and scores ordered by frame index. The early decision is the
+        sequential test's verdict if it stopped sampling early, else None.
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepfake_detector.analyzers.sampling import interleave_rounds
+
+    indices = video.sample_indices(
+        num_frames=config.detection.num_frames,
+        sample_rate=config.detection.sample_rate,
+        sampling=config.detection.sampling.strategy,
+    )
+    test = SequentialTest(
+        threshold=config.detection.confidence_threshold,
+        error_rate=config.detection.sampling.early_stop_error_rate,
+        min_frames=config.detection.sampling.early_stop_min_frames,
+    )
+
+    if verbose:
+        _echo(f"Step 2/4: Scoring up to {len(indices)} frames sequentially...")
+
+    scored: list = []
+    scanned = 0
+    for round_indices in interleave_rounds(indices, EARLY_STOP_ROUNDS):
+        crops = face_analyzer.iter_faces_from_frames(
+            video.iter_frames(indices=round_indices)
+        )
+        # The model load is reported once, by the round that first waits
+        scored += _score_until_settled(
+            crops,
+            loader,
+            test,
+            config.detection.inference.batch_size,
+            verbose and not scored,
+        )
+        # Stop decoding the rest of the round
+        crops.close()
+        scanned += face_analyzer.frames_scanned
+        if test.decision is not None:
+            break
+
+    decision = test.decision if scanned < len(indices) else None
+
+    if verbose:
+        _echo(f"Step 3/4: Decoded {scanned}/{len(indices)} frames")
+        _echo(
+            f"Step 4/4: Scored {len(scored)} faces"
+            + (f", settled early on {decision}" if decision else "")
+        )
+
+    scored.sort(key=lambda pair: pair[0].frame_index)
+    return (
+        [crop for crop, _ in scored],
+        [score for _, score in scored],
+        scanned,
+        decision,
+    )
+
+
+def _wait_for_detector(loader, verbose: bool) -> "DeepFakeDetector":
+    """Join the background model load and report how much of it was hidden."""
+    detector = loader.result()
+    if verbose:
+        _echo(
+            f"  Model loaded in {loader.load_time:.2f}s on a background thread "
+            f"({loader.overlap:.2f}s overlapped, waited {loader.wait_time:.2f}s)"
+        )
+    return detector
+
+
+def _scan_video(video_path: str, config, loader, verbose: bool):
+    """
+    Decode the video, detect faces and, depending on the mode, score them.
+
+    Args:
+        video_path: Path to video file.
+        config: Configuration object.
+        loader: ModelLoader building the detector in the background.
+        verbose: Enable verbose output.
+
+    Returns:
+        Tuple of (face crops, scores or None if not yet scored, frames
+        decoded, early decision or None).
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepfake_detector.analyzers.face_analyzer import FaceAnalyzer
+    from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+    from deepfake_detector.pipeline import run_pipelined
+
+    # Step 1: Load and extract frames
+    if verbose:
+        _echo("Step 1/4: Loading video (model loading in background)...")
+
+    with VideoAnalyzer(
+        max_duration=config.video.max_duration,
+        decode_strategy=config.video.decode_strategy,
+        decode_workers=config.video.decode_workers,
+    ) as video:
+        video_info = video.load(video_path)
+
+        if verbose:
+            _echo(f"  Video: {video_info.width}x{video_info.height}")
+            _echo(f"  Duration: {video_info.duration:.1f}s")
+            _echo(f"  Frames: {video_info.frame_count}")
+
+        face_analyzer = FaceAnalyzer(
+            target_size=config.video.frame_size,
+            min_confidence=0.5,
+            detect_interval=config.analysis.face_tracking.detect_interval,
+            track_min_score=config.analysis.face_tracking.track_min_score,
+            roi_search=config.analysis.face_tracking.roi_search,
+            detection_scale=config.analysis.face_tracking.detection_scale,
+        )
+
+        if config.detection.sampling.coarse_to_fine:
+            face_crops, scores, scanned = _run_coarse_to_fine(
+                video, face_analyzer, loader, config, verbose
+            )
+            return face_crops, scores, scanned, None
+        if config.detection.sampling.early_stopping:
+            return _run_early_stopping(video, face_analyzer, loader, config, verbose)
+        if config.detection.sampling.pipelined:
+            return run_pipelined(
+                video, face_analyzer, loader, config, _echo if verbose else None
+            )
+
+        if verbose:
+            _echo("Step 2/4: Extracting frames...")
+            _echo("Step 3/4: Detecting faces...")
+
+        # Frames are decoded on demand and dropped once their face crop
+        # exists, so only one full-resolution frame is held at a time
+        frames = video.iter_frames(
+            num_frames=config.detection.num_frames,
+            sample_rate=config.detection.sample_rate,
+            sampling=config.detection.sampling.strategy,
+        )
+
+        start = time.perf_counter()
+        face_crops = _detect_face_crops(frames, face_analyzer, config, verbose)
+        if verbose:
+            _echo(f"  Decode and detection: {time.perf_counter() - start:.2f}s")
+        return face_crops, None, face_analyzer.frames_scanned, None
+
+
+def _score_crops(face_crops, loader, verbose: bool) -> list[float]:
+    """Wait for the detector and score the crops of a completed scan."""
+    # Step 3: Run deepfake detection
+    if verbose:
+        _echo("Step 4/4: Running detection model...")
+
+    detector = _wait_for_detector(loader, verbose)
+    start = time.perf_counter()
+    scores = detector.predict(face_crops)
+
+    if verbose:
+        _echo(f"  Analyzed {len(scores)} faces in {time.perf_counter() - start:.2f}s")
+    return scores
+
+
+def run_analysis_pipeline(video_path: str, config, verbose: bool, detector=None):
+    """
+    Run the complete analysis pipeline.
+
+    Unless a detector is given, the detection model loads on a background
+    thread from the start, so its load time overlaps with decoding and
+    face detection. It is only waited for once there are face crops to
+    score, and abandoned when the video has none.
+
+    Args:
+        video_path: Path to video file.
+        config: Configuration object.
+        verbose: Enable verbose output.
+        detector: Already loaded detector (anything with predict()) to use
+            instead of loading one, e.g. the resident model of a server.
+
+    Returns:
+        AggregatedResult with detection results.
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepfake_detector.models.detector import ResultAggregator
+    from deepfake_detector.models.loader import ModelLoader, load_detector
+
+    loader = ModelLoader(
+        (lambda: detector) if detector is not None else lambda: load_detector(config)
+    )
+    try:
+        face_crops, scores, frames_consumed, decision = _scan_video(
+            video_path, config, loader, verbose
+        )
+    except BaseException:
+        loader.cancel()
+        raise
+
+    aggregator = ResultAggregator(threshold=config.detection.confidence_threshold)
+    if not face_crops:
+        logger.warning("No faces detected in video")
+        loader.cancel()
+        if verbose:
+            _echo("  No faces found; model load cancelled")
+        result = aggregator.aggregate([], [], [])
+        result.frames_consumed = frames_consumed
+        return result
+
+    if scores is None:
+        scores = _score_crops(face_crops, loader, verbose)
+
+    # Step 4: Aggregate results, one face per crop
+    result = aggregator.aggregate(
+        scores,
+        [crop.frame_index for crop in face_crops],
+        [1] * len(face_crops),
+        decision=decision,
+    )
+    result.frames_consumed = frames_consumed
+    result.stopped_early = decision is not None
+
+    return result
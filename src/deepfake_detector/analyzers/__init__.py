@@ -1,15 +1,35 @@
 """Video analyzers package."""
 
-from deepfake_detector.analyzers.face_analyzer import (
-    BoundingBox,
-    FaceAnalyzer,
-    FaceCrop,
-)
-from deepfake_detector.analyzers.video_analyzer import (
-    Frame,
-    VideoAnalyzer,
-    VideoInfo,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from deepfake_detector.analyzers.face_analyzer import (
+        BoundingBox,
+        CropStore,
+        FaceAnalyzer,
+        FaceCrop,
+    )
+    from deepfake_detector.analyzers.prefetch import PrefetchIterator, PrefetchStats
+    from deepfake_detector.analyzers.video_analyzer import (
+        Frame,
+        VideoAnalyzer,
+        VideoInfo,
+    )
+
+# Public names and their modules, imported on first access because the
+# face and video analyzers load OpenCV and NumPy
+_EXPORTS = {
+    "VideoAnalyzer": "deepfake_detector.analyzers.video_analyzer",
+    "VideoInfo": "deepfake_detector.analyzers.video_analyzer",
+    "Frame": "deepfake_detector.analyzers.video_analyzer",
+    "FaceAnalyzer": "deepfake_detector.analyzers.face_analyzer",
+    "BoundingBox": "deepfake_detector.analyzers.face_analyzer",
+    "FaceCrop": "deepfake_detector.analyzers.face_analyzer",
+    "CropStore": "deepfake_detector.analyzers.face_analyzer",
+    "PrefetchIterator": "deepfake_detector.analyzers.prefetch",
+    "PrefetchStats": "deepfake_detector.analyzers.prefetch",
+}
 
 __all__ = [
     "VideoAnalyzer",
@@ -18,4 +38,21 @@ __all__ = [
     "FaceAnalyzer",
     "BoundingBox",
     "FaceCrop",
+    "CropStore",
+    "PrefetchIterator",
+    "PrefetchStats",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
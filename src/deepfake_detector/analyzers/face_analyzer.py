@@ -1,6 +1,7 @@
 """Face detection and analysis module."""
 
 import logging
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -10,6 +11,21 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Width (pixels) the face template is normalised to before tracking
+TEMPLATE_WIDTH = 48
+
+# Smallest face (pixels) searched for in a full-frame scan
+MIN_FACE_SIZE = 30
+
+# Window size of the bundled Haar cascade, the smallest detectable face
+CASCADE_WINDOW = 24
+
+# ROI search: margin added around the previous box on each side, as a
+# fraction of its size, and the face size range relative to the previous box
+ROI_MARGIN = 0.5
+ROI_MIN_SCALE = 0.7
+ROI_MAX_SCALE = 1.4
+
 
 @dataclass
 class BoundingBox:
@@ -31,13 +47,246 @@ class FaceCrop:
     image: np.ndarray
 
 
-class FaceAnalyzer:
+def _scale_box(box: BoundingBox, factor: float) -> BoundingBox:
+    """Return a copy of a box with coordinates multiplied by factor."""
+    return BoundingBox(
+        x=int(round(box.x * factor)),
+        y=int(round(box.y * factor)),
+        width=int(round(box.width * factor)),
+        height=int(round(box.height * factor)),
+        confidence=box.confidence,
+    )
+
+
+class CropStore:
+    """
+    Face crops packed into one preallocated uint8 array.
+
+    Crops are resized straight into rows of a (capacity, H, W, 3) buffer,
+    with frame indices and boxes kept in parallel arrays, so a batch of
+    crops is a contiguous slice that torch.from_numpy() can wrap without
+    copying. The buffer doubles in size when full. Indexing and iteration
+    return FaceCrop objects whose images are views into the buffer.
+    """
+
+    def __init__(self, capacity: int = 32, size: tuple[int, int] = (224, 224)) -> None:
+        """
+        Allocate the store.
+
+        Args:
+            capacity: Number of crops to preallocate.
+            size: Crop size as (width, height).
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"Crop store capacity must be at least 1, got: {capacity}")
+
+        self.size = size
+        width, height = size
+        self._images = np.empty((capacity, height, width, 3), dtype=np.uint8)
+        self._frame_indices = np.empty(capacity, dtype=np.int64)
+        self._boxes = np.empty((capacity, 4), dtype=np.int32)
+        self._confidences = np.empty(capacity, dtype=np.float32)
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of crops the buffer holds before it grows."""
+        return len(self._images)
+
+    @property
+    def images(self) -> np.ndarray:
+        """View of the stored crops, shape (N, H, W, 3)."""
+        return self._images[: self._count]
+
+    @property
+    def frame_indices(self) -> np.ndarray:
+        """View of the source frame index of each crop."""
+        return self._frame_indices[: self._count]
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """View of the face boxes as (x, y, width, height) rows."""
+        return self._boxes[: self._count]
+
+    def add(self, region: np.ndarray, frame_index: int, box: BoundingBox) -> None:
+        """
+        Resize a face region into the next free row.
+
+        Args:
+            region: RGB image region to resize.
+            frame_index: Index of the source frame.
+            box: Detected face box.
+        """
+        if self._count == self.capacity:
+            self._grow()
+
+        row = self._count
+        cv2.resize(
+            region, self.size, dst=self._images[row], interpolation=cv2.INTER_LINEAR
+        )
+        self._frame_indices[row] = frame_index
+        self._boxes[row] = (box.x, box.y, box.width, box.height)
+        self._confidences[row] = box.confidence
+        self._count += 1
+
+    def clear(self) -> None:
+        """Forget all crops, keeping the buffer for reuse."""
+        self._count = 0
+
+    def _grow(self) -> None:
+        """Double the capacity of every backing array."""
+        capacity = self.capacity * 2
+        logger.debug("Growing crop store to %d crops", capacity)
+        for name in ("_images", "_frame_indices", "_boxes", "_confidences"):
+            old = getattr(self, name)
+            new = np.empty((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+
+    def __len__(self) -> int:
+        """Return the number of stored crops."""
+        return self._count
+
+    def __getitem__(self, index: int) -> FaceCrop:
+        """Return a crop whose image is a view into the buffer."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Crop index out of range")
+
+        x, y, width, height = (int(v) for v in self._boxes[index])
+        return FaceCrop(
+            frame_index=int(self._frame_indices[index]),
+            box=BoundingBox(
+                x=x,
+                y=y,
+                width=width,
+                height=height,
+                confidence=float(self._confidences[index]),
+            ),
+            image=self._images[index],
+        )
+
+    def __iter__(self) -> Iterator[FaceCrop]:
+        """Iterate crops in insertion order."""
+        for index in range(self._count):
+            yield self[index]
+
+
+class FaceTracker:
+    """
+    Propagate a face box between frames by normalised template matching.
+
+    The template is taken from the last full detection and matched inside
+    a window around the previous box, at a reduced scale so each update
+    costs a small fraction of a Haar scan. The box keeps its size, so
+    scale changes are left to the next re-detection.
+    """
+
+    def __init__(self, search_scale: float = 2.0, min_score: float = 0.6) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            search_scale: Search window size relative to the face box.
+            min_score: Minimum match score (normalised correlation) for a
+                tracked box to be trusted.
+        """
+        self.search_scale = search_scale
+        self.min_score = min_score
+        self._template: Optional[np.ndarray] = None
+        self._box: Optional[BoundingBox] = None
+        self._scale = 1.0
+
+    def init(self, gray: np.ndarray, box: BoundingBox) -> None:
+        """
+        Start tracking a detected face.
+
+        Args:
+            gray: Grayscale frame the box was detected in.
+            box: Detected face box.
+        """
+        self._scale = min(1.0, TEMPLATE_WIDTH / max(box.width, 1))
+        patch = gray[box.y : box.y + box.height, box.x : box.x + box.width]
+        self._template = self._resize(patch)
+        self._box = box
+
+    def update(  # pylint: disable=too-many-locals
+        self, gray: np.ndarray
+    ) -> tuple[Optional[BoundingBox], float]:
+        """
+        Locate the tracked face in a new frame.
+
+        Args:
+            gray: Grayscale frame.
+
+        Returns:
+            Tuple of (box, match score). The box is None when the tracker
+            is not initialised or the match is below min_score.
+        """
+        if self._template is None or self._box is None:
+            return None, 0.0
+
+        box = self._box
+        height, width = gray.shape[:2]
+        margin_x = int(box.width * (self.search_scale - 1) / 2)
+        margin_y = int(box.height * (self.search_scale - 1) / 2)
+        x1 = max(0, box.x - margin_x)
+        y1 = max(0, box.y - margin_y)
+        x2 = min(width, box.x + box.width + margin_x)
+        y2 = min(height, box.y + box.height + margin_y)
+
+        window = self._resize(gray[y1:y2, x1:x2])
+        t_height, t_width = self._template.shape[:2]
+        if window.shape[0] < t_height or window.shape[1] < t_width:
+            return None, 0.0
+
+        result = cv2.matchTemplate(window, self._template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, location = cv2.minMaxLoc(result)
+        score = float(score)
+        if score < self.min_score:
+            return None, score
+
+        tracked = BoundingBox(
+            x=x1 + int(round(location[0] / self._scale)),
+            y=y1 + int(round(location[1] / self._scale)),
+            width=box.width,
+            height=box.height,
+            confidence=score,
+        )
+        self._box = tracked
+        return tracked, score
+
+    def reset(self) -> None:
+        """Forget the tracked face."""
+        self._template = None
+        self._box = None
+
+    def _resize(self, image: np.ndarray) -> np.ndarray:
+        """Scale an image region to template resolution."""
+        if self._scale >= 1.0:
+            return image
+        size = (
+            max(1, int(round(image.shape[1] * self._scale))),
+            max(1, int(round(image.shape[0] * self._scale))),
+        )
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+class FaceAnalyzer:  # pylint: disable=too-many-instance-attributes
     """Detects and extracts faces from video frames."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         target_size: tuple[int, int] = (224, 224),
         min_confidence: float = 0.5,
+        detect_interval: int = 1,
+        track_min_score: float = 0.6,
+        roi_search: bool = False,
+        detection_scale: float = 1.0,
     ) -> None:
         """
         Initialize the face analyzer.
@@ -45,10 +294,38 @@ class FaceAnalyzer:
         Args:
             target_size: Target size for cropped face images.
             min_confidence: Minimum confidence threshold for detection.
+            detect_interval: Run full detection on every Nth frame and
+                track the primary face in between. 1 detects every frame.
+            track_min_score: Tracking confidence below which the face is
+                re-detected before the interval is up.
+            roi_search: When selecting the primary face, search around its
+                previous box first and scan the full frame only on a miss.
+            detection_scale: Resolution factor applied to the grayscale
+                frame before detection. Boxes are mapped back to full
+                resolution, and crops are always taken from the full frame.
+
+        Raises:
+            ValueError: If detection_scale is not in (0, 1].
         """
+        if not 0.0 < detection_scale <= 1.0:
+            raise ValueError(
+                f"Detection scale must be in (0, 1], got: {detection_scale}"
+            )
+
         self.target_size = target_size
         self.min_confidence = min_confidence
+        self.detect_interval = max(1, detect_interval)
+        self.roi_search = roi_search
+        self.detection_scale = detection_scale
+        self._min_face_size = max(
+            CASCADE_WINDOW, int(round(MIN_FACE_SIZE * detection_scale))
+        )
         self._detector: Optional[cv2.CascadeClassifier] = None
+        self._tracker = FaceTracker(min_score=track_min_score)
+        self.frames_scanned = 0
+        self.frames_with_faces = 0
+        self.frames_tracked = 0
+        self.roi_hits = 0
         self._load_detector()
 
     def _load_detector(self) -> None:
@@ -66,28 +343,97 @@ class FaceAnalyzer:
 
         logger.debug("Loaded face detector from: %s", cascade_path)
 
-    def detect_faces(self, image: np.ndarray) -> list[BoundingBox]:
+    def detect_faces(
+        self,
+        image: np.ndarray,
+        near: Optional[BoundingBox] = None,
+    ) -> list[BoundingBox]:
         """
         Detect faces in an image.
 
         Args:
             image: RGB image as numpy array.
+            near: Face box from a neighbouring frame. When given, only a
+                window around it is searched, for faces of similar size,
+                and the full frame is scanned only if that finds nothing.
 
         Returns:
             List of BoundingBox objects for detected faces.
         """
-        if self._detector is None:
-            raise RuntimeError("Face detector not initialized")
-
         # Convert to grayscale for detection
         gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        return self._detect_gray(gray, near)
+
+    def _detect_gray(
+        self,
+        gray: np.ndarray,
+        near: Optional[BoundingBox] = None,
+    ) -> list[BoundingBox]:
+        """Detect faces in a grayscale image, trying the ROI first."""
+        scale = self.detection_scale
+        if scale < 1.0:
+            height, width = gray.shape[:2]
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+            if near is not None:
+                near = _scale_box(near, scale)
+
+        boxes = []
+        if near is not None:
+            boxes = self._detect_roi(gray, near)
+            if boxes:
+                self.roi_hits += 1
+        if not boxes:
+            min_size = (self._min_face_size, self._min_face_size)
+            boxes = self._run_cascade(gray, min_size)
+
+        if scale < 1.0:
+            boxes = [_scale_box(box, 1.0 / scale) for box in boxes]
+        return boxes
+
+    def _detect_roi(  # pylint: disable=too-many-locals
+        self, gray: np.ndarray, near: BoundingBox
+    ) -> list[BoundingBox]:
+        """Search an expanded window around a previous face box."""
+        height, width = gray.shape[:2]
+        margin_x = int(near.width * ROI_MARGIN)
+        margin_y = int(near.height * ROI_MARGIN)
+        x1 = max(0, near.x - margin_x)
+        y1 = max(0, near.y - margin_y)
+        x2 = min(width, near.x + near.width + margin_x)
+        y2 = min(height, near.y + near.height + margin_y)
+
+        side = min(near.width, near.height)
+        min_side = max(self._min_face_size, int(side * ROI_MIN_SCALE))
+        max_side = min(x2 - x1, y2 - y1, int(side * ROI_MAX_SCALE))
+        if max_side < min_side:
+            return []
+
+        boxes = self._run_cascade(
+            gray[y1:y2, x1:x2], (min_side, min_side), (max_side, max_side)
+        )
+        for box in boxes:
+            box.x += x1
+            box.y += y1
+        return boxes
+
+    def _run_cascade(
+        self,
+        gray: np.ndarray,
+        min_size: tuple[int, int],
+        max_size: Optional[tuple[int, int]] = None,
+    ) -> list[BoundingBox]:
+        """Run the Haar cascade with the given face size limits."""
+        if self._detector is None:
+            raise RuntimeError("Face detector not initialized")
 
         # Detect faces
         faces = self._detector.detectMultiScale(
             gray,
             scaleFactor=1.1,
             minNeighbors=5,
-            minSize=(30, 30),
+            minSize=min_size,
+            maxSize=max_size or (0, 0),
             flags=cv2.CASCADE_SCALE_IMAGE,
         )
 
@@ -105,7 +451,23 @@ class FaceAnalyzer:
 
         return boxes
 
-    def crop_faces(  # pylint: disable=too-many-locals
+    @staticmethod
+    def _padded_region(
+        image: np.ndarray, box: BoundingBox, padding: float
+    ) -> np.ndarray:
+        """Return the image region of a box grown by a padding ratio."""
+        height, width = image.shape[:2]
+        pad_w = int(box.width * padding)
+        pad_h = int(box.height * padding)
+
+        x1 = max(0, box.x - pad_w)
+        y1 = max(0, box.y - pad_h)
+        x2 = min(width, box.x + box.width + pad_w)
+        y2 = min(height, box.y + box.height + pad_h)
+
+        return image[y1:y2, x1:x2]
+
+    def crop_faces(
         self,
         image: np.ndarray,
         boxes: list[BoundingBox],
@@ -124,21 +486,11 @@ class FaceAnalyzer:
         Returns:
             List of FaceCrop objects with resized face images.
         """
-        height, width = image.shape[:2]
         crops = []
 
         for box in boxes:
-            # Add padding
-            pad_w = int(box.width * padding)
-            pad_h = int(box.height * padding)
-
-            x1 = max(0, box.x - pad_w)
-            y1 = max(0, box.y - pad_h)
-            x2 = min(width, box.x + box.width + pad_w)
-            y2 = min(height, box.y + box.height + pad_h)
-
             # Crop and resize
-            face_img = image[y1:y2, x1:x2]
+            face_img = self._padded_region(image, box, padding)
 
             if face_img.size > 0:
                 resized = cv2.resize(
@@ -154,27 +506,137 @@ class FaceAnalyzer:
 
     def extract_faces_from_frames(
         self,
-        frames: list,
+        frames: Iterable,
         select_primary: bool = True,
     ) -> list[FaceCrop]:
         """
         Extract face crops from a list of frames.
 
         Args:
-            frames: List of Frame objects.
+            frames: List or iterator of Frame objects.
             select_primary: If True, track and select the primary face.
 
         Returns:
             List of FaceCrop objects.
         """
-        all_crops = []
-        face_counts = []
+        return list(self.iter_faces_from_frames(frames, select_primary))
+
+    def extract_faces_to_store(
+        self,
+        frames: Iterable,
+        store: Optional[CropStore] = None,
+        select_primary: bool = True,
+        padding: float = 0.2,
+    ) -> CropStore:
+        """
+        Crop faces from a stream of frames into a CropStore.
+
+        Same detection as iter_faces_from_frames(), but each face is
+        resized directly into the store's buffer instead of a new array.
+
+        Args:
+            frames: Iterable of Frame objects.
+            store: Store to append to. A new one sized for target_size is
+                created when omitted.
+            select_primary: If True, track and select the primary face.
+            padding: Padding ratio to add around each face.
+
+        Returns:
+            The store holding the crops in frame order.
+
+        Raises:
+            ValueError: If the store's crop size differs from target_size.
+        """
+        if store is None:
+            store = CropStore(size=self.target_size)
+        elif tuple(store.size) != tuple(self.target_size):
+            raise ValueError(
+                f"Crop store size {store.size} does not match "
+                f"target size {self.target_size}"
+            )
+
+        for image, frame_index, boxes in self._iter_frame_boxes(frames, select_primary):
+            for box in boxes:
+                region = self._padded_region(image, box, padding)
+                if region.size > 0:
+                    store.add(region, frame_index, box)
+            del image
+
+        return store
+
+    def iter_faces_from_frames(
+        self,
+        frames: Iterable,
+        select_primary: bool = True,
+    ) -> Iterator[FaceCrop]:
+        """
+        Stream face crops from a stream of frames.
+
+        Each frame is released as soon as its crops exist, so feeding this
+        from VideoAnalyzer.iter_frames() keeps one full-resolution frame
+        in memory at a time. With select_primary and detect_interval > 1
+        the primary face is tracked between detection keyframes, and with
+        roi_search detection looks around the previous primary face first.
+        Counters are available in frames_scanned, frames_with_faces,
+        frames_tracked and roi_hits once the iterator is exhausted.
+
+        Args:
+            frames: Iterable of Frame objects.
+            select_primary: If True, track and select the primary face.
+
+        Yields:
+            FaceCrop objects in frame order.
+        """
+        for image, frame_index, boxes in self._iter_frame_boxes(frames, select_primary):
+            crops = self.crop_faces(image, boxes, frame_index) if boxes else []
+
+            # Crops are resized copies, so release the full frame before
+            # the next one is decoded
+            del image
+            yield from crops
+
+    def _iter_frame_boxes(
+        self,
+        frames: Iterable,
+        select_primary: bool,
+    ) -> Iterator[tuple[np.ndarray, int, list[BoundingBox]]]:
+        """
+        Yield (image, frame index, face boxes) for each frame.
+
+        The generator keeps no reference to a frame once it is yielded, so
+        the caller controls when it is freed.
+        """
+        self.frames_scanned = 0
+        self.frames_with_faces = 0
+        self.frames_tracked = 0
+        self.roi_hits = 0
+        total_faces = 0
+        tracking = select_primary and self.detect_interval > 1
+        since_detection = 0
+        previous: Optional[BoundingBox] = None
+        self._tracker.reset()
 
         for frame in frames:
-            boxes = self.detect_faces(frame.image)
-            face_counts.append(len(boxes))
+            self.frames_scanned += 1
+            boxes = []
+            gray = cv2.cvtColor(frame.image, cv2.COLOR_RGB2GRAY)
+
+            if tracking and 0 < since_detection < self.detect_interval:
+                box, _ = self._tracker.update(gray)
+                if box is not None:
+                    boxes = [box]
+                    self.frames_tracked += 1
+                    since_detection += 1
+            if not boxes:
+                # Keyframe, or the tracker lost the face
+                near = previous if self.roi_search else None
+                boxes = self._detect_gray(gray, near)
+                since_detection = 1 if boxes else 0
+
+            total_faces += len(boxes)
 
             if boxes:
+                self.frames_with_faces += 1
                 if select_primary:
                     # Select the largest face (likely the primary subject)
                     boxes = sorted(
@@ -183,28 +645,32 @@ class FaceAnalyzer:
                         reverse=True,
                     )
                     boxes = boxes[:1]  # Keep only the largest
+                    previous = boxes[0]
+                    if tracking and since_detection == 1:
+                        self._tracker.init(gray, boxes[0])
+            else:
+                previous = None
 
-                crops = self.crop_faces(frame.image, boxes, frame.index)
-                all_crops.extend(crops)
-
-        total_faces = sum(face_counts)
-        frames_with_faces = sum(1 for c in face_counts if c > 0)
+            item = (frame.image, frame.index, boxes)
+            del frame
+            yield item
+            del item
 
         logger.info(
-            "Detected %d faces across %d/%d frames",
+            "Detected %d faces across %d/%d frames (%d tracked, %d ROI hits)",
             total_faces,
-            frames_with_faces,
-            len(frames),
+            self.frames_with_faces,
+            self.frames_scanned,
+            self.frames_tracked,
+            self.roi_hits,
         )
 
-        if frames_with_faces == 0:
+        if self.frames_with_faces == 0:
             logger.warning("No faces detected in any frame")
 
-        return all_crops
-
     def get_primary_face_track(
         self,
-        frames: list,
+        frames: Iterable,
     ) -> list[FaceCrop]:
         """
         Track the primary face across all frames.
@@ -212,7 +678,7 @@ class FaceAnalyzer:
         Uses simple largest-face heuristic for tracking.
 
         Args:
-            frames: List of Frame objects.
+            frames: List or iterator of Frame objects.
 
         Returns:
             List of FaceCrop objects for the primary face.
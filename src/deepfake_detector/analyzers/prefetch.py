@@ -0,0 +1,170 @@
+"""Background prefetching for frame sources."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queue markers sent by the producer thread
+_END = object()
+_ERROR = object()
+
+# How often a blocked producer re-checks for cancellation (seconds)
+_PUT_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class PrefetchStats:
+    """Wait-time accounting for a prefetching source."""
+
+    items: int = 0
+    producer_busy: float = 0.0
+    producer_wait: float = 0.0
+    consumer_wait: float = 0.0
+
+    @property
+    def bottleneck(self) -> str:
+        """
+        Name the slower side of the pipeline.
+
+        A consumer that keeps waiting on an empty queue is starved by
+        decoding; a producer that keeps waiting on a full queue is throttled
+        by detection.
+        """
+        if self.consumer_wait >= self.producer_wait:
+            return "decode"
+        return "detect"
+
+
+class PrefetchIterator:
+    """
+    Iterate a source on a background thread through a bounded queue.
+
+    The producer thread pulls items from the source ahead of the consumer,
+    holding at most ``depth`` of them. OpenCV releases the GIL while
+    decoding, so this overlaps decode with face detection on the caller's
+    thread. Exceptions raised by the source are re-raised to the consumer.
+
+    Use as a context manager (or call close()) so the producer is stopped
+    before the underlying source, e.g. a VideoCapture, is released.
+    """
+
+    def __init__(self, source: Iterable, depth: int = 4) -> None:
+        """
+        Start prefetching from a source.
+
+        Args:
+            source: Iterable to consume on the background thread.
+            depth: Maximum number of items buffered ahead of the consumer.
+
+        Raises:
+            ValueError: If depth is less than 1.
+        """
+        if depth < 1:
+            raise ValueError(f"Prefetch depth must be at least 1, got: {depth}")
+
+        self.depth = depth
+        self.stats = PrefetchStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._produce,
+            args=(iter(source),),
+            name="frame-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        """Put an item on the queue, giving up if the consumer has stopped."""
+        start = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_PUT_POLL_INTERVAL)
+                self.stats.producer_wait += time.perf_counter() - start
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, source: Iterator) -> None:
+        """Producer thread body."""
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                try:
+                    item = next(source)
+                except StopIteration:
+                    break
+                self.stats.producer_busy += time.perf_counter() - start
+                if not self._put(item):
+                    return
+                # Do not keep the item alive once it is queued
+                del item
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._put((_ERROR, exc))
+            return
+        self._put(_END)
+
+    def __iter__(self) -> "PrefetchIterator":
+        """Return the iterator itself."""
+        return self
+
+    def __next__(self) -> Any:
+        """Return the next prefetched item."""
+        if self._finished:
+            raise StopIteration
+
+        start = time.perf_counter()
+        item = self._queue.get()
+        self.stats.consumer_wait += time.perf_counter() - start
+
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, tuple) and len(item) == 2 and item[0] is _ERROR:
+            self._finished = True
+            raise item[1]
+
+        self.stats.items += 1
+        return item
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the producer thread and drop buffered items.
+
+        Args:
+            timeout: Seconds to wait for the producer to exit.
+        """
+        self._stop.set()
+        self._finished = True
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout)
+
+        logger.debug(
+            "Prefetch: %d items, producer busy %.3fs / waited %.3fs, "
+            "consumer waited %.3fs (bottleneck: %s)",
+            self.stats.items,
+            self.stats.producer_busy,
+            self.stats.producer_wait,
+            self.stats.consumer_wait,
+            self.stats.bottleneck,
+        )
+
+    def __enter__(self) -> "PrefetchIterator":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,245 @@
+"""Frame index selection strategies."""
+
+import logging
+from collections.abc import Iterable, Sequence
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Frame sampling strategies accepted by VideoAnalyzer
+SAMPLING_STRATEGIES = ("uniform", "adaptive")
+
+# Width of the grayscale thumbnails used for the motion signal
+THUMBNAIL_WIDTH = 64
+
+# Candidate frames probed per requested frame in adaptive mode
+PROBES_PER_SAMPLE = 4
+
+# Mean absolute thumbnail difference (grey levels) between consecutive
+# probes that marks a shot boundary
+SCENE_CUT_THRESHOLD = 30.0
+
+# Mean absolute thumbnail difference below which a candidate is considered a
+# near-duplicate of the previously kept frame and skipped
+NEAR_DUPLICATE_THRESHOLD = 3.0
+
+# Share of the frame budget spread uniformly regardless of motion, so static
+# stretches are still covered
+MOTION_FLOOR = 0.25
+
+# Smallest share of the frame budget adaptive sampling may return
+MIN_BUDGET_FRACTION = 0.25
+
+# Coarse-to-fine score bands: first-pass scores outside this range are
+# conclusive, scores at or above the lower bound attract second-pass frames
+CLEAR_REAL_SCORE = 0.3
+CLEAR_FAKE_SCORE = 0.7
+
+
+def make_thumbnail(image: np.ndarray) -> np.ndarray:
+    """
+    Downscale an RGB frame to a small grayscale thumbnail.
+
+    Args:
+        image: RGB image as numpy array.
+
+    Returns:
+        Grayscale uint8 thumbnail THUMBNAIL_WIDTH pixels wide.
+    """
+    height, width = image.shape[:2]
+    size = (THUMBNAIL_WIDTH, max(1, round(height * THUMBNAIL_WIDTH / width)))
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+
+def frame_differences(thumbnails: np.ndarray) -> np.ndarray:
+    """
+    Compute the motion signal of a thumbnail sequence.
+
+    Args:
+        thumbnails: Array of shape (N, H, W) with grayscale thumbnails.
+
+    Returns:
+        Array of N mean absolute differences to the previous thumbnail
+        (0.0 for the first).
+    """
+    diffs = np.zeros(len(thumbnails), dtype=np.float64)
+    if len(thumbnails) > 1:
+        steps = np.abs(np.diff(thumbnails.astype(np.int16), axis=0))
+        diffs[1:] = steps.reshape(len(steps), -1).mean(axis=1)
+    return diffs
+
+
+def _cumulative_motion(diffs: np.ndarray) -> np.ndarray:
+    """Cumulative sampling weight of each probe, MOTION_FLOOR of it uniform."""
+    # Cut spikes are clipped so a single boundary does not absorb the budget
+    motion = np.minimum(diffs, SCENE_CUT_THRESHOLD)
+    motion_total = motion.sum()
+    if motion_total > 0:
+        weights = (1 - MOTION_FLOOR) * motion / motion_total
+        weights += MOTION_FLOOR / len(motion)
+    else:
+        weights = np.full(len(motion), 1.0 / len(motion))
+    return np.cumsum(weights)
+
+
+def _drop_near_duplicates(
+    candidates: Sequence[int], shot_starts: set[int], thumbnails: np.ndarray
+) -> list[int]:
+    """Skip candidates that look like the last kept frame, except shot starts."""
+    kept: list[int] = []
+    for position in candidates:
+        if kept and position not in shot_starts:
+            change = np.abs(
+                thumbnails[position].astype(np.int16)
+                - thumbnails[kept[-1]].astype(np.int16)
+            ).mean()
+            if change < NEAR_DUPLICATE_THRESHOLD:
+                continue
+        kept.append(position)
+    return kept
+
+
+def select_adaptive_indices(
+    probe_indices: np.ndarray,
+    thumbnails: np.ndarray,
+    num_frames: int,
+) -> np.ndarray:
+    """
+    Place a frame budget on shot boundaries and high-motion regions.
+
+    The first frame of every shot is always kept. The rest of the budget
+    follows the cumulative motion signal, with MOTION_FLOOR of it spread
+    uniformly, and candidates that are near-duplicates of the previously
+    kept frame are dropped. Static footage therefore returns fewer frames
+    than requested, down to MIN_BUDGET_FRACTION of the budget.
+
+    Args:
+        probe_indices: Sorted frame indices of the probed candidates.
+        thumbnails: Grayscale thumbnails for each probe, shape (N, H, W).
+        num_frames: Maximum number of frames to select.
+
+    Returns:
+        Sorted array of selected frame indices.
+    """
+    if len(probe_indices) <= num_frames:
+        return np.asarray(probe_indices)
+
+    diffs = frame_differences(thumbnails)
+
+    # Shot starts, strongest cuts first if there are more than the budget
+    cuts = np.flatnonzero(diffs > SCENE_CUT_THRESHOLD)
+    cuts = cuts[np.argsort(diffs[cuts])[::-1]][: max(0, num_frames - 1)]
+    shot_starts = set(cuts.tolist()) | {0}
+
+    # Spread the remaining budget along the cumulative motion
+    cumulative = _cumulative_motion(diffs)
+    remaining = num_frames - len(shot_starts)
+    quantiles = (np.arange(remaining) + 0.5) / max(remaining, 1)
+    picks = np.searchsorted(cumulative, quantiles * cumulative[-1])
+    candidates = sorted(shot_starts | set(np.clip(picks, 0, len(diffs) - 1).tolist()))
+
+    kept = _drop_near_duplicates(candidates, shot_starts, thumbnails)
+
+    min_frames = max(1, int(np.ceil(num_frames * MIN_BUDGET_FRACTION)))
+    if len(kept) < min_frames:
+        extra = np.linspace(0, len(candidates) - 1, min_frames, dtype=int)
+        kept = sorted(set(kept) | {candidates[i] for i in extra})
+
+    logger.debug(
+        "Adaptive sampling: %d shot boundaries, %d/%d frames kept",
+        len(shot_starts) - 1,
+        len(kept),
+        num_frames,
+    )
+
+    return np.asarray(probe_indices)[kept]
+
+
+def _window_indices(
+    centers: Sequence[int], per_window: int, half_window: float, max_frame: int
+) -> Iterable[int]:
+    """Yield evenly spaced frame indices in a window around each center."""
+    for center in centers:
+        low = max(0.0, center - half_window)
+        high = min(max_frame - 1.0, center + half_window)
+        yield from np.linspace(low, high, per_window + 2).round().astype(int).tolist()
+
+
+def refine_indices(
+    scored_indices: Sequence[int],
+    scores: Sequence[float],
+    max_frame: int,
+    budget: int,
+    exclude: Iterable[int] = (),
+) -> np.ndarray:
+    """
+    Choose second-pass frames around suspicious first-pass frames.
+
+    Nothing is added when every coarse score is clearly real (below
+    CLEAR_REAL_SCORE) or clearly fake (above CLEAR_FAKE_SCORE). Otherwise
+    the budget is split evenly over windows centred on the frames scoring
+    CLEAR_REAL_SCORE or more, highest scores first. Each window spans
+    the spacing between coarse samples.
+
+    Args:
+        scored_indices: Frame indices of the first-pass scores.
+        scores: Fake probabilities of the first-pass frames.
+        max_frame: Number of frames that may be sampled.
+        budget: Maximum number of frames to add.
+        exclude: Frame indices already decoded, never returned again.
+
+    Returns:
+        Sorted array of new frame indices (possibly empty).
+    """
+    indices = np.asarray(scored_indices, dtype=int)
+    values = np.asarray(scores, dtype=float)
+    empty = np.array([], dtype=int)
+
+    if budget <= 0 or len(values) == 0:
+        return empty
+    if np.all(values < CLEAR_REAL_SCORE) or np.all(values > CLEAR_FAKE_SCORE):
+        logger.debug("Coarse scores are conclusive; skipping refinement")
+        return empty
+
+    order = np.argsort(values)[::-1]
+    focus = [int(indices[i]) for i in order if values[i] >= CLEAR_REAL_SCORE]
+    focus = list(dict.fromkeys(focus))[:budget]
+    per_focus = max(1, budget // len(focus))
+    half_window = max(1.0, max_frame / len(np.unique(indices)) / 2)
+
+    seen = {int(i) for i in exclude} | set(indices.tolist())
+    selected: list[int] = []
+    for candidate in _window_indices(focus, per_focus, half_window, max_frame):
+        if candidate not in seen:
+            seen.add(candidate)
+            selected.append(candidate)
+
+    logger.debug(
+        "Refining around %d suspicious frames with %d extra frames",
+        len(focus),
+        min(len(selected), budget),
+    )
+
+    return np.array(sorted(selected[:budget]), dtype=int)
+
+
+def interleave_rounds(indices: Sequence[int], rounds: int) -> list[np.ndarray]:
+    """
+    Split sorted indices into interleaved rounds that each span the video.
+
+    Round k holds every rounds-th index starting at k, so consuming the
+    rounds in order visits the whole video coarsely before filling gaps.
+
+    Args:
+        indices: Sorted frame indices.
+        rounds: Number of rounds.
+
+    Returns:
+        List of sorted index arrays, empty rounds omitted.
+    """
+    values = np.asarray(indices, dtype=int)
+    rounds = max(1, min(rounds, len(values)))
+    return [values[k::rounds] for k in range(rounds) if len(values[k::rounds])]
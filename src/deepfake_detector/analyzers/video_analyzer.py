@@ -1,15 +1,46 @@
 """Video analysis and frame extraction module."""
 
 import logging
+import multiprocessing
+import queue
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import cv2
 import numpy as np
 
+from deepfake_detector.analyzers.sampling import (
+    PROBES_PER_SAMPLE,
+    SAMPLING_STRATEGIES,
+    make_thumbnail,
+    select_adaptive_indices,
+)
+
 logger = logging.getLogger(__name__)
 
+# Frame decoding strategies accepted by VideoAnalyzer
+DECODE_STRATEGIES = ("auto", "seek", "sequential")
+
+# Largest average gap (in frames) between sampled indices for which a single
+# linear grab() pass is cheaper than seeking. Every seek restarts decoding at
+# the previous keyframe, so below roughly one GOP (x264 default keyint is 250)
+# walking the stream wins.
+SEQUENTIAL_SCAN_MAX_GAP = 250
+
+# Smallest span of source frames worth handing to a decode worker process.
+# Spawning a worker and reopening the file costs far more than decoding a
+# few seconds of video, so short clips are always decoded in-process.
+PARALLEL_MIN_SEGMENT_FRAMES = 1000
+
+# Decoded frames each worker may queue ahead of the consumer, which bounds
+# the full-resolution frames in flight to decode_workers times this
+PARALLEL_READ_AHEAD = 8
+
+# How often a consumer waiting on a decode worker checks it is alive (seconds)
+_WORKER_POLL_INTERVAL = 1.0
+
 
 @dataclass
 class VideoInfo:
@@ -32,19 +63,265 @@ class Frame:
     image: np.ndarray
 
 
+def choose_decode_strategy(indices: np.ndarray, strategy: str = "auto") -> str:
+    """
+    Resolve the decode strategy for a set of frame indices.
+
+    Args:
+        indices: Sorted frame indices to decode.
+        strategy: Requested strategy ('auto', 'seek' or 'sequential').
+
+    Returns:
+        Either 'seek' or 'sequential'.
+    """
+    if strategy != "auto":
+        return strategy
+    if len(indices) < 2:
+        return "seek"
+
+    span = int(indices[-1]) - int(indices[0])
+    mean_gap = span / (len(indices) - 1)
+    if mean_gap <= SEQUENTIAL_SCAN_MAX_GAP:
+        return "sequential"
+    return "seek"
+
+
+def _make_frame(idx: int, image: np.ndarray, fps: float) -> Frame:
+    """Build a Frame from a decoded BGR image."""
+    # Convert BGR to RGB
+    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    timestamp = idx / fps if fps > 0 else 0.0
+    return Frame(index=idx, timestamp=timestamp, image=image_rgb)
+
+
+def _iter_seek(
+    capture: cv2.VideoCapture, indices: np.ndarray, fps: float
+) -> Iterator[Frame]:
+    """Decode frames by seeking to each index."""
+    # The BGR decode buffer is reused; each Frame gets its own RGB copy
+    image = None
+    for idx in indices:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, int(idx))
+        ret, image = capture.read(image)
+
+        if ret:
+            yield _make_frame(int(idx), image, fps)
+        else:
+            logger.warning("Failed to read frame at index %d", idx)
+
+
+def _iter_sequential(
+    capture: cv2.VideoCapture, indices: np.ndarray, fps: float
+) -> Iterator[Frame]:
+    """
+    Decode frames in one linear pass.
+
+    Every frame up to the last wanted index is grabbed, but only the
+    wanted ones are retrieved and color-converted.
+    """
+    if len(indices) == 0:
+        return
+
+    image = None
+    wanted = [int(idx) for idx in indices]
+    position = int(capture.get(cv2.CAP_PROP_POS_FRAMES))
+    start = wanted[0]
+    if start < position or start - position > SEQUENTIAL_SCAN_MAX_GAP:
+        capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+        position = start
+
+    for idx in wanted:
+        while position <= idx:
+            if not capture.grab():
+                logger.warning("Failed to read frame at index %d", idx)
+                return
+            position += 1
+
+        ret, image = capture.retrieve(image)
+        if ret:
+            yield _make_frame(idx, image, fps)
+        else:
+            logger.warning("Failed to read frame at index %d", idx)
+
+
+def _iter_chunk(
+    capture: cv2.VideoCapture, indices: list[int], strategy: str
+) -> Iterator[Frame]:
+    """Decode one chunk of indices with the strategy that suits it."""
+    chunk = np.asarray(indices)
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    if choose_decode_strategy(chunk, strategy) == "sequential":
+        return _iter_sequential(capture, chunk, fps)
+    return _iter_seek(capture, chunk, fps)
+
+
+def _run_decode_task(
+    task: tuple, captures: dict[str, cv2.VideoCapture], outputs: Any, generation: Any
+) -> None:
+    """Decode one chunk onto the output queue unless it was abandoned."""
+    task_generation, path, indices, strategy = task
+    if generation.value != task_generation:
+        return
+    if path not in captures:
+        # One video at a time; the previous one is closed
+        for capture in captures.values():
+            capture.release()
+        captures.clear()
+        captures[path] = cv2.VideoCapture(path)
+    if not captures[path].isOpened():
+        raise RuntimeError(f"Failed to open video in decode worker: {path}")
+
+    for frame in _iter_chunk(captures[path], indices, strategy):
+        if generation.value != task_generation:
+            return
+        outputs.put((task_generation, frame))
+
+
+def _decode_worker(tasks: Any, outputs: Any, generation: Any) -> None:
+    """
+    Decode index chunks from the task queue until it yields None.
+
+    Runs in a spawned worker process, so it must stay a picklable
+    module-level function. Frames go onto the bounded output queue one at
+    a time, so the worker stops when the consumer falls behind, and each
+    chunk ends with None (or an error message). A chunk is abandoned as
+    soon as its generation is no longer the current one.
+    """
+    captures: dict[str, cv2.VideoCapture] = {}
+    try:
+        while (task := tasks.get()) is not None:
+            try:
+                _run_decode_task(task, captures, outputs, generation)
+                outputs.put((task[0], None))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                outputs.put((task[0], str(exc)))
+    finally:
+        for capture in captures.values():
+            capture.release()
+
+
+class _DecodePool:
+    """
+    Decode worker processes that stream frames through bounded queues.
+
+    Each worker has its own task and output queue. Chunks are dealt to the
+    workers round-robin and read back in chunk order, so frames arrive in
+    index order while every worker decodes up to PARALLEL_READ_AHEAD frames
+    ahead of the consumer.
+    """
+
+    def __init__(self, num_workers: int) -> None:
+        # Spawned workers do not inherit the parent's threads or capture
+        context = multiprocessing.get_context("spawn")
+        self._generation = context.Value("i", 0)
+        self._tasks = [context.Queue() for _ in range(num_workers)]
+        self._outputs = [
+            context.Queue(maxsize=PARALLEL_READ_AHEAD) for _ in range(num_workers)
+        ]
+        self._processes = [
+            context.Process(
+                target=_decode_worker,
+                args=(self._tasks[i], self._outputs[i], self._generation),
+                name=f"decode-worker-{i}",
+                daemon=True,
+            )
+            for i in range(num_workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def _next_generation(self) -> int:
+        """Start a new generation, abandoning the chunks of the previous one."""
+        with self._generation.get_lock():
+            self._generation.value += 1
+            return self._generation.value
+
+    def _read(self, worker: int, generation: int) -> Optional[Frame]:
+        """Return the next frame of a worker's current chunk, None at its end."""
+        while True:
+            try:
+                item_generation, item = self._outputs[worker].get(
+                    timeout=_WORKER_POLL_INTERVAL
+                )
+            except queue.Empty as exc:
+                if not self._processes[worker].is_alive():
+                    raise RuntimeError("Decode worker process exited") from exc
+                continue
+            # Left over from an abandoned iteration
+            if item_generation != generation:
+                continue
+            if isinstance(item, str):
+                raise RuntimeError(item)
+            return item
+
+    def iter_frames(
+        self, path: str, chunks: list[list[int]], strategy: str
+    ) -> Iterator[Frame]:
+        """Decode index chunks across the workers, yielding frames in order."""
+        generation = self._next_generation()
+        for position, chunk in enumerate(chunks):
+            worker = position % len(self._processes)
+            self._tasks[worker].put((generation, path, chunk, strategy))
+
+        finished = False
+        try:
+            for position in range(len(chunks)):
+                worker = position % len(self._processes)
+                while (frame := self._read(worker, generation)) is not None:
+                    yield frame
+            finished = True
+        finally:
+            if not finished:
+                # Stop the workers decoding frames nobody will read
+                self._next_generation()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._next_generation()
+        for tasks in self._tasks:
+            tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=_WORKER_POLL_INTERVAL)
+            if process.is_alive():
+                # Blocked on a full output queue
+                process.terminate()
+                process.join()
+
+
 class VideoAnalyzer:
     """Handles video loading and frame extraction."""
 
-    def __init__(self, max_duration: int = 300) -> None:
+    def __init__(
+        self,
+        max_duration: int = 300,
+        decode_strategy: str = "auto",
+        decode_workers: int = 1,
+    ) -> None:
         """
         Initialize the video analyzer.
 
         Args:
             max_duration: Maximum video duration in seconds.
+            decode_strategy: Frame decoding strategy ('auto', 'seek' or
+                'sequential'). 'auto' picks based on sampling density.
+            decode_workers: Number of worker processes decoding contiguous
+                segments of the sampled range. 1 decodes in-process. The
+                workers start on first use and are reused until close().
+
+        Raises:
+            ValueError: If decode_strategy is unknown.
         """
+        if decode_strategy not in DECODE_STRATEGIES:
+            raise ValueError(
+                f"Unknown decode strategy: {decode_strategy}. "
+                f"Valid options: {', '.join(DECODE_STRATEGIES)}"
+            )
         self.max_duration = max_duration
+        self.decode_strategy = decode_strategy
+        self.decode_workers = max(1, decode_workers)
         self._capture: Optional[cv2.VideoCapture] = None
         self._video_info: Optional[VideoInfo] = None
+        self._pool: Optional[_DecodePool] = None
 
     def load(self, path: str) -> VideoInfo:
         """
@@ -112,89 +389,257 @@ class VideoAnalyzer:
         self,
         num_frames: int = 30,
         sample_rate: int = 10,
+        sampling: str = "uniform",
     ) -> list[Frame]:
         """
         Extract frames from the loaded video.
 
         Uses uniform temporal sampling to select frames evenly
-        distributed across the video duration.
+        distributed across the video duration. Dense samplings are decoded
+        in a single linear pass, sparse ones by seeking (see
+        choose_decode_strategy).
+
+        All frames are held in memory at once; prefer iter_frames() for
+        high-resolution input or sample_rate mode.
 
         Args:
             num_frames: Target number of frames to extract.
             sample_rate: Sampling rate (every Nth frame) used when
                 num_frames is 0 or None.
+            sampling: Frame selection strategy. 'uniform' spaces frames
+                evenly; 'adaptive' concentrates them on shot boundaries and
+                high-motion regions and may return fewer frames for static
+                footage.
 
         Returns:
             List of Frame objects.
 
         Raises:
-            ValueError: If no video is loaded.
+            ValueError: If no video is loaded or sampling is unknown.
+        """
+        return list(
+            self.iter_frames(
+                num_frames=num_frames, sample_rate=sample_rate, sampling=sampling
+            )
+        )
+
+    def iter_frames(
+        self,
+        num_frames: int = 30,
+        sample_rate: int = 10,
+        sampling: str = "uniform",
+        indices: Optional[Sequence[int]] = None,
+    ) -> Iterator[Frame]:
+        """
+        Lazily decode frames from the loaded video.
+
+        Same sampling as extract_frames(), but each frame is decoded only
+        when requested, so at most one full-resolution frame is alive as
+        long as the caller drops it before asking for the next. With decode
+        workers, each worker additionally holds up to PARALLEL_READ_AHEAD
+        decoded frames.
+
+        Args:
+            num_frames: Target number of frames to extract.
+            sample_rate: Sampling rate (every Nth frame) used when
+                num_frames is 0 or None.
+            sampling: Frame selection strategy ('uniform' or 'adaptive').
+            indices: Explicit frame indices to decode instead of sampling.
+                Indices beyond max_frame are dropped.
+
+        Returns:
+            Iterator of Frame objects in increasing index order.
+
+        Raises:
+            ValueError: If no video is loaded or sampling is unknown.
         """
         if self._capture is None or self._video_info is None:
             raise ValueError("No video loaded. Call load() first.")
+        if sampling not in SAMPLING_STRATEGIES:
+            raise ValueError(
+                f"Unknown sampling strategy: {sampling}. "
+                f"Valid options: {', '.join(SAMPLING_STRATEGIES)}"
+            )
+
+        if indices is None:
+            indices = self.sample_indices(num_frames, sample_rate, sampling)
+        else:
+            indices = np.unique(np.asarray(indices, dtype=int))
+            indices = indices[(indices >= 0) & (indices < self.max_frame)]
+            num_frames = len(indices)
+        strategy = choose_decode_strategy(indices, self.decode_strategy)
+        logger.debug("Decoding %d frames with %s strategy", len(indices), strategy)
+
+        num_segments = self._num_segments(indices)
+        if num_segments > 1:
+            frames = self._iter_parallel(indices, num_segments)
+        elif strategy == "sequential":
+            frames = _iter_sequential(self._capture, indices, self._video_info.fps)
+        else:
+            frames = _iter_seek(self._capture, indices, self._video_info.fps)
+
+        return self._count_frames(frames, num_frames)
+
+    @staticmethod
+    def _count_frames(frames: Iterator[Frame], requested: int) -> Iterator[Frame]:
+        """Pass frames through and log how many were extracted."""
+        extracted = 0
+        for frame in frames:
+            extracted += 1
+            yield frame
+            # Drop our reference before the next frame is decoded
+            del frame
+
+        logger.info(
+            "Extracted %d frames from video (requested: %d)",
+            extracted,
+            requested,
+        )
 
+    @property
+    def max_frame(self) -> int:
+        """Number of frames within the max_duration limit."""
+        if self._video_info is None:
+            return 0
         total_frames = self._video_info.frame_count
         fps = self._video_info.fps
 
-        # Calculate frame indices using max_duration limit
         if fps > 0:
-            max_frame = min(total_frames, int(self.max_duration * fps))
-        else:
-            max_frame = total_frames
+            return min(total_frames, int(self.max_duration * fps))
+        return total_frames
+
+    def _probe_motion(
+        self, max_frame: int, num_probes: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Decode evenly spaced probe frames as grayscale thumbnails.
+
+        Probes are read like any other sample: with one seek each when
+        they are sparse, or in a single grab() pass when they are dense
+        (see choose_decode_strategy). This costs up to PROBES_PER_SAMPLE
+        times the decode of the uniform sample it replaces, on top of
+        decoding the selected frames afterwards.
+
+        Returns:
+            Tuple of (probe frame indices, thumbnails of shape (N, H, W)).
+        """
+        stride = max(1, max_frame // max(1, num_probes))
+        wanted = np.arange(0, max_frame, stride)
+
+        probe_indices = []
+        thumbnails = []
+        for frame in _iter_chunk(self._capture, wanted.tolist(), self.decode_strategy):
+            probe_indices.append(frame.index)
+            thumbnails.append(make_thumbnail(frame.image))
+
+        return np.array(probe_indices, dtype=int), np.array(thumbnails)
+
+    def sample_indices(
+        self, num_frames: int = 30, sample_rate: int = 10, sampling: str = "uniform"
+    ) -> np.ndarray:
+        """
+        Compute the frame indices iter_frames() would decode.
+
+        Adaptive sampling decodes PROBES_PER_SAMPLE probe frames per
+        requested frame to do so.
+
+        Args:
+            num_frames: Target number of frames to extract.
+            sample_rate: Sampling rate (every Nth frame) used when
+                num_frames is 0 or None.
+            sampling: Frame selection strategy ('uniform' or 'adaptive').
+
+        Returns:
+            Sorted array of frame indices.
+
+        Raises:
+            ValueError: If no video is loaded.
+        """
+        if self._capture is None or self._video_info is None:
+            raise ValueError("No video loaded. Call load() first.")
+
+        # Calculate frame indices using max_duration limit
+        max_frame = self.max_frame
 
         # Determine sampling strategy
         if num_frames <= 0:
             # Use sample_rate when num_frames not specified
             indices = np.arange(0, max_frame, sample_rate)
-            actual_num_frames = len(indices)
             logger.info(
                 "Using sample_rate=%d, extracting %d frames",
                 sample_rate,
-                actual_num_frames,
+                len(indices),
             )
-        else:
-            # Adjust num_frames if video is too short
-            actual_num_frames = min(num_frames, max_frame)
-
-            if actual_num_frames < num_frames:
-                logger.warning(
-                    "Video has fewer frames (%d) than requested (%d). "
-                    "Extracting all available frames.",
-                    max_frame,
-                    num_frames,
+            return indices
+
+        # Adjust num_frames if video is too short
+        actual_num_frames = min(num_frames, max_frame)
+
+        if actual_num_frames < num_frames:
+            logger.warning(
+                "Video has fewer frames (%d) than requested (%d). "
+                "Extracting all available frames.",
+                max_frame,
+                num_frames,
+            )
+
+        if sampling == "adaptive" and actual_num_frames > 1:
+            probe_indices, thumbnails = self._probe_motion(
+                max_frame, actual_num_frames * PROBES_PER_SAMPLE
+            )
+            if len(probe_indices) > 0:
+                indices = select_adaptive_indices(
+                    probe_indices, thumbnails, actual_num_frames
+                )
+                logger.info(
+                    "Adaptive sampling selected %d of %d frames",
+                    len(indices),
+                    actual_num_frames,
                 )
+                return indices
 
-            # Calculate evenly spaced frame indices
-            if actual_num_frames > 1:
-                indices = np.linspace(0, max_frame - 1, actual_num_frames, dtype=int)
-            else:
-                indices = np.array([0])
-
-        frames = []
-        for idx in indices:
-            self._capture.set(cv2.CAP_PROP_POS_FRAMES, int(idx))
-            ret, image = self._capture.read()
-
-            if ret:
-                # Convert BGR to RGB
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-                timestamp = idx / fps if fps > 0 else 0.0
-                frame = Frame(index=int(idx), timestamp=timestamp, image=image_rgb)
-                frames.append(frame)
-            else:
-                logger.warning("Failed to read frame at index %d", idx)
+        # Calculate evenly spaced frame indices
+        if actual_num_frames > 1:
+            return np.linspace(0, max_frame - 1, actual_num_frames, dtype=int)
+        return np.array([0])
 
-        logger.info(
-            "Extracted %d frames from video (requested: %d)",
-            len(frames),
-            num_frames,
-        )
+    def _num_segments(self, indices: np.ndarray) -> int:
+        """Number of contiguous segments to deal out to decode workers."""
+        if self.decode_workers <= 1 or len(indices) < 2:
+            return 1
+        span = int(indices[-1]) - int(indices[0]) + 1
+        return min(len(indices), max(1, span // max(1, PARALLEL_MIN_SEGMENT_FRAMES)))
+
+    def _iter_parallel(self, indices: np.ndarray, num_segments: int) -> Iterator[Frame]:
+        """
+        Decode contiguous index segments in worker processes.
 
-        return frames
+        Segments are dealt to the workers in turn and yielded in index
+        order, giving the same frames as the serial path. A worker runs at
+        most PARALLEL_READ_AHEAD frames ahead, so sparse samplings (a
+        segment's frames fit the read-ahead) decode fully in parallel while
+        dense ones stay bounded in memory and overlap less.
+        """
+        segments = [
+            segment.tolist() for segment in np.array_split(indices, num_segments)
+        ]
+        if self._pool is None:
+            self._pool = _DecodePool(self.decode_workers)
+        logger.debug(
+            "Decoding %d frames in %d segments across %d worker processes",
+            len(indices),
+            len(segments),
+            self.decode_workers,
+        )
+        return self._pool.iter_frames(
+            self._video_info.path, segments, self.decode_strategy
+        )
 
     def close(self) -> None:
-        """Release video capture resources."""
+        """Release video capture resources and stop the decode workers."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         if self._capture is not None:
             self._capture.release()
             self._capture = None
@@ -0,0 +1,365 @@
+"""Batch analysis of many videos across worker processes."""
+
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from deepfake_detector.analysis import result_to_json, run_analysis_pipeline
+from deepfake_detector.utils.config import Config
+from deepfake_detector.utils.logging_config import setup_logging
+from deepfake_detector.utils.validators import (
+    SUPPORTED_FORMATS,
+    ValidationError,
+    validate_video_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# Inputs with these suffixes are read as manifests: one video path per line
+MANIFEST_SUFFIXES = (".txt", ".lst")
+
+# Characters that make an input a glob pattern rather than a path
+GLOB_CHARS = "*?["
+
+# How long a fused batch waits for crops from the other videos in flight
+# (seconds); small against the decode time of a video
+FUSION_MAX_DELAY = 0.1
+
+# Worker processes used when none are requested. Each worker holds its own
+# copy of the model and its decode buffers, so the default stays small
+# rather than following the CPU count; raise it with --workers when memory
+# allows.
+DEFAULT_MAX_WORKERS = 2
+
+# How often the parent checks that workers are alive while waiting (seconds)
+RESULT_POLL_INTERVAL = 1.0
+
+# State of a worker process, set once by _init_worker
+_WORKER: dict[str, Any] = {}
+
+
+def _read_manifest(path: Path) -> list[str]:
+    """Read video paths from a manifest, relative to its directory."""
+    videos = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            videos.append(str(path.parent / line))
+    return videos
+
+
+def collect_videos(inputs: Iterable[str]) -> list[str]:
+    """
+    Expand directories, glob patterns and manifests into video paths.
+
+    Directories are searched recursively for supported video formats.
+    Other inputs are taken as video paths; files that do not exist are
+    kept, so they are reported as failures rather than dropped silently.
+
+    Args:
+        inputs: Directories, glob patterns, manifest files or video paths.
+
+    Returns:
+        Video paths in input order, without duplicates.
+    """
+    videos: list[str] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            videos.extend(
+                str(file)
+                for file in sorted(path.rglob("*"))
+                if file.is_file() and file.suffix.lower() in SUPPORTED_FORMATS
+            )
+        elif any(char in item for char in GLOB_CHARS) and not path.exists():
+            videos.extend(sorted(glob.glob(item, recursive=True)))
+        elif path.is_file() and path.suffix.lower() in MANIFEST_SUFFIXES:
+            videos.extend(_read_manifest(path))
+        else:
+            videos.append(item)
+    return list(dict.fromkeys(videos))
+
+
+def _init_worker(config_data: dict[str, Any], threads: int, streams: int) -> None:
+    """Load the detector once per worker process."""
+    # pylint: disable=import-outside-toplevel
+    import torch
+
+    from deepfake_detector.models.loader import load_detector
+    from deepfake_detector.models.scheduler import InferenceScheduler
+
+    config = Config.from_dict(config_data)
+    setup_logging(level=config.logging.level, log_file=config.logging.log_file)
+    torch.set_num_threads(threads)
+    detector = load_detector(config)
+    if streams > 1:
+        # Pool the crops of the videos in flight into full batches
+        detector = InferenceScheduler(detector, max_delay=FUSION_MAX_DELAY)
+    _WORKER["config"] = config
+    _WORKER["detector"] = detector
+
+
+def _close_worker() -> None:
+    """Stop the crop fusion thread and drop the detector."""
+    detector = _WORKER.pop("detector", None)
+    if hasattr(detector, "close"):
+        detector.close()
+    _WORKER.clear()
+
+
+def _analyze_one(video_path: str) -> dict[str, Any]:
+    """Analyze one video in a worker and return its JSON record."""
+    start = time.perf_counter()
+    try:
+        path = str(validate_video_path(video_path))
+        result = run_analysis_pipeline(
+            path, _WORKER["config"], verbose=False, detector=_WORKER["detector"]
+        )
+        return result_to_json(result, video_path, time.perf_counter() - start)
+    except ValidationError as exc:
+        return _error_record(video_path, "validation", str(exc), start)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.exception("Analysis failed: %s", video_path)
+        return _error_record(video_path, "runtime", str(exc), start)
+
+
+def _error_record(
+    video_path: str, error_type: str, message: str, start: float
+) -> dict[str, Any]:
+    """Build the JSON record of a video that could not be analyzed."""
+    return {
+        "error": message,
+        "error_type": error_type,
+        "metadata": {
+            "video_path": video_path,
+            "processing_time_seconds": round(time.perf_counter() - start, 3),
+        },
+    }
+
+
+def _run_streams(tasks: Any, results: Any, streams: int) -> None:
+    """Analyze videos from the task queue on parallel threads until told to stop."""
+
+    def stream() -> None:
+        while (video_path := tasks.get()) is not None:
+            results.put(_analyze_one(video_path))
+
+    threads = [
+        threading.Thread(target=stream, name=f"batch-stream-{index}")
+        for index in range(streams)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _worker_main(
+    config_data: dict[str, Any], threads: int, streams: int, tasks: Any, results: Any
+) -> None:
+    """Entry point of a worker process."""
+    _init_worker(config_data, threads, streams)
+    try:
+        _run_streams(tasks, results, streams)
+    finally:
+        _close_worker()
+
+
+def _collect_results(
+    videos: list[str], results: Any, processes: list
+) -> Iterator[dict[str, Any]]:
+    """Yield worker records, failing the videos of workers that died."""
+    reported: set[str] = set()
+    while len(reported) < len(videos):
+        try:
+            record = results.get(timeout=RESULT_POLL_INTERVAL)
+        except queue.Empty:
+            if any(process.is_alive() for process in processes):
+                continue
+            # Every worker has exited, so the remaining videos were lost
+            # with a worker that crashed
+            start = time.perf_counter()
+            for video_path in videos:
+                if video_path not in reported:
+                    reported.add(video_path)
+                    yield _error_record(
+                        video_path, "runtime", "Worker process exited", start
+                    )
+            return
+        reported.add(record["metadata"]["video_path"])
+        yield record
+
+
+def _analyze_in_process(
+    videos: list[str], config_data: dict[str, Any], threads: int, streams: int
+) -> Iterator[dict[str, Any]]:
+    """Analyze videos on threads of this process, yielding their records."""
+    _init_worker(config_data, threads, streams)
+    tasks: queue.Queue = queue.Queue()
+    results: queue.Queue = queue.Queue()
+    for video_path in [*videos, *[None] * streams]:
+        tasks.put(video_path)
+    runner = threading.Thread(
+        target=_run_streams, args=(tasks, results, streams), daemon=True
+    )
+    runner.start()
+    try:
+        for _ in videos:
+            yield results.get()
+    finally:
+        # If the caller stopped early, let the streams finish their
+        # current videos and skip the rest
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in range(streams):
+            tasks.put(None)
+        runner.join()
+        _close_worker()
+
+
+def analyze_videos(
+    videos: list[str],
+    config: Config,
+    workers: Optional[int] = None,
+    streams: int = 1,
+) -> Iterator[dict[str, Any]]:
+    """
+    Analyze videos across worker processes, yielding records as they finish.
+
+    Each worker loads the detector once and analyzes ``streams`` videos at
+    a time on parallel threads, so decoding and face detection of one
+    video overlap with the others. With more than one stream, the face
+    crops of the videos in flight are pooled into shared inference
+    batches of detection.inference.batch_size crops by an
+    InferenceScheduler, and their scores are split back by video for
+    aggregation. This keeps batches full when each video yields only a few
+    crops.
+
+    Records arrive in completion order and every record carries its video
+    path. A failed video yields a record with "error" and "error_type"
+    instead of a verdict, and the run continues.
+
+    Args:
+        videos: Video paths to analyze, without duplicates.
+        config: Effective configuration.
+        workers: Number of worker processes, by default
+            DEFAULT_MAX_WORKERS or the CPU count if lower; 1 analyzes in
+            this process.
+        streams: Videos each worker analyzes concurrently.
+
+    Yields:
+        One JSON-serializable record per video, in the schema of
+        print_result_json.
+
+    Raises:
+        ValueError: If workers or streams is less than 1.
+    """
+    if workers is None:
+        workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    if workers < 1:
+        raise ValueError(f"Number of workers must be at least 1, got: {workers}")
+    if streams < 1:
+        raise ValueError(f"Number of streams must be at least 1, got: {streams}")
+
+    workers = min(workers, len(videos)) or 1
+    streams = min(streams, -(-len(videos) // workers)) or 1
+    # Split the cores between workers rather than oversubscribing them
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    config_data = config.to_dict()
+
+    if workers == 1:
+        yield from _analyze_in_process(videos, config_data, threads, streams)
+        return
+
+    # Spawned workers do not inherit the parent's threads or OpenCV and
+    # PyTorch state, which are not safe to fork
+    context = multiprocessing.get_context("spawn")
+    tasks = context.Queue()
+    results = context.Queue()
+    for video_path in [*videos, *[None] * (workers * streams)]:
+        tasks.put(video_path)
+
+    logger.info(
+        "Starting %d workers with %d threads and %d streams each",
+        workers,
+        threads,
+        streams,
+    )
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(config_data, threads, streams, tasks, results),
+            name=f"batch-worker-{index}",
+            daemon=True,
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        yield from _collect_results(videos, results, processes)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
+def write_records(records: Iterable[dict[str, Any]], output: TextIO) -> dict[str, int]:
+    """
+    Write records as JSON lines as they arrive.
+
+    Args:
+        records: Records from analyze_videos.
+        output: Text stream to write to; flushed after every record.
+
+    Returns:
+        Number of records per verdict ("FAKE", "NOT_FAKE") and of failed
+        videos ("error").
+    """
+    counts = {"FAKE": 0, "NOT_FAKE": 0, "error": 0}
+    for record in records:
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+        counts["error" if "error" in record else record["verdict"]] += 1
+    return counts
+
+
+def run_batch(
+    inputs: Iterable[str],
+    config: Config,
+    output: TextIO,
+    workers: Optional[int] = None,
+    streams: int = 1,
+) -> dict[str, int]:
+    """
+    Analyze the videos named by inputs and write one JSON line per video.
+
+    Args:
+        inputs: Directories, glob patterns, manifest files or video paths.
+        config: Effective configuration.
+        output: Text stream for the JSON lines.
+        workers: Number of worker processes, see analyze_videos.
+        streams: Videos each worker analyzes concurrently.
+
+    Returns:
+        Counts of verdicts and failures, see write_records.
+
+    Raises:
+        ValueError: If inputs name no videos.
+    """
+    videos = collect_videos(inputs)
+    if not videos:
+        raise ValueError("No videos found")
+    return write_records(analyze_videos(videos, config, workers, streams), output)
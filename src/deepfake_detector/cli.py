@@ -4,13 +4,12 @@ import json
 import logging
 import sys
 import time
+from pathlib import Path
 from typing import Optional
 
 import click
 
-from deepfake_detector.analyzers.face_analyzer import FaceAnalyzer
-from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
-from deepfake_detector.models.detector import DeepFakeDetector, ResultAggregator
+from deepfake_detector.analysis import result_to_json, run_analysis_pipeline
 from deepfake_detector.utils.config import load_config
 from deepfake_detector.utils.logging_config import setup_logging
 from deepfake_detector.utils.validators import (
@@ -86,6 +85,11 @@ def print_result_text(result, video_path: str, processing_time: float) -> None:
     click.secho("ANALYSIS SUMMARY:", bold=True)
     click.echo(f"  - Video analyzed: {video_path}")
     click.echo(f"  - Frames processed: {len(result.frame_results)}")
+    if result.stopped_early:
+        click.echo(
+            f"  - Stopped early: verdict settled after decoding "
+            f"{result.frames_consumed} frames"
+        )
     click.echo(f"  - Processing time: {processing_time:.2f} seconds")
     click.echo("  - Model: vit-deepfake (ViT-based HuggingFace detector)")
     click.echo("")
@@ -99,73 +103,79 @@ def print_result_text(result, video_path: str, processing_time: float) -> None:
     click.echo("")
 
 
-def _print_indicator_explanation(indicator, result) -> None:
-    """Print detailed explanation for each indicator."""
-    if indicator.name == "face_manipulation":
-        total_frames = len(result.frame_results)
-        fake_frames = sum(1 for f in result.frame_results if f.confidence > 0.5)
-        click.echo("")
-        click.echo("    EXPLANATION:")
-        click.echo(
-            f"    The ViT (Vision Transformer) model analyzed {total_frames} frames"
-        )
-        click.echo(f"    and detected manipulation artifacts in {fake_frames} frames.")
-        if indicator.score > 0.7:
-            click.echo("    High detection rate across frames indicates systematic")
-            click.echo("    face manipulation consistent with deepfake generation.")
-        elif indicator.score > 0.3:
-            click.echo("    Moderate detection suggests possible manipulation.")
-            click.echo("    Manual review of flagged frames is recommended.")
-        else:
-            click.echo("    Low detection rate suggests authentic facial content.")
+def _explain_face_manipulation(indicator, result) -> None:
+    """Explain the share of frames with manipulation artifacts."""
+    total_frames = len(result.frame_results)
+    fake_frames = sum(1 for f in result.frame_results if f.confidence > 0.5)
+    click.echo(f"    The ViT (Vision Transformer) model analyzed {total_frames} frames")
+    click.echo(f"    and detected manipulation artifacts in {fake_frames} frames.")
+    if indicator.score > 0.7:
+        click.echo("    High detection rate across frames indicates systematic")
+        click.echo("    face manipulation consistent with deepfake generation.")
+    elif indicator.score > 0.3:
+        click.echo("    Moderate detection suggests possible manipulation.")
+        click.echo("    Manual review of flagged frames is recommended.")
+    else:
+        click.echo("    Low detection rate suggests authentic facial content.")
 
-    elif indicator.name == "temporal_consistency":
-        click.echo("")
-        click.echo("    EXPLANATION:")
-        if indicator.detected:
-            click.echo("    Frame-to-frame predictions show HIGH VARIANCE, indicating")
-            click.echo("    inconsistent manipulation or detection uncertainty.")
-            click.echo("    This may suggest partial manipulation or edge cases.")
+
+def _explain_temporal_consistency(indicator, result) -> None:
+    """Explain the variance of scores across frames."""
+    if indicator.detected:
+        click.echo("    Frame-to-frame predictions show HIGH VARIANCE, indicating")
+        click.echo("    inconsistent manipulation or detection uncertainty.")
+        click.echo("    This may suggest partial manipulation or edge cases.")
+    else:
+        click.echo("    Frame-to-frame predictions are CONSISTENT, indicating")
+        click.echo("    the model has high agreement across the video.")
+        if any(f.confidence > 0.5 for f in result.frame_results):
+            click.echo("    Consistent high scores strongly suggest deepfake.")
         else:
-            click.echo("    Frame-to-frame predictions are CONSISTENT, indicating")
-            click.echo("    the model has high agreement across the video.")
-            if any(f.confidence > 0.5 for f in result.frame_results):
-                click.echo("    Consistent high scores strongly suggest deepfake.")
-            else:
-                click.echo("    Consistent low scores suggest authentic video.")
-
-    elif indicator.name == "overall_confidence":
+            click.echo("    Consistent low scores suggest authentic video.")
+
+
+def _explain_overall_confidence(indicator, result) -> None:
+    """Explain the combined score and how it sets the verdict."""
+    click.echo(f"    Combined score from all frames: {indicator.score:.1%}")
+    click.echo("    Formula: 70% mean score + 30% max score across frames.")
+    if result.stopped_early:
+        click.echo("    The verdict follows the sequential test instead.")
+    elif indicator.detected:
+        click.echo("    Score EXCEEDS threshold - classified as FAKE.")
+    else:
+        click.echo("    Score BELOW threshold - classified as NOT FAKE.")
+
+
+def _explain_sequential_test(_indicator, _result) -> None:
+    """Explain the early stopping decision."""
+    click.echo("    Frames scoring clearly above or below the threshold vote")
+    click.echo("    fake or real; sampling stopped once the votes settled the")
+    click.echo("    verdict within the configured error rate.")
+
+
+# Detailed explanation printed under each indicator of the text output
+_INDICATOR_EXPLANATIONS = {
+    "face_manipulation": _explain_face_manipulation,
+    "temporal_consistency": _explain_temporal_consistency,
+    "overall_confidence": _explain_overall_confidence,
+    "sequential_test": _explain_sequential_test,
+}
+
+
+def _print_indicator_explanation(indicator, result) -> None:
+    """Print detailed explanation for each indicator."""
+    explain = _INDICATOR_EXPLANATIONS.get(indicator.name)
+    if explain is not None:
         click.echo("")
         click.echo("    EXPLANATION:")
-        click.echo(f"    Combined score from all frames: {indicator.score:.1%}")
-        click.echo("    Formula: 70% mean score + 30% max score across frames.")
-        if indicator.detected:
-            click.echo("    Score EXCEEDS threshold - classified as FAKE.")
-        else:
-            click.echo("    Score BELOW threshold - classified as NOT FAKE.")
+        explain(indicator, result)
 
 
 def print_result_json(result, video_path: str, processing_time: float) -> None:
     """Print detection result in JSON format."""
-    output = {
-        "verdict": result.verdict,
-        "confidence": result.confidence,
-        "reasoning": [
-            {
-                "indicator": ind.name,
-                "detected": ind.detected,
-                "score": ind.score,
-                "description": ind.description,
-            }
-            for ind in result.indicators
-        ],
-        "metadata": {
-            "video_path": video_path,
-            "frames_analyzed": len(result.frame_results),
-            "processing_time_seconds": round(processing_time, 3),
-        },
-    }
-    click.echo(json.dumps(output, indent=2))
+    click.echo(
+        json.dumps(result_to_json(result, video_path, processing_time), indent=2)
+    )
 
 
 @click.group()
@@ -225,6 +235,13 @@ def main() -> None:
     default=None,
     help="Path to custom configuration file.",
 )
+@click.option(
+    "--server/--no-server",
+    "use_server",
+    default=None,
+    help="Forward to a running 'deepfake-detector serve' if there is one "
+    "(default: detection.server.enabled, off).",
+)
 def analyze(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     video_path: str,
     threshold: Optional[float],
@@ -234,6 +251,7 @@ def analyze(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     json_output: bool,
     verbose: bool,
     config_path: Optional[str],
+    use_server: Optional[bool],
 ) -> None:
     """
     Analyze a video for deepfake content.
@@ -280,7 +298,7 @@ def analyze(  # pylint: disable=too-many-arguments,too-many-positional-arguments
 
     try:
         # Run analysis pipeline
-        result = run_analysis_pipeline(video_path, config, verbose)
+        result = _analyze_video(video_path, config, verbose, use_server)
 
         processing_time = time.time() - start_time
 
@@ -304,84 +322,24 @@ def analyze(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         sys.exit(2)
 
 
-def run_analysis_pipeline(video_path: str, config, verbose: bool):
-    """
-    Run the complete analysis pipeline.
-
-    Args:
-        video_path: Path to video file.
-        config: Configuration object.
-        verbose: Enable verbose output.
-
-    Returns:
-        AggregatedResult with detection results.
-    """
-    # Step 1: Load and extract frames
-    if verbose:
-        click.echo("Step 1/4: Loading video...")
+def _analyze_video(
+    video_path: str, config, verbose: bool, use_server: Optional[bool] = None
+):
+    """Analyze on a running server if enabled and possible, in-process otherwise."""
+    # --server/--no-server, when given, overrides detection.server.enabled
+    if config.detection.server.enabled if use_server is None else use_server:
+        # pylint: disable-next=import-outside-toplevel
+        from deepfake_detector.server import forward_analysis
 
-    with VideoAnalyzer(max_duration=config.video.max_duration) as video:
-        video_info = video.load(video_path)
+        result = forward_analysis(video_path, config)
+        if result is not None:
+            if verbose:
+                click.echo(
+                    f"Analyzed by server on {config.detection.server.socket_path}"
+                )
+            return result
 
-        if verbose:
-            click.echo(f"  Video: {video_info.width}x{video_info.height}")
-            click.echo(f"  Duration: {video_info.duration:.1f}s")
-            click.echo(f"  Frames: {video_info.frame_count}")
-
-        if verbose:
-            click.echo("Step 2/4: Extracting frames...")
-
-        frames = video.extract_frames(
-            num_frames=config.detection.num_frames,
-            sample_rate=config.detection.sample_rate,
-        )
-
-        if verbose:
-            click.echo(f"  Extracted {len(frames)} frames")
-
-    # Step 2: Detect and extract faces
-    if verbose:
-        click.echo("Step 3/4: Detecting faces...")
-
-    face_analyzer = FaceAnalyzer(
-        target_size=config.video.frame_size,
-        min_confidence=0.5,
-    )
-
-    face_crops = face_analyzer.extract_faces_from_frames(frames)
-
-    if verbose:
-        click.echo(f"  Found {len(face_crops)} face crops")
-
-    if not face_crops:
-        logger.warning("No faces detected in video")
-        aggregator = ResultAggregator(threshold=config.detection.confidence_threshold)
-        return aggregator.aggregate([], [], [])
-
-    # Step 3: Run deepfake detection
-    if verbose:
-        click.echo("Step 4/4: Running detection model...")
-
-    detector = DeepFakeDetector(
-        model_name=config.detection.model,
-        device=config.device,
-        cache_dir=config.model_cache_dir,
-    )
-    detector.load_model()
-
-    scores = detector.predict(face_crops)
-
-    if verbose:
-        click.echo(f"  Analyzed {len(scores)} faces")
-
-    # Step 4: Aggregate results
-    frame_indices = [crop.frame_index for crop in face_crops]
-    faces_per_frame = [1] * len(face_crops)  # One face per crop
-
-    aggregator = ResultAggregator(threshold=config.detection.confidence_threshold)
-    result = aggregator.aggregate(scores, frame_indices, faces_per_frame)
-
-    return result
+    return run_analysis_pipeline(video_path, config, verbose)
 
 
 @main.command()
@@ -421,5 +379,212 @@ def config_cmd(validate: bool, show: bool, config_path: Optional[str]) -> None:
 main.add_command(config_cmd, name="config")
 
 
+@main.command()
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Check the pinned snapshot against its checksums instead of downloading.",
+)
+@click.option(
+    "-c",
+    "--config",
+    "config_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to configuration file.",
+)
+def snapshot(verify: bool, config_path: Optional[str]) -> None:
+    """Pin the detection model in the cache for offline loading."""
+    # pylint: disable=import-outside-toplevel
+    from deepfake_detector.models.detector import (
+        HUGGINGFACE_MODEL,
+        HUGGINGFACE_MODEL_REVISION,
+    )
+    from deepfake_detector.models.snapshot import download_snapshot, load_manifest
+
+    try:
+        cfg = load_config(config_path)
+        cache_dir = Path(cfg.model_cache_dir)
+
+        if verify:
+            manifest = load_manifest(cache_dir, HUGGINGFACE_MODEL)
+            if manifest is None:
+                raise RuntimeError(f"No snapshot of {HUGGINGFACE_MODEL} in {cache_dir}")
+            manifest.verify(checksums=True)
+            click.secho(
+                f"Snapshot {manifest.repo_id}@{manifest.revision} is intact "
+                f"({len(manifest.files)} files).",
+                fg="green",
+            )
+            return
+
+        manifest = download_snapshot(
+            HUGGINGFACE_MODEL, HUGGINGFACE_MODEL_REVISION, cache_dir
+        )
+        click.echo(f"Pinned {manifest.repo_id}@{manifest.revision}")
+        click.echo(f"  Directory: {manifest.directory}")
+        click.echo(f"  Files: {len(manifest.files)}")
+
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        click.secho(f"Snapshot error: {exc}", fg="red", err=True)
+        sys.exit(1)
+
+
+@main.command()
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "-j",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, each loading its own copy of the "
+    "model (default: 2, or 1 on a single CPU).",
+)
+@click.option(
+    "--streams",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Videos each worker analyzes at once, pooling their face crops "
+    "into shared inference batches.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="JSONL file to write results to (default: stdout).",
+)
+@click.option(
+    "-t",
+    "--threshold",
+    type=float,
+    default=None,
+    help="Confidence threshold for fake detection (0.0-1.0).",
+)
+@click.option(
+    "-n",
+    "--num-frames",
+    type=int,
+    default=None,
+    help="Number of frames to analyze per video.",
+)
+@click.option(
+    "-d",
+    "--device",
+    type=str,
+    default=None,
+    help="Compute device (cpu/cuda/cuda:N/auto).",
+)
+@click.option(
+    "-c",
+    "--config",
+    "config_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to configuration file.",
+)
+def batch(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    inputs: tuple[str, ...],
+    workers: Optional[int],
+    streams: int,
+    output,
+    threshold: Optional[float],
+    num_frames: Optional[int],
+    device: Optional[str],
+    config_path: Optional[str],
+) -> None:
+    """
+    Analyze many videos, writing one JSON line per video.
+
+    INPUTS: Video files, directories, glob patterns or manifest files
+    (.txt/.lst, one video path per line).
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from deepfake_detector.batch import run_batch
+
+    start_time = time.time()
+    config = load_config(config_path)
+    setup_logging(level=config.logging.level, log_file=config.logging.log_file)
+
+    if threshold is not None:
+        config.detection.confidence_threshold = threshold
+    if num_frames is not None:
+        config.detection.num_frames = num_frames
+    if device is not None:
+        config.device = device
+
+    try:
+        validate_threshold(config.detection.confidence_threshold)
+        validate_num_frames(config.detection.num_frames)
+        validate_device(config.device)
+    except ValidationError as exc:
+        click.secho(f"Error: {exc}", fg="red", err=True)
+        sys.exit(1)
+
+    try:
+        counts = run_batch(inputs, config, output, workers, streams)
+    except (ValueError, RuntimeError) as exc:
+        click.secho(f"Error: {exc}", fg="red", err=True)
+        sys.exit(1)
+
+    click.echo(
+        f"Analyzed {sum(counts.values())} videos in {time.time() - start_time:.1f}s: "
+        f"{counts['FAKE']} fake, {counts['NOT_FAKE']} not fake, "
+        f"{counts['error']} failed",
+        err=True,
+    )
+    sys.exit(1 if counts["error"] else 0)
+
+
+@main.command()
+@click.option(
+    "-s",
+    "--socket",
+    "socket_path",
+    type=str,
+    default=None,
+    help="Unix socket to listen on.",
+)
+@click.option(
+    "-d",
+    "--device",
+    type=str,
+    default=None,
+    help="Compute device (cpu/cuda/cuda:N/auto).",
+)
+@click.option(
+    "-c",
+    "--config",
+    "config_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to configuration file.",
+)
+def serve(
+    socket_path: Optional[str], device: Optional[str], config_path: Optional[str]
+) -> None:
+    """Keep the detection model loaded and analyze videos sent by 'analyze'."""
+    # pylint: disable-next=import-outside-toplevel
+    from deepfake_detector.server import create_server
+
+    config = load_config(config_path)
+    setup_logging(level=config.logging.level, log_file=config.logging.log_file)
+
+    if socket_path is not None:
+        config.detection.server.socket_path = socket_path
+    if device is not None:
+        config.device = device
+
+    try:
+        validate_device(config.device)
+        server = create_server(config)
+    except (ValidationError, RuntimeError, OSError) as exc:
+        click.secho(f"Server error: {exc}", fg="red", err=True)
+        sys.exit(1)
+
+    click.echo(f"Serving {config.detection.model} on {server.socket_path}")
+    server.serve_until_stopped()
+
+
 if __name__ == "__main__":
     main()
@@ -1,12 +1,27 @@
 """Detection models package."""
 
-from deepfake_detector.models.detector import (
-    AggregatedResult,
-    DeepFakeDetector,
-    DetectionIndicator,
-    FrameResult,
-    ResultAggregator,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from deepfake_detector.models.detector import DeepFakeDetector, ResultAggregator
+    from deepfake_detector.models.results import (
+        AggregatedResult,
+        DetectionIndicator,
+        FrameResult,
+    )
+    from deepfake_detector.models.sequential import SequentialTest
+
+# Public names and their modules, imported on first access because the
+# detector loads OpenCV, NumPy and Pillow (and PyTorch once a model loads)
+_EXPORTS = {
+    "DeepFakeDetector": "deepfake_detector.models.detector",
+    "ResultAggregator": "deepfake_detector.models.detector",
+    "FrameResult": "deepfake_detector.models.results",
+    "DetectionIndicator": "deepfake_detector.models.results",
+    "AggregatedResult": "deepfake_detector.models.results",
+    "SequentialTest": "deepfake_detector.models.sequential",
+}
 
 __all__ = [
     "DeepFakeDetector",
@@ -14,4 +29,19 @@ __all__ = [
     "FrameResult",
     "DetectionIndicator",
     "AggregatedResult",
+    "SequentialTest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
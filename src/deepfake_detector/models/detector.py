@@ -1,7 +1,9 @@
 """DeepFake detection model module."""
 
+import contextlib
 import logging
-from dataclasses import dataclass
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional
 
@@ -9,6 +11,23 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from deepfake_detector.analyzers.face_analyzer import CropStore
+from deepfake_detector.models.compiled import COMPILE_MODES, CompileStats, compile_model
+from deepfake_detector.models.onnx_backend import (
+    INT8_PARITY_TOLERANCE,
+    PARITY_TOLERANCE,
+    OnnxClassifier,
+    check_parity,
+    export_onnx,
+    quantize_onnx,
+)
+from deepfake_detector.models.results import (
+    AggregatedResult,
+    DetectionIndicator,
+    FrameResult,
+)
+from deepfake_detector.models.snapshot import SnapshotError, load_manifest
+
 logger = logging.getLogger(__name__)
 
 # HuggingFace model for deepfake detection (from research findings)
@@ -16,48 +35,35 @@ logger = logging.getLogger(__name__)
 HUGGINGFACE_MODEL = "prithivMLmods/Deep-Fake-Detector-v2-Model"
 HUGGINGFACE_MODEL_REVISION = "main"  # Pin to specific commit for production
 
+# Inference backends accepted by DeepFakeDetector
+INFERENCE_BACKENDS = ("torch", "onnx", "onnx-int8")
 
-@dataclass
-class FrameResult:
-    """Detection result for a single frame."""
-
-    frame_index: int
-    confidence: float
-    faces_detected: int
-
-
-@dataclass
-class DetectionIndicator:
-    """A specific indicator of deepfake detection."""
-
-    name: str
-    detected: bool
-    score: float
-    description: str
-
-
-@dataclass
-class AggregatedResult:
-    """Aggregated detection result for a video."""
+# Numeric precisions of the PyTorch forward pass; 'bf16' runs it under
+# bfloat16 autocast, which uses AMX/AVX-512-BF16 kernels on recent CPUs
+PRECISIONS = ("fp32", "bf16")
 
-    verdict: str  # "FAKE" or "NOT_FAKE"
-    confidence: float
-    indicators: list[DetectionIndicator]
-    frame_results: list[FrameResult]
+# ImageNet normalisation used by the torchvision models
+IMAGENET_MEAN = (0.485, 0.456, 0.406)
+IMAGENET_STD = (0.229, 0.224, 0.225)
 
 
-class DeepFakeDetector:
+class DeepFakeDetector:  # pylint: disable=too-many-instance-attributes
     """
     Main deepfake detection model.
 
     Uses image classification to detect manipulated faces.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         model_name: str = "vit-deepfake",
         device: str = "auto",
         cache_dir: str = "./models/cache",
+        batch_size: int = 8,
+        backend: str = "torch",
+        compile_mode: str = "none",
+        precision: str = "fp32",
+        offline: bool = False,
     ) -> None:
         """
         Initialize the deepfake detector.
@@ -66,15 +72,66 @@ class DeepFakeDetector:
             model_name: Name of the detection model ('vit-deepfake', 'efficientnet').
             device: Device to run inference on (cpu/cuda/auto).
             cache_dir: Directory to cache model weights.
+            batch_size: Number of face crops per forward pass.
+            backend: Inference backend ('torch', 'onnx' or 'onnx-int8').
+                The ONNX backends export the loaded model to cache_dir once
+                and run it with ONNX Runtime; 'onnx-int8' additionally
+                quantizes its linear layers to INT8.
+            compile_mode: PyTorch execution mode ('none', 'trace' or
+                'compile'). Compiled models are warmed up with dummy
+                batches of batch_size at load time; the cost is recorded in
+                compile_stats.
+            precision: PyTorch forward-pass precision ('fp32' or 'bf16').
+                'bf16' autocasts matrix multiplications and convolutions
+                to bfloat16 and returns float32 scores; the ONNX backends
+                always run in their own precision.
+            offline: Never contact the model hub. The HuggingFace model is
+                then loaded only from a snapshot pinned in cache_dir (see
+                models.snapshot), which is also used whenever one exists.
+
+        Raises:
+            ValueError: If batch_size is less than 1, or the backend,
+                compile mode or precision is unknown.
         """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got: {batch_size}")
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(
+                f"Unknown inference backend: {backend}. "
+                f"Expected one of: {', '.join(INFERENCE_BACKENDS)}"
+            )
+        if compile_mode not in COMPILE_MODES:
+            raise ValueError(
+                f"Unknown compile mode: {compile_mode}. "
+                f"Expected one of: {', '.join(COMPILE_MODES)}"
+            )
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision: {precision}. "
+                f"Expected one of: {', '.join(PRECISIONS)}"
+            )
+
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.backend = backend
+        self.compile_mode = compile_mode
+        self.precision = precision
+        self.offline = offline
+        self.compile_stats: Optional[CompileStats] = None
         self.device = self._resolve_device(device)
         self.cache_dir = Path(cache_dir)
         self._model: Any = None
         self._processor: Any = None
         self._model_loaded = False
         self._transform: Any = None
+        self._onnx: Optional[OnnxClassifier] = None
+        self._compiled: Any = None
+        self._input_size: Optional[tuple[int, int]] = None
+        self._pixel_shift: Any = None
+        self._pixel_factor: Any = None
         self._use_huggingface = model_name == "vit-deepfake"
+        self._weights_id: Optional[str] = None
+        self._fake_index: Optional[int] = None
 
     def _resolve_device(self, device: str) -> str:
         """Resolve 'auto' device to actual device."""
@@ -91,7 +148,14 @@ class DeepFakeDetector:
         """
         Load the detection model.
 
-        Downloads model weights if not cached.
+        Downloads model weights if not cached. If the model cannot be
+        loaded, predictions fall back to statistical analysis, except when
+        a pinned snapshot is missing offline or damaged: the fallback would
+        pass for the pinned model's verdicts, so the error is raised.
+
+        Raises:
+            SnapshotError: If offline without a snapshot, or the snapshot
+                fails verification.
         """
         logger.info("Loading deepfake detection model: %s", self.model_name)
 
@@ -100,8 +164,21 @@ class DeepFakeDetector:
                 self._load_huggingface_model()
             else:
                 self._load_pytorch_model()
+            if self.backend != "torch":
+                self._load_onnx_backend()
+                if self._onnx is not None and self.precision != "fp32":
+                    logger.info(
+                        "Precision %s applies to PyTorch only; ignored by %s",
+                        self.precision,
+                        self.backend,
+                    )
+            if self.compile_mode != "none" and self._onnx is None:
+                self._compile_model()
             self._model_loaded = True
             logger.info("Model loaded successfully on device: %s", self.device)
+        except SnapshotError:
+            self._model_loaded = False
+            raise
         except ImportError as exc:
             logger.warning(
                 "Required library not available: %s. Using statistical analysis fallback.",
@@ -116,28 +193,65 @@ class DeepFakeDetector:
             self._model_loaded = False
 
     def _load_huggingface_model(self) -> None:
-        """Load pretrained ViT model from HuggingFace for deepfake detection."""
+        """
+        Load pretrained ViT model from HuggingFace for deepfake detection.
+
+        With a snapshot manifest in cache_dir the model loads from the
+        pinned local files without contacting the hub, and only safetensors
+        weights are accepted. With transformers 5.x these stay
+        memory-mapped, so a cold start is mostly page-cache reads and
+        processes on one host share the weight pages; transformers 4.x
+        copies them into each process's private memory.
+
+        Raises:
+            SnapshotError: If offline and no snapshot exists, or the
+                snapshot is damaged.
+        """
         # pylint: disable=import-outside-toplevel
         from transformers import AutoImageProcessor, AutoModelForImageClassification
 
-        logger.info("Loading HuggingFace model: %s", HUGGINGFACE_MODEL)
-
-        self._processor = AutoImageProcessor.from_pretrained(
-            HUGGINGFACE_MODEL,
-            revision=HUGGINGFACE_MODEL_REVISION,  # nosec B615
-            cache_dir=self.cache_dir,
-        )
-        self._model = AutoModelForImageClassification.from_pretrained(
-            HUGGINGFACE_MODEL,
-            revision=HUGGINGFACE_MODEL_REVISION,  # nosec B615
-            cache_dir=self.cache_dir,
-        )
+        manifest = load_manifest(self.cache_dir, HUGGINGFACE_MODEL)
+        if manifest is not None:
+            manifest.verify()
+            logger.info(
+                "Loading HuggingFace model %s@%s from snapshot: %s",
+                manifest.repo_id,
+                manifest.revision,
+                manifest.directory,
+            )
+            self._processor = AutoImageProcessor.from_pretrained(
+                manifest.directory, local_files_only=True
+            )
+            self._model = AutoModelForImageClassification.from_pretrained(
+                manifest.directory, local_files_only=True, use_safetensors=True
+            )
+            self._weights_id = manifest.revision
+        elif self.offline:
+            raise SnapshotError(
+                f"No snapshot of {HUGGINGFACE_MODEL} in {self.cache_dir}; "
+                "run 'deepfake-detector snapshot' while online first"
+            )
+        else:
+            logger.info("Loading HuggingFace model: %s", HUGGINGFACE_MODEL)
+            self._processor = AutoImageProcessor.from_pretrained(
+                HUGGINGFACE_MODEL,
+                revision=HUGGINGFACE_MODEL_REVISION,  # nosec B615
+                cache_dir=self.cache_dir,
+            )
+            self._model = AutoModelForImageClassification.from_pretrained(
+                HUGGINGFACE_MODEL,
+                revision=HUGGINGFACE_MODEL_REVISION,  # nosec B615
+                cache_dir=self.cache_dir,
+            )
+            # Commit of the hub cache snapshot the weights were read from
+            self._weights_id = getattr(self._model.config, "_commit_hash", None)
 
         # Move to device if CUDA available
         if self.device.startswith("cuda"):
             self._model = self._model.to(self.device)
 
         self._model.eval()
+        self._configure_fast_preprocessing()
         logger.info(
             "HuggingFace ViT model loaded: %d parameters",
             sum(p.numel() for p in self._model.parameters()),
@@ -172,19 +286,249 @@ class DeepFakeDetector:
                 transforms.ToPILImage(),
                 transforms.Resize((224, 224)),
                 transforms.ToTensor(),
-                transforms.Normalize(
-                    mean=[0.485, 0.456, 0.406],
-                    std=[0.229, 0.224, 0.225],
-                ),
+                transforms.Normalize(mean=IMAGENET_MEAN, std=IMAGENET_STD),
             ]
         )
+        self._set_normalization((224, 224), IMAGENET_MEAN, IMAGENET_STD, 1 / 255)
+
+    def _load_onnx_backend(self) -> None:
+        """
+        Switch inference to ONNX Runtime, exporting the model if needed.
+
+        Graphs of HuggingFace models are cached in cache_dir/onnx, keyed
+        on the commit of the weight files, with the INT8 graph next to the
+        FP32 one. Models without a weights id, such as the randomly
+        initialised torchvision models, would never match a cached graph
+        again, so they are exported to a temporary directory that is
+        removed once the session has loaded. A newly written graph is
+        checked against PyTorch before use, on logits for FP32 and on
+        class probabilities for INT8, and is deleted if it fails. Once a
+        session runs, the PyTorch model is released. Any failure leaves
+        the PyTorch model in charge.
+        """
+        # Export and the parity check run on the CPU copy of the model
+        on_cuda = self.device.startswith("cuda")
+        if on_cuda:
+            self._model = self._model.cpu()
+
+        with self._onnx_graph_path() as path:
+            # The session holds the graph in memory once it has loaded
+            self._onnx = self._open_onnx_session(path)
+
+        if self._onnx is not None:
+            # Only the label mapping is still needed from the PyTorch model
+            if self._use_huggingface:
+                self._fake_index = self._fake_label_index()
+            self._model = None
+        elif on_cuda:
+            self._model = self._model.to(self.device)
+
+    @contextlib.contextmanager
+    def _onnx_graph_path(self) -> Iterator[Path]:
+        """Yield the FP32 graph path, in the cache only for identified weights."""
+        if self._weights_id is not None:
+            directory = self.cache_dir / "onnx"
+            yield directory / f"{self.model_name}-{self._weights_id[:16]}.onnx"
+            return
+        with tempfile.TemporaryDirectory(prefix="deepfake-onnx-") as directory:
+            yield Path(directory) / f"{self.model_name}.onnx"
+
+    def _open_onnx_session(self, path: Path) -> Optional[OnnxClassifier]:
+        """
+        Open an ONNX Runtime session, exporting and checking a new graph.
+
+        Args:
+            path: Location of the FP32 graph; the INT8 graph goes next to it.
 
-    def predict(self, face_crops: list) -> list[float]:
+        Returns:
+            OnnxClassifier, or None if the graph cannot be exported, fails
+            the parity check or ONNX Runtime is not installed.
+        """
+        input_size = self._input_size or (224, 224)
+        quantized = self.backend == "onnx-int8"
+        int8_path = path.with_suffix(".int8.onnx")
+        session_path = int8_path if quantized else path
+
+        try:
+            exported = not session_path.exists()
+            if exported:
+                if not path.exists():
+                    export_onnx(self._model, path, input_size, self._use_huggingface)
+                if quantized:
+                    quantize_onnx(path, int8_path)
+            classifier = OnnxClassifier(session_path, self.device)
+            if exported:
+                check_parity(
+                    self._model,
+                    classifier,
+                    input_size,
+                    self._use_huggingface,
+                    tolerance=INT8_PARITY_TOLERANCE if quantized else PARITY_TOLERANCE,
+                    probabilities=quantized,
+                )
+            logger.info("Using ONNX Runtime backend: %s", session_path)
+            return classifier
+        except ImportError as exc:
+            logger.warning("ONNX Runtime not available: %s. Using PyTorch.", exc)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("ONNX backend unavailable: %s. Using PyTorch.", exc)
+            session_path.unlink(missing_ok=True)
+        return None
+
+    def _compile_model(self) -> None:
+        """Compile the PyTorch model and warm it up, falling back to eager."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        example = torch.zeros(self.batch_size, 3, *(self._input_size or (224, 224)))
+        if self.device.startswith("cuda"):
+            example = example.to(self.device)
+
+        try:
+            # Compile under the inference precision so traced graphs record
+            # the bfloat16 casts and compiled ones warm up with them
+            with self._autocast():
+                self._compiled, self.compile_stats = compile_model(
+                    self._model, self.compile_mode, example, self._use_huggingface
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Model compilation (%s) failed: %s. Using eager mode.",
+                self.compile_mode,
+                exc,
+            )
+            self._compiled = None
+
+    def _autocast(self) -> Any:
+        """Return the autocast context for the configured precision."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        # Each weight is cast once per forward pass anyway; the cast cache
+        # would also stop traced graphs from freezing the casts as constants
+        return torch.autocast(
+            device_type=self.device.split(":")[0],
+            dtype=torch.bfloat16,
+            enabled=self.precision == "bf16",
+            cache_enabled=False,
+        )
+
+    def _forward(self, pixel_values: Any) -> Any:
+        """Compute float32 logits for a preprocessed batch on the active backend."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        if self._onnx is not None:
+            return torch.from_numpy(self._onnx(pixel_values.numpy()))
+
+        with self._autocast():
+            logits = self._torch_forward(pixel_values)
+        # Softmax and score extraction stay in float32
+        return logits.float()
+
+    def _torch_forward(self, pixel_values: Any) -> Any:
+        """Compute logits with the compiled or eager PyTorch model."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        if self._compiled is not None:
+            # Pad a short final batch to the warmed-up shape so compiled
+            # graphs are not re-specialised mid-run
+            count = len(pixel_values)
+            if count < self.batch_size:
+                padding = pixel_values.new_zeros(
+                    (self.batch_size - count, *pixel_values.shape[1:])
+                )
+                pixel_values = torch.cat([pixel_values, padding])
+            if self.device.startswith("cuda"):
+                pixel_values = pixel_values.to(self.device)
+            return self._compiled(pixel_values)[:count]
+
+        if self.device.startswith("cuda"):
+            pixel_values = pixel_values.to(self.device)
+        if self._use_huggingface:
+            return self._model(pixel_values=pixel_values).logits
+        return self._model(pixel_values)
+
+    def _configure_fast_preprocessing(self) -> None:
+        """
+        Read the HF processor's input size and normalisation once.
+
+        Only fixed-size resize, rescale and normalise pipelines are
+        reproduced; other processors keep using the processor itself.
+        """
+        processor = self._processor
+        self._input_size = None
+        size = getattr(processor, "size", None) or {}
+        try:
+            height, width = int(size["height"]), int(size["width"])
+        except (KeyError, TypeError, ValueError):
+            logger.debug("Processor size %s is not fixed; no fast path", size)
+            return
+
+        rescale = 1.0
+        if getattr(processor, "do_rescale", False):
+            rescale = float(processor.rescale_factor)
+        mean, std = (0.0, 0.0, 0.0), (1.0, 1.0, 1.0)
+        if getattr(processor, "do_normalize", False):
+            mean, std = processor.image_mean, processor.image_std
+
+        self._set_normalization((height, width), mean, std, rescale)
+
+    def _set_normalization(
+        self,
+        size: tuple[int, int],
+        mean: Any,
+        std: Any,
+        rescale: float,
+    ) -> None:
+        """Precompute the affine map from uint8 pixels to model inputs."""
+        import torch  # pylint: disable=import-outside-toplevel
+
+        mean_t = torch.tensor(mean, dtype=torch.float32).view(1, 3, 1, 1)
+        std_t = torch.tensor(std, dtype=torch.float32).view(1, 3, 1, 1)
+        # (x * rescale - mean) / std == (x - mean / rescale) * (rescale / std)
+        self._pixel_shift = mean_t / rescale
+        self._pixel_factor = rescale / std_t
+        self._input_size = size
+
+    def _preprocess_batch(self, images: Any) -> Any:
+        """
+        Convert crops to a normalised NCHW float tensor in one operation.
+
+        Args:
+            images: Either a contiguous (N, H, W, 3) uint8 array, wrapped
+                without copying, or a list of crop images to stack.
+
+        Returns:
+            Tensor of shape (N, 3, H, W), or None when the fast path does
+            not apply (unknown normalisation, or crops that would need
+            resizing or are not uint8 RGB arrays).
+        """
+        import torch  # pylint: disable=import-outside-toplevel
+
+        if self._input_size is None:
+            return None
+        expected = (*self._input_size, 3)
+
+        if isinstance(images, np.ndarray):
+            if images.dtype != np.uint8 or images.shape[1:] != expected:
+                return None
+            pixels = images
+        else:
+            for image in images:
+                if not isinstance(image, np.ndarray):
+                    return None
+                if image.dtype != np.uint8 or image.shape != expected:
+                    return None
+            pixels = np.stack(images)
+
+        tensor = torch.from_numpy(pixels).permute(0, 3, 1, 2).float()
+        return tensor.sub_(self._pixel_shift).mul_(self._pixel_factor)
+
+    def predict(self, face_crops: Any) -> list[float]:
         """
         Run prediction on face crops.
 
         Args:
-            face_crops: List of FaceCrop objects.
+            face_crops: List of FaceCrop objects, or a CropStore whose
+                buffer is batched without copying.
 
         Returns:
             List of confidence scores (0.0 = real, 1.0 = fake).
@@ -198,70 +542,84 @@ class DeepFakeDetector:
             return self._predict_with_model(face_crops)
         return self._predict_with_fallback(face_crops)
 
-    def _predict_with_huggingface(self, face_crops: list) -> list[float]:
+    def _iter_batches(self, face_crops: Any):
+        """Yield the images of consecutive batches of at most batch_size crops."""
+        if isinstance(face_crops, CropStore):
+            images = face_crops.images
+            for start in range(0, len(images), self.batch_size):
+                yield images[start : start + self.batch_size]
+            return
+
+        for start in range(0, len(face_crops), self.batch_size):
+            yield [crop.image for crop in face_crops[start : start + self.batch_size]]
+
+    def _fake_label_index(self) -> int:
+        """Return the output index of the 'fake' class of the HF model."""
+        if self._fake_index is not None:
+            return self._fake_index
+        # Model labels: 0=Real, 1=Fake (check model config)
+        if hasattr(self._model.config, "id2label"):
+            for idx, label in self._model.config.id2label.items():
+                if "fake" in label.lower():
+                    return int(idx)
+        return 1
+
+    def _predict_with_huggingface(self, face_crops: Any) -> list[float]:
         """Run prediction using HuggingFace ViT model."""
         import torch  # pylint: disable=import-outside-toplevel
 
-        scores = []
+        fake_idx = self._fake_label_index()
+        scores: list[float] = []
 
         with torch.no_grad():
-            for crop in face_crops:
-                # Convert numpy array to PIL Image
-                if isinstance(crop.image, np.ndarray):
-                    pil_image = Image.fromarray(crop.image)
-                else:
-                    pil_image = crop.image
-
-                # Preprocess with HuggingFace processor
-                inputs = self._processor(images=pil_image, return_tensors="pt")
-
-                if self.device.startswith("cuda"):
-                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            for batch in self._iter_batches(face_crops):
+                pixel_values = self._preprocess_batch(batch)
+                if pixel_values is None:
+                    # Convert numpy arrays to PIL Images
+                    images = [
+                        (
+                            Image.fromarray(image)
+                            if isinstance(image, np.ndarray)
+                            else image
+                        )
+                        for image in batch
+                    ]
+
+                    # Preprocess with the HuggingFace processor
+                    pixel_values = self._processor(images=images, return_tensors="pt")[
+                        "pixel_values"
+                    ]
 
                 # Forward pass
-                outputs = self._model(**inputs)
-                probs = torch.nn.functional.softmax(outputs.logits, dim=1)
-
-                # Get fake probability
-                # Model labels: 0=Real, 1=Fake (check model config)
-                fake_idx = 1
-                if hasattr(self._model.config, "id2label"):
-                    for idx, label in self._model.config.id2label.items():
-                        if "fake" in label.lower():
-                            fake_idx = int(idx)
-                            break
-
-                fake_prob = probs[0, fake_idx].item()
-                scores.append(fake_prob)
+                logits = self._forward(pixel_values)
+                probs = torch.nn.functional.softmax(logits, dim=1)
+                scores.extend(probs[:, fake_idx].tolist())
 
         return scores
 
-    def _predict_with_model(self, face_crops: list) -> list[float]:
+    def _predict_with_model(self, face_crops: Any) -> list[float]:
         """Run prediction using the loaded model."""
         import torch  # pylint: disable=import-outside-toplevel
 
-        scores = []
+        scores: list[float] = []
 
         with torch.no_grad():
-            for crop in face_crops:
+            for batch in self._iter_batches(face_crops):
                 # Preprocess
-                tensor = self._transform(crop.image)
-                tensor = tensor.unsqueeze(0)
-
-                if self.device.startswith("cuda"):
-                    tensor = tensor.to(self.device)
+                tensor = self._preprocess_batch(batch)
+                if tensor is None:
+                    tensor = torch.stack([self._transform(image) for image in batch])
 
                 # Forward pass
-                output = self._model(tensor)
+                output = self._forward(tensor)
                 probs = torch.nn.functional.softmax(output, dim=1)
 
                 # Get fake probability (assuming class 1 is fake)
-                fake_prob = probs[0, 1].item()
-                scores.append(fake_prob)
+                scores.extend(probs[:, 1].tolist())
 
         return scores
 
-    def _predict_with_fallback(self, face_crops: list) -> list[float]:
+    def _predict_with_fallback(self, face_crops: Any) -> list[float]:
         """
         Fallback prediction using statistical analysis.
 
@@ -390,6 +748,11 @@ class DeepFakeDetector:
         """Check if model is loaded."""
         return self._model_loaded
 
+    @property
+    def active_backend(self) -> str:
+        """Backend serving predictions; 'torch' after an ONNX fallback."""
+        return self.backend if self._onnx is not None else "torch"
+
 
 class ResultAggregator:
     """Aggregates per-frame results into final verdict."""
@@ -408,6 +771,7 @@ class ResultAggregator:
         frame_scores: list[float],
         frame_indices: list[int],
         faces_per_frame: Optional[list[int]] = None,
+        decision: Optional[str] = None,
     ) -> AggregatedResult:
         """
         Aggregate frame-level scores into video-level result.
@@ -416,6 +780,9 @@ class ResultAggregator:
             frame_scores: Confidence scores per frame.
             frame_indices: Frame indices corresponding to scores.
             faces_per_frame: Number of faces detected per frame.
+            decision: Verdict of a SequentialTest that stopped sampling
+                early. It replaces the confidence rule, which on the
+                partial sample can disagree with the test that ended it.
 
         Returns:
             AggregatedResult with verdict and reasoning.
@@ -444,6 +811,13 @@ class ResultAggregator:
 
         # Determine verdict
         verdict = "FAKE" if confidence >= self.threshold else "NOT_FAKE"
+        if decision is not None and decision != verdict:
+            logger.info(
+                "Sequential test verdict %s overrides confidence rule (%.1f%%)",
+                decision,
+                confidence * 100,
+            )
+        verdict = decision or verdict
 
         # Build frame results
         frame_results = []
@@ -459,6 +833,18 @@ class ResultAggregator:
 
         # Build indicators
         indicators = self._build_indicators(frame_scores, confidence)
+        if decision is not None:
+            indicators.append(
+                DetectionIndicator(
+                    name="sequential_test",
+                    detected=decision == "FAKE",
+                    score=confidence,
+                    description=(
+                        f"Sampling stopped early; the sequential test settled "
+                        f"on {decision} after {len(frame_scores)} faces"
+                    ),
+                )
+            )
 
         logger.info(
             "Aggregated result: %s (confidence: %.1f%%)",
@@ -0,0 +1,122 @@
+"""Background loading of the detection model."""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from deepfake_detector.models.detector import DeepFakeDetector
+
+logger = logging.getLogger(__name__)
+
+
+def load_detector(config: Any) -> "DeepFakeDetector":
+    """Create and load the detector described by the configuration."""
+    # Imported here so ModelLoader starts without waiting for PyTorch
+    # pylint: disable-next=import-outside-toplevel
+    from deepfake_detector.models.detector import DeepFakeDetector
+
+    detector = DeepFakeDetector(
+        model_name=config.detection.model,
+        device=config.device,
+        cache_dir=config.model_cache_dir,
+        batch_size=config.detection.inference.batch_size,
+        backend=config.detection.inference.backend,
+        compile_mode=config.detection.inference.compile_mode,
+        precision=config.detection.inference.precision,
+        offline=config.detection.inference.offline,
+    )
+    detector.load_model()
+    return detector
+
+
+class ModelLoader:
+    """
+    Build a model on a background thread while the caller keeps working.
+
+    Imports, weight reads and compilation then overlap with decoding and
+    face detection; result() joins the thread when the model is needed.
+    A load that turns out to be unnecessary, e.g. because the video has
+    no faces, is abandoned with cancel(). A load already in progress
+    cannot be interrupted, so it finishes on its daemon thread and the
+    model is dropped.
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """
+        Start loading.
+
+        Args:
+            factory: Callable that builds and returns the loaded model.
+        """
+        self._model: Any = None
+        self._error: Optional[BaseException] = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self.load_time = 0.0
+        self.wait_time = 0.0
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(factory, time.perf_counter()),
+            name="model-loader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, factory: Callable[[], Any], started: float) -> None:
+        """Build the model unless the load was cancelled first."""
+        try:
+            if not self._cancelled.is_set():
+                model = factory()
+                with self._lock:
+                    if not self._cancelled.is_set():
+                        self._model = model
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._error = exc
+        finally:
+            self.load_time = time.perf_counter() - started
+
+    def result(self) -> Any:
+        """
+        Wait for the model and return it.
+
+        Returns:
+            The object returned by the factory.
+
+        Raises:
+            RuntimeError: If the load was cancelled.
+            Exception: Whatever the factory raised.
+        """
+        if self._cancelled.is_set():
+            raise RuntimeError("Model load was cancelled")
+
+        start = time.perf_counter()
+        self._thread.join()
+        self.wait_time += time.perf_counter() - start
+
+        if self._error is not None:
+            raise self._error
+        return self._model
+
+    def cancel(self) -> None:
+        """Abandon the load; the model is dropped once it finishes."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            self._model = None
+        logger.debug(
+            "Model load cancelled%s",
+            "" if self.done else " (finishing in the background)",
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether the background thread has finished."""
+        return not self._thread.is_alive()
+
+    @property
+    def overlap(self) -> float:
+        """Load time hidden behind the caller's work (seconds)."""
+        return max(0.0, self.load_time - self.wait_time)
@@ -0,0 +1,227 @@
+"""ONNX export and ONNX Runtime inference for the detection models."""
+
+import inspect
+import logging
+import os
+import warnings
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ONNX opset used for exported graphs
+ONNX_OPSET = 17
+
+# Largest absolute logit difference accepted between PyTorch and ONNX Runtime
+PARITY_TOLERANCE = 1e-4
+
+# Largest absolute class probability difference accepted for INT8 graphs,
+# whose logits drift with the quantization error
+INT8_PARITY_TOLERANCE = 0.05
+
+# Operators quantized to INT8; these carry the weights of linear layers
+INT8_OP_TYPES = ("MatMul", "Gemm")
+
+# Batch size of the random input used for the parity check
+PARITY_BATCH = 2
+
+
+def logits_module(model: Any, huggingface: bool) -> Any:
+    """Wrap a model so its forward pass maps pixel values to logits."""
+    import torch  # pylint: disable=import-outside-toplevel
+
+    class LogitsWrapper(torch.nn.Module):
+        """Return plain logits from an image classifier."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.model = model
+
+        def forward(self, pixel_values):  # pylint: disable=arguments-differ
+            """Run the wrapped classifier."""
+            if huggingface:
+                return self.model(pixel_values=pixel_values).logits
+            return self.model(pixel_values)
+
+    return LogitsWrapper().eval()
+
+
+def export_onnx(
+    model: Any,
+    path: Path,
+    input_size: tuple[int, int],
+    huggingface: bool = False,
+) -> Path:
+    """
+    Export a classifier to ONNX with a dynamic batch dimension.
+
+    The graph has one input, ``pixel_values`` of shape (batch, 3, H, W),
+    and one output, ``logits``. It is written to a temporary file first
+    so a failed export never leaves a truncated graph in the cache.
+
+    Args:
+        model: torch.nn.Module in eval mode, on the CPU.
+        path: Destination file.
+        input_size: Input (height, width).
+        huggingface: Whether the model is a HuggingFace classifier returning
+            an output object rather than a logits tensor.
+
+    Returns:
+        Path of the exported graph.
+    """
+    import torch  # pylint: disable=import-outside-toplevel
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".onnx.tmp")
+    dummy = torch.zeros(1, 3, *input_size)
+    options = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        # torch >= 2.5 may default to the dynamo exporter, which needs
+        # onnxscript; older releases only have the TorchScript one
+        options["dynamo"] = False
+
+    logger.info("Exporting ONNX graph to: %s", path)
+    with warnings.catch_warnings():
+        # The TorchScript exporter needs no extra dependencies, and its
+        # shape-check warnings are expected for a fixed input size
+        warnings.simplefilter("ignore", DeprecationWarning)
+        warnings.simplefilter("ignore", torch.jit.TracerWarning)
+        torch.onnx.export(
+            logits_module(model, huggingface),
+            (dummy,),
+            str(tmp_path),
+            input_names=["pixel_values"],
+            output_names=["logits"],
+            dynamic_axes={"pixel_values": {0: "batch"}, "logits": {0: "batch"}},
+            opset_version=ONNX_OPSET,
+            **options,
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def quantize_onnx(source: Path, path: Path) -> Path:
+    """
+    Quantize the linear layers of an exported graph to INT8.
+
+    Weights are quantized ahead of time and activations dynamically at
+    run time (ONNX Runtime dynamic quantization), so no calibration data
+    is needed.
+
+    Args:
+        source: FP32 graph produced by export_onnx().
+        path: Destination file.
+
+    Returns:
+        Path of the quantized graph.
+    """
+    # pylint: disable=import-outside-toplevel
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    prepared = path.with_suffix(".pre.tmp")
+    tmp_path = path.with_suffix(".onnx.tmp")
+
+    logger.info("Quantizing ONNX graph to INT8: %s", path)
+    try:
+        # Shape inference and graph optimisation let more nodes quantize
+        quant_pre_process(str(source), str(prepared))
+        quantize_dynamic(
+            str(prepared),
+            str(tmp_path),
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=list(INT8_OP_TYPES),
+        )
+        os.replace(tmp_path, path)
+    finally:
+        prepared.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+    return path
+
+
+class OnnxClassifier:  # pylint: disable=too-few-public-methods
+    """Run an exported classifier graph with ONNX Runtime."""
+
+    def __init__(self, path: Path, device: str = "cpu") -> None:
+        """
+        Create an inference session.
+
+        Args:
+            path: ONNX graph produced by export_onnx().
+            device: Device string; CUDA is used when requested and the
+                installed ONNX Runtime provides it.
+        """
+        # pylint: disable=import-outside-toplevel
+        import onnxruntime as ort
+
+        providers = ["CPUExecutionProvider"]
+        if device.startswith("cuda"):
+            if "CUDAExecutionProvider" in ort.get_available_providers():
+                providers.insert(0, "CUDAExecutionProvider")
+
+        self.path = path
+        self._session = ort.InferenceSession(str(path), providers=providers)
+        logger.debug("ONNX Runtime session on %s", self._session.get_providers())
+
+    def __call__(self, pixel_values: np.ndarray) -> np.ndarray:
+        """
+        Compute logits for a batch.
+
+        Args:
+            pixel_values: Float32 array of shape (N, 3, H, W).
+
+        Returns:
+            Logits array of shape (N, num_classes).
+        """
+        inputs = {"pixel_values": np.ascontiguousarray(pixel_values, np.float32)}
+        return self._session.run(["logits"], inputs)[0]
+
+
+def check_parity(  # pylint: disable=too-many-arguments
+    model: Any,
+    classifier: OnnxClassifier,
+    input_size: tuple[int, int],
+    huggingface: bool = False,
+    *,
+    tolerance: float = PARITY_TOLERANCE,
+    probabilities: bool = False,
+) -> float:
+    """
+    Compare ONNX Runtime outputs with the PyTorch model on random inputs.
+
+    Args:
+        model: torch.nn.Module the graph was exported from.
+        classifier: ONNX Runtime classifier to check.
+        input_size: Input (height, width).
+        huggingface: Whether the model is a HuggingFace classifier.
+        tolerance: Largest accepted absolute difference.
+        probabilities: Compare softmax probabilities instead of logits.
+
+    Returns:
+        The largest absolute difference.
+
+    Raises:
+        RuntimeError: If the difference exceeds the tolerance.
+    """
+    import torch  # pylint: disable=import-outside-toplevel
+
+    generator = torch.Generator().manual_seed(0)
+    pixel_values = torch.randn(PARITY_BATCH, 3, *input_size, generator=generator)
+    with torch.no_grad():
+        expected = logits_module(model, huggingface)(pixel_values)
+    actual = torch.from_numpy(classifier(pixel_values.numpy()))
+    if probabilities:
+        expected = torch.softmax(expected, dim=1)
+        actual = torch.softmax(actual, dim=1)
+    expected, actual = expected.numpy(), actual.numpy()
+
+    difference = float(np.max(np.abs(actual - expected)))
+    if difference > tolerance:
+        raise RuntimeError(
+            f"ONNX output differs from PyTorch by {difference:.2e} "
+            f"(tolerance {tolerance:.0e})"
+        )
+    logger.debug("ONNX parity check passed (max difference %.2e)", difference)
+    return difference
@@ -0,0 +1,59 @@
+"""Detection result types."""
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class FrameResult:
+    """Detection result for a single frame."""
+
+    frame_index: int
+    confidence: float
+    faces_detected: int
+
+
+@dataclass
+class DetectionIndicator:
+    """A specific indicator of deepfake detection."""
+
+    name: str
+    detected: bool
+    score: float
+    description: str
+
+
+@dataclass
+class AggregatedResult:
+    """Aggregated detection result for a video."""
+
+    verdict: str  # "FAKE" or "NOT_FAKE"
+    confidence: float
+    indicators: list[DetectionIndicator]
+    frame_results: list[FrameResult]
+    frames_consumed: int = 0
+    stopped_early: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to JSON-serializable builtins."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AggregatedResult":
+        """
+        Rebuild a result from to_dict() output.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            An equal AggregatedResult.
+        """
+        return cls(
+            verdict=data["verdict"],
+            confidence=data["confidence"],
+            indicators=[DetectionIndicator(**item) for item in data["indicators"]],
+            frame_results=[FrameResult(**item) for item in data["frame_results"]],
+            frames_consumed=data.get("frames_consumed", 0),
+            stopped_early=data.get("stopped_early", False),
+        )
@@ -0,0 +1,235 @@
+"""Dynamic batching of face crops across concurrent requests."""
+
+import collections
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchedulerStats:
+    """Batch accounting for an InferenceScheduler."""
+
+    requests: int = 0
+    batches: int = 0
+    crops: int = 0
+    merged_batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of crops per forward pass."""
+        return self.crops / self.batches if self.batches else 0.0
+
+
+class _Request:  # pylint: disable=too-few-public-methods
+    """Crops of one predict() call and the scores collected for them."""
+
+    def __init__(self, face_crops: Any) -> None:
+        self.face_crops = face_crops
+        self.scores = [0.0] * len(face_crops)
+        self.next_index = 0
+        self.remaining = len(face_crops)
+        self.submitted = time.perf_counter()
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class InferenceScheduler:  # pylint: disable=too-many-instance-attributes
+    """
+    Merge face crops from concurrent predict() calls into shared batches.
+
+    Callers block in predict() while a worker thread forms batches of at
+    most max_batch_size crops from the queued requests, oldest first. A
+    batch is run once it is full or its oldest request has waited
+    max_delay, and each request's slice of the scores is routed back to
+    it, so every caller still aggregates only its own crops. A request
+    larger than a batch is split across batches, and its tail may share a
+    batch with other requests.
+
+    Scores of a request that shares no batch are identical to calling the
+    detector directly; in a merged batch they can differ in the last bits
+    of float rounding.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        max_batch_size: Optional[int] = None,
+        max_delay: float = 0.005,
+    ) -> None:
+        """
+        Start the batching thread.
+
+        Args:
+            detector: Loaded detector whose predict() scores a list of crops.
+            max_batch_size: Most crops per forward pass; defaults to the
+                detector's batch_size.
+            max_delay: Longest time (seconds) a request waits for others to
+                fill its batch.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1 or max_delay is
+                negative.
+        """
+        if max_batch_size is None:
+            max_batch_size = detector.batch_size
+        if max_batch_size < 1:
+            raise ValueError(
+                f"Max batch size must be at least 1, got: {max_batch_size}"
+            )
+        if max_delay < 0:
+            raise ValueError(f"Max delay must not be negative, got: {max_delay}")
+
+        self.detector = detector
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.stats = SchedulerStats()
+        self._pending: collections.deque[_Request] = collections.deque()
+        self._pending_crops = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="inference-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def predict(self, face_crops: Any) -> list[float]:
+        """
+        Score face crops in batches shared with other callers.
+
+        Args:
+            face_crops: List of FaceCrop objects or a CropStore.
+
+        Returns:
+            List of confidence scores in the order of face_crops.
+
+        Raises:
+            RuntimeError: If the scheduler has been closed.
+            Exception: Whatever the detector raised for a batch holding
+                these crops.
+        """
+        if not face_crops:
+            return []
+
+        request = _Request(face_crops)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Inference scheduler is closed")
+            self._pending.append(request)
+            self._pending_crops += len(face_crops)
+            self.stats.requests += 1
+            self._condition.notify()
+
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.scores
+
+    def _run(self) -> None:
+        """Worker thread body: form and run batches until closed."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                # Give concurrent requests a chance to fill the batch
+                deadline = self._pending[0].submitted + self.max_delay
+                while self._pending_crops < self.max_batch_size and not self._closed:
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                batch = self._take_batch()
+            self._run_batch(batch)
+
+    def _take_batch(self) -> list[tuple[_Request, int, int]]:
+        """Dequeue up to max_batch_size crops as (request, start, end) slices."""
+        batch = []
+        size = 0
+        while self._pending and size < self.max_batch_size:
+            request = self._pending[0]
+            start = request.next_index
+            end = min(len(request.face_crops), start + self.max_batch_size - size)
+            batch.append((request, start, end))
+            size += end - start
+            request.next_index = end
+            if end == len(request.face_crops):
+                self._pending.popleft()
+        self._pending_crops -= size
+        return batch
+
+    def _run_batch(self, batch: list[tuple[_Request, int, int]]) -> None:
+        """Score one batch and hand each request its scores."""
+        if len(batch) == 1:
+            request, start, end = batch[0]
+            if start == 0 and end == len(request.face_crops):
+                # A whole request on its own: pass it unchanged, so a
+                # CropStore is still batched without copying
+                crops = request.face_crops
+            else:
+                crops = [request.face_crops[i] for i in range(start, end)]
+        else:
+            crops = [
+                request.face_crops[i]
+                for request, start, end in batch
+                for i in range(start, end)
+            ]
+
+        try:
+            scores = self.detector.predict(crops)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._fail(batch, exc)
+            return
+
+        self.stats.batches += 1
+        self.stats.crops += len(crops)
+        if len(batch) > 1:
+            self.stats.merged_batches += 1
+
+        offset = 0
+        for request, start, end in batch:
+            request.scores[start:end] = scores[offset : offset + end - start]
+            offset += end - start
+            request.remaining -= end - start
+            if request.remaining == 0 and request.error is None:
+                request.done.set()
+
+    def _fail(self, batch: list[tuple[_Request, int, int]], exc: Exception) -> None:
+        """Fail the requests of a batch and drop their queued crops."""
+        logger.error("Batch of %d requests failed: %s", len(batch), exc)
+        failed = {id(request) for request, _, _ in batch}
+        with self._condition:
+            for request in list(self._pending):
+                if id(request) in failed:
+                    self._pending.remove(request)
+                    self._pending_crops -= len(request.face_crops) - request.next_index
+        for request, _, _ in batch:
+            request.error = exc
+            request.done.set()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting requests and finish the queued ones.
+
+        Args:
+            timeout: Seconds to wait for the worker thread to exit.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+
+        logger.debug(
+            "Scheduler: %d requests in %d batches (%.1f crops/batch, %d merged)",
+            self.stats.requests,
+            self.stats.batches,
+            self.stats.mean_batch_size,
+            self.stats.merged_batches,
+        )
@@ -0,0 +1,109 @@
+"""Sequential early-stopping decisions over per-frame scores."""
+
+import logging
+import math
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SequentialTest:
+    """
+    Wald sequential probability ratio test over per-frame verdicts.
+
+    Each frame score is reduced to a vote: fake if it is at least margin
+    above the threshold, real if at least margin below it, and no vote in
+    between so undecided frames cannot settle the verdict. Under H1 (fake
+    video) a vote is fake with probability fake_vote_rate, under H0 (real
+    video) with 1 - fake_vote_rate. The test stops as soon as the
+    log-likelihood ratio crosses a boundary set by the target error rate,
+    which bounds both the false-fake and the false-real probability.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        error_rate: float = 0.01,
+        fake_vote_rate: float = 0.8,
+        min_frames: int = 4,
+        margin: float = 0.2,
+    ) -> None:
+        """
+        Initialize the test.
+
+        Args:
+            threshold: Score at or above which a frame votes fake.
+            error_rate: Tolerated probability of a wrong early decision.
+            fake_vote_rate: Expected share of fake votes in a fake video.
+            min_frames: Frames to observe before any decision is made.
+            margin: Distance from the threshold a score needs to vote.
+
+        Raises:
+            ValueError: If error_rate or fake_vote_rate is out of range.
+        """
+        if not 0.0 < error_rate < 0.5:
+            raise ValueError("Error rate must be between 0.0 and 0.5")
+        if not 0.5 < fake_vote_rate < 1.0:
+            raise ValueError("Fake vote rate must be between 0.5 and 1.0")
+
+        self.min_frames = min_frames
+        # Scores at or below the first bound vote real, at or above the second fake
+        self._vote_bounds = (threshold - margin, threshold + margin)
+        self._fake_step = math.log(fake_vote_rate / (1 - fake_vote_rate))
+        # Symmetric error rates put the boundaries at +/- the same LLR
+        self._boundary = math.log((1 - error_rate) / error_rate)
+        self._llr = 0.0
+        self._frames_seen = 0
+        self._decision: Optional[str] = None
+
+    def update(self, score: float) -> Optional[str]:
+        """
+        Add one frame score.
+
+        Args:
+            score: Fake probability of the frame.
+
+        Returns:
+            'FAKE' or 'NOT_FAKE' once the decision is settled, else None.
+        """
+        if self._decision is not None:
+            return self._decision
+
+        self._frames_seen += 1
+        # Symmetric hypotheses: a fake vote adds exactly what a real vote takes
+        real_at, fake_at = self._vote_bounds
+        if score >= fake_at:
+            self._llr += self._fake_step
+        elif score <= real_at:
+            self._llr -= self._fake_step
+
+        if self._frames_seen >= self.min_frames:
+            if self._llr >= self._boundary:
+                self._decision = "FAKE"
+            elif self._llr <= -self._boundary:
+                self._decision = "NOT_FAKE"
+
+        if self._decision is not None:
+            logger.info(
+                "Sequential test settled on %s after %d frames (LLR %.2f)",
+                self._decision,
+                self._frames_seen,
+                self._llr,
+            )
+
+        return self._decision
+
+    @property
+    def decision(self) -> Optional[str]:
+        """Get the settled decision, if any."""
+        return self._decision
+
+    @property
+    def frames_seen(self) -> int:
+        """Get the number of scores observed."""
+        return self._frames_seen
+
+    @property
+    def log_likelihood_ratio(self) -> float:
+        """Get the current log-likelihood ratio (positive favours fake)."""
+        return self._llr
@@ -0,0 +1,211 @@
+"""Pinned local snapshots of HuggingFace models for offline loading."""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Manifests live in cache_dir/snapshots, one JSON file per repository
+MANIFEST_DIR = "snapshots"
+
+# Files fetched into a snapshot: configs, processor settings and
+# safetensors weights, which can be memory-mapped (by transformers 5.x;
+# 4.x copies them into private memory). Pickled weights are not fetched
+# because they must always be deserialized into private memory.
+SNAPSHOT_PATTERNS = ("*.json", "*.safetensors", "*.txt")
+
+# Read size used when hashing files
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class SnapshotError(RuntimeError):
+    """Raised when a pinned snapshot is missing or damaged."""
+
+
+@dataclass
+class SnapshotFile:
+    """One file of a snapshot."""
+
+    path: str
+    size: int
+    sha256: str
+    # Modification time when pinned; None in manifests of older releases
+    mtime_ns: Optional[int] = None
+
+
+@dataclass
+class SnapshotManifest:
+    """
+    A model repository pinned to one commit, with file checksums.
+
+    The directory is stored relative to the cache directory when it lies
+    inside it, so a populated cache can be copied to another machine or
+    baked into an image.
+    """
+
+    repo_id: str
+    revision: str
+    directory: Path
+    files: list[SnapshotFile] = field(default_factory=list)
+
+    def verify(self, checksums: bool = False) -> None:
+        """
+        Check that every file of the snapshot is present and intact.
+
+        Sizes are always compared. A file is also hashed when its
+        modification time differs from the one recorded at pinning, so a
+        file rewritten in place with the same size is caught without
+        reading unchanged weights on every load. Copying the cache
+        without preserving times makes every load hash the files until
+        the snapshot is pinned again.
+
+        Args:
+            checksums: Compare the SHA-256 checksum of every file, which
+                reads every file in full.
+
+        Raises:
+            SnapshotError: If a file is missing or differs from the manifest.
+        """
+        for entry in self.files:
+            path = self.directory / entry.path
+            if not path.is_file():
+                raise SnapshotError(f"Snapshot file missing: {path}")
+            stat = path.stat()
+            if stat.st_size != entry.size:
+                raise SnapshotError(f"Snapshot file size changed: {path}")
+            if checksums or stat.st_mtime_ns != entry.mtime_ns:
+                if file_sha256(path) != entry.sha256:
+                    raise SnapshotError(f"Snapshot file checksum mismatch: {path}")
+
+    def save(self, cache_dir: Path) -> Path:
+        """
+        Write the manifest to cache_dir/snapshots.
+
+        Args:
+            cache_dir: Model cache directory.
+
+        Returns:
+            Path of the manifest file.
+        """
+        path = manifest_path(cache_dir, self.repo_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        directory = self.directory.resolve()
+        try:
+            directory = directory.relative_to(Path(cache_dir).resolve())
+        except ValueError:
+            pass
+
+        data = asdict(self)
+        data["directory"] = str(directory)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+
+def manifest_path(cache_dir: Path, repo_id: str) -> Path:
+    """Return the manifest location for a repository."""
+    return Path(cache_dir) / MANIFEST_DIR / f"{repo_id.replace('/', '--')}.json"
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def create_manifest(repo_id: str, revision: str, directory: Path) -> SnapshotManifest:
+    """
+    Checksum the files of a local snapshot directory.
+
+    Args:
+        repo_id: Repository the snapshot was taken from.
+        revision: Commit hash the snapshot is pinned to.
+        directory: Local directory holding the snapshot files.
+
+    Returns:
+        SnapshotManifest listing every file with its size, checksum and
+        modification time.
+    """
+    directory = Path(directory)
+    files = [
+        SnapshotFile(
+            path=path.relative_to(directory).as_posix(),
+            size=path.stat().st_size,
+            sha256=file_sha256(path),
+            mtime_ns=path.stat().st_mtime_ns,
+        )
+        for path in sorted(directory.rglob("*"))
+        if path.is_file() and not path.name.startswith(".")
+    ]
+    return SnapshotManifest(repo_id, revision, directory, files)
+
+
+def load_manifest(cache_dir: Path, repo_id: str) -> Optional[SnapshotManifest]:
+    """
+    Read the manifest of a repository from the cache directory.
+
+    Args:
+        cache_dir: Model cache directory.
+        repo_id: Repository to look up.
+
+    Returns:
+        SnapshotManifest, or None when no snapshot has been taken.
+    """
+    path = manifest_path(cache_dir, repo_id)
+    if not path.is_file():
+        return None
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    directory = Path(data["directory"])
+    if not directory.is_absolute():
+        directory = Path(cache_dir) / directory
+    return SnapshotManifest(
+        repo_id=data["repo_id"],
+        revision=data["revision"],
+        directory=directory,
+        files=[SnapshotFile(**entry) for entry in data["files"]],
+    )
+
+
+def download_snapshot(repo_id: str, revision: str, cache_dir: Path) -> SnapshotManifest:
+    """
+    Download a repository snapshot and pin it with a manifest.
+
+    This is the only step that needs network access; afterwards the model
+    loads from the snapshot with local_files_only.
+
+    Args:
+        repo_id: HuggingFace repository.
+        revision: Branch, tag or commit to resolve.
+        cache_dir: Model cache directory.
+
+    Returns:
+        The saved SnapshotManifest, pinned to the resolved commit hash.
+    """
+    # pylint: disable=import-outside-toplevel
+    from huggingface_hub import snapshot_download
+
+    logger.info("Downloading snapshot of %s@%s", repo_id, revision)
+    directory = Path(
+        snapshot_download(
+            repo_id,
+            revision=revision,  # nosec B615
+            cache_dir=cache_dir,
+            allow_patterns=list(SNAPSHOT_PATTERNS),
+        )
+    )
+    # Hub cache snapshots are stored under their commit hash
+    manifest = create_manifest(repo_id, directory.name, directory)
+    path = manifest.save(cache_dir)
+    logger.info("Pinned %s@%s in %s", repo_id, manifest.revision, path)
+    return manifest
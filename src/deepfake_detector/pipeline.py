@@ -0,0 +1,338 @@
+"""Concurrent stages connected by bounded queues, and the staged analysis."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queue marker sent by a stage when its input is exhausted
+_END = object()
+
+# How often a blocked stage re-checks for cancellation (seconds)
+_POLL_INTERVAL = 0.1
+
+# Items buffered between two stages unless configured otherwise
+DEFAULT_DEPTH = 4
+
+# A stage turns the iterator of its input items into an iterator of outputs
+Stage = Callable[[Iterator], Iterable]
+
+
+class _CancelledError(Exception):
+    """Raised inside a stage when the pipeline is stopped."""
+
+
+@dataclass
+class StageStats:
+    """Time accounting for one pipeline stage."""
+
+    name: str
+    items: int = 0
+    busy: float = 0.0
+    starved: float = 0.0
+    blocked: float = 0.0
+
+    def utilization(self, elapsed: float) -> float:
+        """Fraction of the pipeline's run time this stage spent working."""
+        return self.busy / elapsed if elapsed > 0 else 0.0
+
+
+class _QueueReader:
+    """Iterate a stage's input queue, counting the time spent waiting."""
+
+    def __init__(self, source: queue.Queue, stop: threading.Event) -> None:
+        self._source = source
+        self._stop = stop
+        self.wait = 0.0
+
+    def __iter__(self) -> "_QueueReader":
+        return self
+
+    def __next__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            while True:
+                if self._stop.is_set():
+                    raise _CancelledError()
+                try:
+                    item = self._source.get(timeout=_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    continue
+        finally:
+            self.wait += time.perf_counter() - start
+        if item is _END:
+            raise StopIteration
+        return item
+
+
+class StagedPipeline:
+    """
+    Run a source and a chain of stages concurrently, one thread each.
+
+    Every stage pulls from a bounded queue filled by the stage before it
+    and pushes into the next, so a slow stage throttles the ones upstream
+    (backpressure) and at most ``depth`` items wait between two stages.
+    Iterating the pipeline yields the output of the last stage. The first
+    exception raised by any stage stops all of them and is re-raised to
+    the consumer; close() (or leaving the context manager) cancels the
+    stages, which finish their current item and exit.
+
+    Per-stage statistics tell where the time goes: busy is time spent
+    producing items, starved is time waiting for input, and blocked is
+    time waiting for room downstream. The stage with the most busy time
+    is the bottleneck.
+    """
+
+    def __init__(
+        self,
+        source: Iterable,
+        stages: Sequence[tuple[str, Stage]],
+        depth: int = DEFAULT_DEPTH,
+        source_name: str = "source",
+    ) -> None:
+        """
+        Start the stage threads.
+
+        Args:
+            source: Iterable feeding the first stage.
+            stages: (name, stage) pairs in order. A stage is called once
+                with an iterator of its input items and returns an
+                iterable of output items, typically as a generator.
+            depth: Maximum number of items queued between two stages.
+            source_name: Name reported for the source in the statistics.
+
+        Raises:
+            ValueError: If depth is less than 1.
+        """
+        if depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1, got: {depth}")
+
+        self.stats = [StageStats(source_name)] + [
+            StageStats(name) for name, _ in stages
+        ]
+        self._queues = [queue.Queue(maxsize=depth) for _ in self.stats]
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._started = time.perf_counter()
+        self.elapsed = 0.0
+
+        self._threads = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(0, lambda _: source, None),
+                name=f"pipeline-{source_name}",
+                daemon=True,
+            )
+        ]
+        for index, (name, stage) in enumerate(stages, start=1):
+            reader = _QueueReader(self._queues[index - 1], self._stop)
+            self._threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(index, stage, reader),
+                    name=f"pipeline-{name}",
+                    daemon=True,
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def _put(self, index: int, item: Any) -> None:
+        """Queue a stage's output, waiting for room unless stopped."""
+        start = time.perf_counter()
+        try:
+            while True:
+                if self._stop.is_set():
+                    raise _CancelledError()
+                try:
+                    self._queues[index].put(item, timeout=_POLL_INTERVAL)
+                    return
+                except queue.Full:
+                    continue
+        finally:
+            self.stats[index].blocked += time.perf_counter() - start
+
+    def _run_stage(
+        self, index: int, stage: Stage, reader: Optional[_QueueReader]
+    ) -> None:
+        """Stage thread body: pull, transform and push until done."""
+        stats = self.stats[index]
+        outputs: Optional[Iterator] = None
+        try:
+            outputs = iter(stage(reader))
+            while True:
+                waited = reader.wait if reader is not None else 0.0
+                start = time.perf_counter()
+                try:
+                    item = next(outputs)
+                except StopIteration:
+                    break
+                finally:
+                    starved = (reader.wait if reader is not None else 0.0) - waited
+                    stats.busy += time.perf_counter() - start - starved
+                    stats.starved += starved
+                stats.items += 1
+                self._put(index, item)
+                # Do not keep the item alive once it is queued
+                del item
+            self._put(index, _END)
+        except _CancelledError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Failures after the pipeline stopped are not the cause
+            if self._error is None and not self._stop.is_set():
+                self._error = exc
+            self._stop.set()
+        finally:
+            close = getattr(outputs, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self) -> "StagedPipeline":
+        """Return the iterator itself."""
+        return self
+
+    def __next__(self) -> Any:
+        """Return the next output of the last stage."""
+        while True:
+            if self._stop.is_set():
+                # Re-raise a stage failure once; later calls just stop
+                error, self._error = self._error, None
+                if error is not None:
+                    raise error
+                raise StopIteration
+            try:
+                item = self._queues[-1].get(timeout=_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                continue
+
+        if item is _END:
+            # Every stage has exited, so stopping only marks the end
+            self._stop.set()
+            self.elapsed = time.perf_counter() - self._started
+            raise StopIteration
+        return item
+
+    @property
+    def bottleneck(self) -> str:
+        """Name of the stage with the most busy time."""
+        return max(self.stats, key=lambda stats: stats.busy).name
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop every stage and wait for the threads to exit.
+
+        Args:
+            timeout: Seconds to wait for each thread.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        if not self.elapsed:
+            self.elapsed = time.perf_counter() - self._started
+
+        for stats in self.stats:
+            logger.debug(
+                "Stage %s: %d items, busy %.3fs (%.0f%%), starved %.3fs, "
+                "blocked %.3fs",
+                stats.name,
+                stats.items,
+                stats.busy,
+                100 * stats.utilization(self.elapsed),
+                stats.starved,
+                stats.blocked,
+            )
+
+    def __enter__(self) -> "StagedPipeline":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def run_pipelined(
+    video: Any,
+    face_analyzer: Any,
+    loader: Any,
+    config: Any,
+    report: Optional[Callable[[str], None]] = None,
+) -> tuple[list, list[float], int, bool]:
+    """
+    Decode, detect faces and score them as concurrent pipeline stages.
+
+    Crops are scored in batches of batch_size as soon as a batch is full,
+    while later frames are still being decoded and searched for faces.
+    Bounded queues between the stages hold at most prefetch_depth items
+    (DEFAULT_DEPTH if 0), so a slow stage throttles the ones before it.
+
+    Args:
+        video: Loaded VideoAnalyzer.
+        face_analyzer: FaceAnalyzer to run.
+        loader: ModelLoader building the detector in the background.
+        config: Configuration object.
+        report: Called with each line of progress and stage statistics.
+
+    Returns:
+        Tuple of (face crops, scores, frames decoded, None), the last
+        standing for the early decision of the other scan modes.
+    """
+    batch_size = config.detection.inference.batch_size
+
+    def infer(crops: Iterator) -> Iterator:
+        pending = []
+        for crop in crops:
+            pending.append(crop)
+            if len(pending) == batch_size:
+                yield from zip(pending, loader.result().predict(pending))
+                pending = []
+        if pending:
+            yield from zip(pending, loader.result().predict(pending))
+
+    if report is not None:
+        report("Steps 2-4/4: Decoding, detecting faces and scoring concurrently...")
+
+    frames = video.iter_frames(
+        num_frames=config.detection.num_frames,
+        sample_rate=config.detection.sample_rate,
+        sampling=config.detection.sampling.strategy,
+    )
+    with StagedPipeline(
+        frames,
+        [("detect", face_analyzer.iter_faces_from_frames), ("infer", infer)],
+        depth=config.video.prefetch_depth or DEFAULT_DEPTH,
+        source_name="decode",
+    ) as pipeline:
+        scored = list(pipeline)
+
+    if report is not None:
+        report(f"  Found and scored {len(scored)} face crops")
+        for stats in pipeline.stats:
+            report(
+                f"  Stage {stats.name}: busy {stats.busy:.2f}s "
+                f"({stats.utilization(pipeline.elapsed):.0%}), "
+                f"starved {stats.starved:.2f}s, blocked {stats.blocked:.2f}s"
+            )
+        report(
+            f"  Pipeline: {pipeline.elapsed:.2f}s, bottleneck: {pipeline.bottleneck}"
+        )
+        if scored:
+            report(
+                f"  Model loaded in {loader.load_time:.2f}s on a background "
+                f"thread (infer stage waited {loader.wait_time:.2f}s)"
+            )
+
+    return (
+        [crop for crop, _ in scored],
+        [score for _, score in scored],
+        face_analyzer.frames_scanned,
+        None,
+    )
@@ -0,0 +1,280 @@
+"""Resident inference daemon and its client over a Unix domain socket."""
+
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Optional
+
+from deepfake_detector.analysis import run_analysis_pipeline
+from deepfake_detector.models.loader import load_detector
+from deepfake_detector.models.results import AggregatedResult
+from deepfake_detector.models.scheduler import InferenceScheduler
+from deepfake_detector.utils.config import Config
+from deepfake_detector.utils.validators import ValidationError, validate_video_path
+
+logger = logging.getLogger(__name__)
+
+# Version of the request/response messages; both ends must agree
+PROTOCOL_VERSION = 1
+
+# Seconds a client waits for the connection before analyzing in-process
+CONNECT_TIMEOUT = 1.0
+
+# Largest request line the server reads (bytes)
+MAX_REQUEST_SIZE = 1 << 20
+
+
+def resolve_socket_path(path: str) -> Path:
+    """Expand a configured socket path."""
+    return Path(path).expanduser()
+
+
+def model_settings(config: Config) -> dict[str, Any]:
+    """Return the settings a resident detector was built with."""
+    # Requests with other values are refused so the client analyzes
+    # in-process instead, which keeps forwarded results identical to the
+    # in-process pipeline.
+    settings = asdict(config.detection.inference)
+    settings["model"] = config.detection.model
+    settings["device"] = config.device
+    settings["model_cache_dir"] = config.model_cache_dir
+    return settings
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON request line with one JSON response line."""
+
+    server: "AnalysisServer"
+
+    def handle(self) -> None:
+        """Read a request, run it and write the response."""
+        try:
+            request = json.loads(self.rfile.readline(MAX_REQUEST_SIZE))
+            response = self.server.dispatch(request)
+        except ValidationError as exc:
+            response = {"ok": False, "error": "validation", "message": str(exc)}
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception("Request failed")
+            response = {"ok": False, "error": "runtime", "message": str(exc)}
+        try:
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+        except OSError as exc:
+            # The client timed out or was interrupted during the analysis
+            logger.debug("Client went away before the response: %s", exc)
+
+
+class AnalysisServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serve analysis requests with one resident detector.
+
+    The model is loaded once, so a request only pays for decoding, face
+    detection and inference. Each request runs on its own thread; face
+    detection overlaps across requests, and their face crops are merged
+    into shared batches by an InferenceScheduler. The socket is only
+    accessible to the user running the server.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, config: Config, detector: Any) -> None:
+        """
+        Bind the socket.
+
+        Args:
+            socket_path: Unix socket to listen on; a stale one is replaced.
+            config: Configuration the detector was built with.
+            detector: Loaded DeepFakeDetector.
+
+        Raises:
+            RuntimeError: If another server is listening on socket_path.
+        """
+        self.socket_path = Path(socket_path)
+        self.config = config
+        self._settings = model_settings(config)
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f"A server is already listening on {socket_path}")
+            self.socket_path.unlink()
+
+        # Create the socket owner-only rather than tightening it afterwards
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+        self.detector = InferenceScheduler(
+            detector, max_delay=config.detection.server.max_delay_ms / 1000
+        )
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run one request.
+
+        Args:
+            request: Decoded request message.
+
+        Returns:
+            Response message.
+
+        Raises:
+            ValidationError: If the video path is invalid.
+        """
+        if request.get("protocol") != PROTOCOL_VERSION:
+            return {
+                "ok": False,
+                "error": "protocol",
+                "message": f"Server speaks protocol {PROTOCOL_VERSION}",
+            }
+
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "settings": self._settings}
+        if command != "analyze":
+            return {
+                "ok": False,
+                "error": "command",
+                "message": f"Unknown command: {command!r}",
+            }
+
+        config = Config.from_dict(request["config"])
+        if model_settings(config) != self._settings:
+            return {
+                "ok": False,
+                "error": "settings",
+                "message": "Model settings differ from the server's",
+            }
+
+        video_path = str(validate_video_path(request["video_path"]))
+        logger.info("Analyzing: %s", video_path)
+        result = run_analysis_pipeline(
+            video_path, config, verbose=False, detector=self.detector
+        )
+        return {"ok": True, "result": result.to_dict()}
+
+    def serve_until_stopped(self) -> None:
+        """Serve until interrupted or sent SIGTERM, then close the server."""
+        # Stop cleanly on SIGTERM so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        """Close the socket, remove its file and stop the scheduler."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+        self.detector.close()
+
+
+def create_server(config: Config) -> AnalysisServer:
+    """
+    Load the detector described by config and bind its server.
+
+    Args:
+        config: Effective configuration; config.detection.server.socket_path is the
+            socket to listen on.
+
+    Returns:
+        AnalysisServer ready to serve.
+
+    Raises:
+        RuntimeError: If the model cannot be loaded or another server is
+            listening on the socket.
+        OSError: If the socket cannot be bound.
+    """
+    detector = load_detector(config)
+    return AnalysisServer(
+        resolve_socket_path(config.detection.server.socket_path), config, detector
+    )
+
+
+def _is_listening(socket_path: Path) -> bool:
+    """Whether a server accepts connections on socket_path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _send_request(socket_path: Path, request: dict[str, Any]) -> dict[str, Any]:
+    """Send one request and wait for its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(socket_path))
+        # Analysis takes as long as it takes once the server has the request
+        sock.settimeout(None)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("Server closed the connection")
+    return json.loads(line)
+
+
+def forward_analysis(video_path: str, config: Config) -> Optional[AggregatedResult]:
+    """
+    Analyze a video on a running server, if there is a suitable one.
+
+    Args:
+        video_path: Path to the video, resolved against the caller's working
+            directory.
+        config: Effective configuration of the caller.
+
+    Returns:
+        The server's result, or None when no server is listening on
+        config.detection.server.socket_path, the socket belongs to another user, its
+        reply cannot be read or its model settings differ from config; the
+        caller then runs the pipeline in-process.
+
+    Raises:
+        ValidationError: If the server rejects the video.
+        RuntimeError: If the analysis fails on the server.
+    """
+    socket_path = resolve_socket_path(config.detection.server.socket_path)
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    # Only a server run by the same user may supply the verdict
+    if hasattr(os, "getuid") and socket_path.stat().st_uid != os.getuid():
+        logger.warning("Server not used: %s belongs to another user", socket_path)
+        return None
+
+    request = {
+        "protocol": PROTOCOL_VERSION,
+        "command": "analyze",
+        "video_path": str(Path(video_path).resolve()),
+        "config": config.to_dict(),
+    }
+    try:
+        response = _send_request(socket_path, request)
+        if response["ok"]:
+            return AggregatedResult.from_dict(response["result"])
+        error, message = response["error"], response["message"]
+    except OSError as exc:
+        logger.debug("No server on %s: %s", socket_path, exc)
+        return None
+    except (ValueError, KeyError, TypeError) as exc:
+        # Not our server, or another release of it: analyze in-process
+        logger.debug("Unreadable response from %s: %s", socket_path, exc)
+        return None
+
+    if error == "validation":
+        raise ValidationError(message)
+    if error in ("settings", "protocol"):
+        logger.info("Server not used: %s", message)
+        return None
+    raise RuntimeError(f"Server error: {message}")
@@ -6,6 +6,7 @@ from deepfake_detector.utils.config import (
     DetectionConfig,
     LoggingConfig,
     OutputConfig,
+    ServerConfig,
     VideoConfig,
     load_config,
 )
@@ -28,6 +29,7 @@ __all__ = [
     "AnalysisConfig",
     "OutputConfig",
     "LoggingConfig",
+    "ServerConfig",
     "load_config",
     # Logging
     "setup_logging",
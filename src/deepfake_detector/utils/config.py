@@ -1,7 +1,7 @@
 """Configuration management for DeepFake Detector."""
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +9,39 @@ import yaml
 from dotenv import load_dotenv
 
 
+@dataclass
+class SamplingConfig:
+    """Frame selection and scan order configuration."""
+
+    strategy: str = "uniform"
+    coarse_to_fine: bool = False
+    coarse_frames: int = 8
+    early_stopping: bool = False
+    early_stop_error_rate: float = 0.01
+    early_stop_min_frames: int = 4
+    pipelined: bool = False
+
+
+@dataclass
+class InferenceConfig:
+    """Model loading and execution configuration."""
+
+    batch_size: int = 8
+    backend: str = "torch"
+    compile_mode: str = "none"
+    precision: str = "fp32"
+    offline: bool = False
+
+
+@dataclass
+class ServerConfig:
+    """Inference daemon configuration."""
+
+    enabled: bool = False
+    socket_path: str = "~/.deepfake-detector/detector.sock"
+    max_delay_ms: float = 5.0
+
+
 @dataclass
 class DetectionConfig:
     """Detection-related configuration."""
@@ -17,6 +50,9 @@ class DetectionConfig:
     confidence_threshold: float = 0.5
     num_frames: int = 30
     sample_rate: int = 10
+    sampling: SamplingConfig = field(default_factory=SamplingConfig)
+    inference: InferenceConfig = field(default_factory=InferenceConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
 
 
 @dataclass
@@ -28,6 +64,19 @@ class VideoConfig:
     supported_formats: list[str] = field(
         default_factory=lambda: ["mp4", "avi", "mov", "mkv", "webm"]
     )
+    decode_strategy: str = "auto"
+    prefetch_depth: int = 0
+    decode_workers: int = 1
+
+
+@dataclass
+class FaceTrackingConfig:
+    """Face detection and tracking configuration."""
+
+    detect_interval: int = 1
+    track_min_score: float = 0.6
+    roi_search: bool = False
+    detection_scale: float = 1.0
 
 
 @dataclass
@@ -38,6 +87,7 @@ class AnalysisConfig:
     temporal_analysis: bool = True
     artifact_detection: bool = True
     av_sync_check: bool = False
+    face_tracking: FaceTrackingConfig = field(default_factory=FaceTrackingConfig)
 
 
 @dataclass
@@ -69,6 +119,39 @@ class Config:
     device: str = "auto"
     model_cache_dir: str = "./models/cache"
 
+    def to_dict(self) -> dict:
+        """Convert the configuration to JSON-serializable builtins."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """
+        Rebuild a configuration from to_dict() output.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            An equal Config.
+        """
+        detection = dict(data["detection"])
+        detection["sampling"] = SamplingConfig(**detection["sampling"])
+        detection["inference"] = InferenceConfig(**detection["inference"])
+        detection["server"] = ServerConfig(**detection["server"])
+        video = dict(data["video"])
+        video["frame_size"] = tuple(video["frame_size"])
+        analysis = dict(data["analysis"])
+        analysis["face_tracking"] = FaceTrackingConfig(**analysis["face_tracking"])
+        return cls(
+            detection=DetectionConfig(**detection),
+            video=VideoConfig(**video),
+            analysis=AnalysisConfig(**analysis),
+            output=OutputConfig(**data["output"]),
+            logging=LoggingConfig(**data["logging"]),
+            device=data["device"],
+            model_cache_dir=data["model_cache_dir"],
+        )
+
 
 def _get_env_value(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get environment variable value with optional default."""
@@ -164,40 +247,13 @@ def _load_yaml_config(config_path: Optional[str] = None) -> Optional[dict]:
 def _apply_yaml_config(config: Config, yaml_data: dict) -> Config:
     """Apply YAML configuration to config object."""
     if "detection" in yaml_data:
-        detection = yaml_data["detection"]
-        config.detection.model = detection.get("model", config.detection.model)
-        config.detection.confidence_threshold = detection.get(
-            "confidence_threshold", config.detection.confidence_threshold
-        )
-        config.detection.num_frames = detection.get(
-            "num_frames", config.detection.num_frames
-        )
-        config.detection.sample_rate = detection.get(
-            "sample_rate", config.detection.sample_rate
-        )
+        _apply_detection_yaml(config.detection, yaml_data["detection"])
 
     if "video" in yaml_data:
-        video = yaml_data["video"]
-        config.video.max_duration = video.get("max_duration", config.video.max_duration)
-        if "frame_size" in video:
-            config.video.frame_size = tuple(video["frame_size"])
-        if "supported_formats" in video:
-            config.video.supported_formats = video["supported_formats"]
+        _apply_video_yaml(config.video, yaml_data["video"])
 
     if "analysis" in yaml_data:
-        analysis = yaml_data["analysis"]
-        config.analysis.face_detection = analysis.get(
-            "face_detection", config.analysis.face_detection
-        )
-        config.analysis.temporal_analysis = analysis.get(
-            "temporal_analysis", config.analysis.temporal_analysis
-        )
-        config.analysis.artifact_detection = analysis.get(
-            "artifact_detection", config.analysis.artifact_detection
-        )
-        config.analysis.av_sync_check = analysis.get(
-            "av_sync_check", config.analysis.av_sync_check
-        )
+        _apply_analysis_yaml(config.analysis, yaml_data["analysis"])
 
     if "output" in yaml_data:
         output = yaml_data["output"]
@@ -217,22 +273,91 @@ def _apply_yaml_config(config: Config, yaml_data: dict) -> Config:
     return config
 
 
-def _apply_env_overrides(config: Config) -> Config:
-    """Apply environment variable overrides to config."""
-    # Detection settings
-    model = _get_env_value("DEFAULT_MODEL")
-    if model:
-        config.detection.model = model
+def _apply_detection_yaml(detection: DetectionConfig, data: dict) -> None:
+    """Apply the YAML detection section, including its nested groups."""
+    detection.model = data.get("model", detection.model)
+    detection.confidence_threshold = data.get(
+        "confidence_threshold", detection.confidence_threshold
+    )
+    detection.num_frames = data.get("num_frames", detection.num_frames)
+    detection.sample_rate = data.get("sample_rate", detection.sample_rate)
 
-    config.detection.confidence_threshold = _get_env_float(
-        "CONFIDENCE_THRESHOLD", config.detection.confidence_threshold
+    if "sampling" in data:
+        _apply_sampling_yaml(detection.sampling, data["sampling"])
+
+    if "inference" in data:
+        _apply_inference_yaml(detection.inference, data["inference"])
+
+    if "server" in data:
+        server = data["server"]
+        detection.server.enabled = server.get("enabled", detection.server.enabled)
+        detection.server.socket_path = server.get(
+            "socket_path", detection.server.socket_path
+        )
+        detection.server.max_delay_ms = server.get(
+            "max_delay_ms", detection.server.max_delay_ms
+        )
+
+
+def _apply_sampling_yaml(sampling: SamplingConfig, data: dict) -> None:
+    """Apply the YAML detection.sampling section."""
+    sampling.strategy = data.get("strategy", sampling.strategy)
+    sampling.coarse_to_fine = data.get("coarse_to_fine", sampling.coarse_to_fine)
+    sampling.coarse_frames = data.get("coarse_frames", sampling.coarse_frames)
+    sampling.early_stopping = data.get("early_stopping", sampling.early_stopping)
+    sampling.early_stop_error_rate = data.get(
+        "early_stop_error_rate", sampling.early_stop_error_rate
     )
-    config.detection.num_frames = _get_env_int(
-        "NUM_FRAMES_TO_ANALYZE", config.detection.num_frames
+    sampling.early_stop_min_frames = data.get(
+        "early_stop_min_frames", sampling.early_stop_min_frames
     )
-    config.detection.sample_rate = _get_env_int(
-        "FRAME_SAMPLE_RATE", config.detection.sample_rate
+    sampling.pipelined = data.get("pipelined", sampling.pipelined)
+
+
+def _apply_inference_yaml(inference: InferenceConfig, data: dict) -> None:
+    """Apply the YAML detection.inference section."""
+    inference.batch_size = data.get("batch_size", inference.batch_size)
+    inference.backend = data.get("backend", inference.backend)
+    inference.compile_mode = data.get("compile_mode", inference.compile_mode)
+    inference.precision = data.get("precision", inference.precision)
+    inference.offline = data.get("offline", inference.offline)
+
+
+def _apply_video_yaml(video: VideoConfig, data: dict) -> None:
+    """Apply the YAML video section."""
+    video.max_duration = data.get("max_duration", video.max_duration)
+    if "frame_size" in data:
+        video.frame_size = tuple(data["frame_size"])
+    if "supported_formats" in data:
+        video.supported_formats = data["supported_formats"]
+    video.decode_strategy = data.get("decode_strategy", video.decode_strategy)
+    video.prefetch_depth = data.get("prefetch_depth", video.prefetch_depth)
+    video.decode_workers = data.get("decode_workers", video.decode_workers)
+
+
+def _apply_analysis_yaml(analysis: AnalysisConfig, data: dict) -> None:
+    """Apply the YAML analysis section, including face tracking."""
+    analysis.face_detection = data.get("face_detection", analysis.face_detection)
+    analysis.temporal_analysis = data.get(
+        "temporal_analysis", analysis.temporal_analysis
     )
+    analysis.artifact_detection = data.get(
+        "artifact_detection", analysis.artifact_detection
+    )
+    analysis.av_sync_check = data.get("av_sync_check", analysis.av_sync_check)
+
+    if "face_tracking" in data:
+        tracking = data["face_tracking"]
+        face = analysis.face_tracking
+        face.detect_interval = tracking.get("detect_interval", face.detect_interval)
+        face.track_min_score = tracking.get("track_min_score", face.track_min_score)
+        face.roi_search = tracking.get("roi_search", face.roi_search)
+        face.detection_scale = tracking.get("detection_scale", face.detection_scale)
+
+
+def _apply_env_overrides(config: Config) -> Config:
+    """Apply environment variable overrides to config."""
+    _apply_detection_env(config.detection)
 
     # Video settings
     config.video.max_duration = _get_env_int(
@@ -269,3 +394,29 @@ def _apply_env_overrides(config: Config) -> Config:
         config.model_cache_dir = cache_dir
 
     return config
+
+
+def _apply_detection_env(detection: DetectionConfig) -> None:
+    """Apply environment variable overrides to the detection settings."""
+    model = _get_env_value("DEFAULT_MODEL")
+    if model:
+        detection.model = model
+
+    detection.confidence_threshold = _get_env_float(
+        "CONFIDENCE_THRESHOLD", detection.confidence_threshold
+    )
+    detection.num_frames = _get_env_int("NUM_FRAMES_TO_ANALYZE", detection.num_frames)
+    detection.sample_rate = _get_env_int("FRAME_SAMPLE_RATE", detection.sample_rate)
+
+    # Inference settings
+    detection.inference.batch_size = _get_env_int(
+        "BATCH_SIZE", detection.inference.batch_size
+    )
+    detection.inference.offline = _get_env_bool(
+        "MODEL_OFFLINE", detection.inference.offline
+    )
+
+    # Server settings
+    socket_path = _get_env_value("DETECTOR_SOCKET")
+    if socket_path:
+        detection.server.socket_path = socket_path
@@ -0,0 +1,168 @@
+"""Unit tests for batch module."""
+
+import json
+import queue
+import shutil
+from pathlib import Path
+
+import pytest
+import torch
+from click.testing import CliRunner
+
+from deepfake_detector import batch as batch_module
+from deepfake_detector.batch import analyze_videos, collect_videos
+from deepfake_detector.cli import main
+from deepfake_detector.utils.config import Config
+
+SAMPLE_DIR = Path(__file__).resolve().parents[2] / "data" / "fake"
+SAMPLE_VIDEO = SAMPLE_DIR / "man_hair.1.mp4"
+
+
+def make_config() -> Config:
+    """Create a small CPU configuration."""
+    config = Config()
+    config.device = "cpu"
+    config.detection.model = "efficientnet"
+    config.detection.num_frames = 4
+    return config
+
+
+@pytest.fixture
+def video_tree(tmp_path: Path) -> Path:
+    """Create a directory tree with videos and other files."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    for name in ("a/one.mp4", "a/b/two.MOV", "a/notes.txt", "a/b/three.avi"):
+        (tmp_path / name).write_bytes(b"")
+    return tmp_path
+
+
+class TestCollectVideos:
+    """Tests for collect_videos function."""
+
+    def test_directory_is_searched_recursively(self, video_tree: Path) -> None:
+        """Test that only supported video files are found, in sorted order."""
+        videos = collect_videos([str(video_tree / "a")])
+        assert videos == [
+            str(video_tree / "a" / "b" / "three.avi"),
+            str(video_tree / "a" / "b" / "two.MOV"),
+            str(video_tree / "a" / "one.mp4"),
+        ]
+
+    def test_glob_pattern(self, video_tree: Path) -> None:
+        """Test that glob patterns expand, recursively with **."""
+        assert collect_videos([str(video_tree / "**" / "*.mp4")]) == [
+            str(video_tree / "a" / "one.mp4")
+        ]
+
+    def test_manifest_paths_are_relative_to_it(self, video_tree: Path) -> None:
+        """Test that manifests skip blanks and comments."""
+        manifest = video_tree / "a" / "list.txt"
+        manifest.write_text("# triage\none.mp4\n\nb/three.avi\n")
+
+        assert collect_videos([str(manifest)]) == [
+            str(video_tree / "a" / "one.mp4"),
+            str(video_tree / "a" / "b" / "three.avi"),
+        ]
+
+    def test_duplicates_and_missing_files(self, video_tree: Path) -> None:
+        """Test that duplicates are dropped and missing files kept."""
+        one = str(video_tree / "a" / "one.mp4")
+        videos = collect_videos([one, str(video_tree / "a"), "missing.mp4", one])
+
+        assert videos.count(one) == 1
+        assert videos[-1] == "missing.mp4"
+
+
+class TestAnalyzeVideos:
+    """Tests for analyze_videos function."""
+
+    def test_failure_does_not_abort_run(self, tmp_path: Path) -> None:
+        """Test that a bad file yields an error record and the run goes on."""
+        missing = str(tmp_path / "missing.mp4")
+        records = list(analyze_videos([missing, str(SAMPLE_VIDEO)], make_config(), 1))
+
+        assert records[0]["error_type"] == "validation"
+        assert records[0]["metadata"]["video_path"] == missing
+        assert records[1]["verdict"] in ("FAKE", "NOT_FAKE")
+        assert records[1]["metadata"]["frames_analyzed"] > 0
+
+    def test_worker_processes(self, tmp_path: Path) -> None:
+        """Test that spawned workers return one record per video."""
+        copy = tmp_path / "copy.mp4"
+        shutil.copy(SAMPLE_VIDEO, copy)
+        videos = [str(SAMPLE_VIDEO), str(copy)]
+
+        records = list(analyze_videos(videos, make_config(), 2))
+
+        assert sorted(r["metadata"]["video_path"] for r in records) == sorted(videos)
+        assert all("verdict" in record for record in records)
+
+    def test_fused_streams_match_per_video(self, tmp_path: Path) -> None:
+        """Test that pooling crops across videos keeps each video's result."""
+        copy = tmp_path / "copy.mp4"
+        shutil.copy(SAMPLE_VIDEO, copy)
+        videos = [str(SAMPLE_VIDEO), str(copy)]
+
+        def confidences(streams: int) -> dict[str, float]:
+            # Same random weights for both runs
+            torch.manual_seed(0)
+            records = analyze_videos(videos, make_config(), 1, streams)
+            return {
+                record["metadata"]["video_path"]: record["confidence"]
+                for record in records
+            }
+
+        fused = confidences(2)
+        for video_path, confidence in confidences(1).items():
+            assert fused[video_path] == pytest.approx(confidence, abs=1e-5)
+
+    def test_lost_videos_of_dead_workers_fail(self) -> None:
+        """Test that videos of a crashed worker get error records."""
+
+        class DeadProcess:  # pylint: disable=too-few-public-methods
+            """Worker process that has exited."""
+
+            def is_alive(self) -> bool:
+                """Report the process as exited."""
+                return False
+
+        results: queue.Queue = queue.Queue()
+        results.put({"verdict": "FAKE", "metadata": {"video_path": "a.mp4"}})
+        records = list(
+            batch_module._collect_results(["a.mp4", "b.mp4"], results, [DeadProcess()])
+        )
+
+        assert records[0]["verdict"] == "FAKE"
+        assert records[1]["error"] == "Worker process exited"
+        assert records[1]["metadata"]["video_path"] == "b.mp4"
+
+    def test_invalid_workers(self) -> None:
+        """Test that worker and stream counts below one are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            list(analyze_videos([str(SAMPLE_VIDEO)], make_config(), 0))
+        with pytest.raises(ValueError, match="streams"):
+            list(analyze_videos([str(SAMPLE_VIDEO)], make_config(), 1, 0))
+
+
+class TestBatchCommand:
+    """Tests for the batch command."""
+
+    def test_writes_jsonl(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that every video gets one JSON line and failures set the exit code."""
+        monkeypatch.setenv("DEFAULT_MODEL", "efficientnet")
+        output = tmp_path / "results.jsonl"
+        missing = str(tmp_path / "missing.mp4")
+
+        result = CliRunner().invoke(
+            main,
+            ["batch", str(SAMPLE_VIDEO), missing, "-j", "1", "-n", "4"]
+            + ["-d", "cpu", "-o", str(output)],
+        )
+
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert len(lines) == 2
+        assert {line["metadata"]["video_path"] for line in lines} == {
+            str(SAMPLE_VIDEO),
+            missing,
+        }
+        assert result.exit_code == 1
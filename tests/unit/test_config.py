@@ -10,8 +10,12 @@ from deepfake_detector.utils.config import (
     AnalysisConfig,
     Config,
     DetectionConfig,
+    FaceTrackingConfig,
+    InferenceConfig,
     LoggingConfig,
     OutputConfig,
+    SamplingConfig,
+    ServerConfig,
     VideoConfig,
     load_config,
 )
@@ -27,6 +31,34 @@ class TestDefaultConfig:
         assert config.confidence_threshold == 0.5
         assert config.num_frames == 30
         assert config.sample_rate == 10
+        assert isinstance(config.sampling, SamplingConfig)
+        assert isinstance(config.inference, InferenceConfig)
+        assert isinstance(config.server, ServerConfig)
+
+    def test_sampling_defaults(self) -> None:
+        """Test default frame sampling configuration."""
+        config = SamplingConfig()
+        assert config.strategy == "uniform"
+        assert config.coarse_to_fine is False
+        assert config.coarse_frames == 8
+        assert config.early_stopping is False
+        assert config.pipelined is False
+        assert config.early_stop_error_rate == 0.01
+
+    def test_inference_defaults(self) -> None:
+        """Test default inference configuration."""
+        config = InferenceConfig()
+        assert config.batch_size == 8
+        assert config.backend == "torch"
+        assert config.compile_mode == "none"
+        assert config.precision == "fp32"
+        assert config.offline is False
+
+    def test_server_defaults(self) -> None:
+        """Test default inference daemon configuration."""
+        config = ServerConfig()
+        assert config.enabled is False
+        assert config.socket_path.endswith("detector.sock")
 
     def test_video_defaults(self) -> None:
         """Test default video configuration."""
@@ -34,6 +66,9 @@ class TestDefaultConfig:
         assert config.max_duration == 300
         assert config.frame_size == (224, 224)
         assert "mp4" in config.supported_formats
+        assert config.decode_strategy == "auto"
+        assert config.prefetch_depth == 0
+        assert config.decode_workers == 1
 
     def test_analysis_defaults(self) -> None:
         """Test default analysis configuration."""
@@ -42,6 +77,11 @@ class TestDefaultConfig:
         assert config.temporal_analysis is True
         assert config.artifact_detection is True
         assert config.av_sync_check is False
+        assert isinstance(config.face_tracking, FaceTrackingConfig)
+        assert config.face_tracking.detect_interval == 1
+        assert config.face_tracking.track_min_score == 0.6
+        assert config.face_tracking.roi_search is False
+        assert config.face_tracking.detection_scale == 1.0
 
     def test_output_defaults(self) -> None:
         """Test default output configuration."""
@@ -64,7 +104,7 @@ class TestLoadConfig:
         """Test loading config with default values."""
         # Clear any environment variables that might affect test
         for key in list(os.environ.keys()):
-            if key.startswith(("DEFAULT_", "CONFIDENCE_", "NUM_FRAMES")):
+            if key.startswith(("DEFAULT_", "CONFIDENCE_", "NUM_FRAMES", "BATCH_")):
                 monkeypatch.delenv(key, raising=False)
 
         config = load_config()
@@ -87,7 +127,11 @@ class TestLoadConfig:
                 "model": "xception",
                 "confidence_threshold": 0.7,
                 "num_frames": 50,
+                "sampling": {"strategy": "adaptive", "pipelined": True},
+                "inference": {"batch_size": 16, "precision": "bf16"},
+                "server": {"enabled": True},
             },
+            "analysis": {"face_tracking": {"detect_interval": 5}},
             "output": {"format": "json", "include_reasoning": False},
         }
 
@@ -100,6 +144,13 @@ class TestLoadConfig:
         assert config.detection.model == "xception"
         assert config.detection.confidence_threshold == 0.7
         assert config.detection.num_frames == 50
+        assert config.detection.inference.batch_size == 16
+        assert config.detection.inference.precision == "bf16"
+        assert config.detection.sampling.strategy == "adaptive"
+        assert config.detection.sampling.pipelined is True
+        assert config.detection.sampling.coarse_frames == 8
+        assert config.detection.server.enabled is True
+        assert config.analysis.face_tracking.detect_interval == 5
         assert config.output.output_format == "json"
         assert config.output.include_reasoning is False
 
@@ -107,7 +158,13 @@ class TestLoadConfig:
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that environment variables override YAML config."""
-        config_data = {"detection": {"model": "xception", "confidence_threshold": 0.7}}
+        config_data = {
+            "detection": {
+                "model": "xception",
+                "confidence_threshold": 0.7,
+                "inference": {"offline": False},
+            }
+        }
 
         config_file = tmp_path / "config.yaml"
         with open(config_file, "w", encoding="utf-8") as f:
@@ -116,12 +173,16 @@ class TestLoadConfig:
         # Set environment variable to override
         monkeypatch.setenv("DEFAULT_MODEL", "efficientnet")
         monkeypatch.setenv("CONFIDENCE_THRESHOLD", "0.8")
+        monkeypatch.setenv("BATCH_SIZE", "32")
+        monkeypatch.setenv("MODEL_OFFLINE", "true")
 
         config = load_config(str(config_file))
 
         # Env should override YAML
         assert config.detection.model == "efficientnet"
         assert config.detection.confidence_threshold == 0.8
+        assert config.detection.inference.batch_size == 32
+        assert config.detection.inference.offline is True
 
     def test_env_gpu_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test GPU settings from environment."""
@@ -164,3 +225,12 @@ class TestConfigDataclasses:
         assert hasattr(config, "analysis")
         assert hasattr(config, "output")
         assert hasattr(config, "logging")
+
+    def test_config_dict_round_trip(self) -> None:
+        """Test that from_dict(to_dict()) rebuilds an equal config."""
+        config = Config()
+        config.detection.inference.precision = "bf16"
+        config.detection.server.socket_path = "/tmp/other.sock"
+        config.analysis.face_tracking.roi_search = True
+        assert Config.from_dict(config.to_dict()) == config
+        assert Config().detection.server.socket_path.endswith("detector.sock")
@@ -0,0 +1,463 @@
+"""Unit tests for detector module."""
+
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from transformers import ViTConfig, ViTForImageClassification, ViTImageProcessor
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, CropStore, FaceCrop
+from deepfake_detector.models import detector as detector_module
+from deepfake_detector.models.compiled import CompileStats
+from deepfake_detector.models.detector import DeepFakeDetector
+
+
+def make_crops(count: int, size: int = 224) -> list[FaceCrop]:
+    """Create random face crops."""
+    rng = np.random.default_rng(0)
+    box = BoundingBox(x=0, y=0, width=size, height=size, confidence=1.0)
+    return [
+        FaceCrop(
+            frame_index=i,
+            box=box,
+            image=rng.integers(0, 256, (size, size, 3), dtype=np.uint8),
+        )
+        for i in range(count)
+    ]
+
+
+def make_vit_detector(batch_size: int, **kwargs) -> DeepFakeDetector:
+    """Create a detector around a tiny randomly initialised ViT."""
+    torch.manual_seed(0)
+    config = ViTConfig(
+        image_size=32,
+        patch_size=16,
+        hidden_size=32,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=37,
+        num_labels=2,
+        id2label={0: "Real", 1: "Fake"},
+        label2id={"Real": 0, "Fake": 1},
+    )
+    detector = DeepFakeDetector(device="cpu", batch_size=batch_size, **kwargs)
+    detector._model = ViTForImageClassification(config).eval()
+    detector._processor = ViTImageProcessor(size={"height": 32, "width": 32})
+    detector._configure_fast_preprocessing()
+    detector._model_loaded = True
+    return detector
+
+
+@pytest.fixture(scope="module")
+def efficientnet_detector() -> DeepFakeDetector:
+    """Create a detector with a randomly initialised EfficientNet."""
+    torch.manual_seed(0)
+    detector = DeepFakeDetector(model_name="efficientnet", device="cpu")
+    detector.load_model()
+    assert detector.is_loaded
+    return detector
+
+
+class TestBatchedPrediction:
+    """Tests for batched inference."""
+
+    @pytest.mark.parametrize("batch_size", [1, 4, 16])
+    def test_torchvision_batches_match_single(
+        self, efficientnet_detector: DeepFakeDetector, batch_size: int
+    ) -> None:
+        """Test that batch size does not change torchvision scores."""
+        crops = make_crops(7)
+        efficientnet_detector.batch_size = 1
+        expected = efficientnet_detector.predict(crops)
+        efficientnet_detector.batch_size = batch_size
+        scores = efficientnet_detector.predict(crops)
+
+        assert len(scores) == len(crops)
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+
+    @pytest.mark.parametrize("batch_size", [3, 8])
+    def test_huggingface_batches_match_single(self, batch_size: int) -> None:
+        """Test that batching, including a ragged last batch, keeps scores."""
+        crops = make_crops(7, size=64)
+        expected = make_vit_detector(1).predict(crops)
+        scores = make_vit_detector(batch_size).predict(crops)
+
+        assert len(scores) == len(crops)
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+
+    def test_forward_pass_per_batch(self) -> None:
+        """Test that one forward pass runs per batch."""
+        detector = make_vit_detector(3)
+        calls = []
+        detector._model.register_forward_hook(
+            lambda module, args, output: calls.append(args)
+        )
+
+        detector.predict(make_crops(7, size=64))
+
+        assert len(calls) == 3
+
+    def test_invalid_batch_size(self) -> None:
+        """Test that a non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="Batch size"):
+            DeepFakeDetector(batch_size=0)
+
+
+class TestFastPreprocessing:
+    """Tests for vectorized crop preprocessing."""
+
+    @pytest.mark.parametrize(
+        "processor",
+        [
+            ViTImageProcessor(),
+            ViTImageProcessor(
+                size={"height": 32, "width": 32},
+                image_mean=[0.485, 0.456, 0.406],
+                image_std=[0.229, 0.224, 0.225],
+            ),
+        ],
+    )
+    def test_matches_huggingface_processor(self, processor: ViTImageProcessor) -> None:
+        """Test numerical parity with the HF processor."""
+        detector = DeepFakeDetector(device="cpu")
+        detector._processor = processor
+        detector._configure_fast_preprocessing()
+        crops = make_crops(5, size=processor.size["height"])
+
+        fast = detector._preprocess_batch([crop.image for crop in crops])
+        expected = processor(
+            images=[Image.fromarray(crop.image) for crop in crops],
+            return_tensors="pt",
+        )["pixel_values"]
+
+        assert fast.shape == expected.shape
+        torch.testing.assert_close(fast, expected, atol=1e-5, rtol=1e-5)
+
+    def test_matches_torchvision_transform(
+        self, efficientnet_detector: DeepFakeDetector
+    ) -> None:
+        """Test numerical parity with the torchvision transform."""
+        crops = make_crops(5)
+
+        fast = efficientnet_detector._preprocess_batch([crop.image for crop in crops])
+        expected = torch.stack(
+            [efficientnet_detector._transform(crop.image) for crop in crops]
+        )
+
+        torch.testing.assert_close(fast, expected, atol=1e-5, rtol=1e-5)
+
+    def test_falls_back_for_other_sizes(self) -> None:
+        """Test that crops needing a resize use the processor instead."""
+        detector = make_vit_detector(4)
+        crops = make_crops(2, size=64)
+        assert detector._preprocess_batch([crop.image for crop in crops]) is None
+
+    def test_fast_path_scores_match_processor(self) -> None:
+        """Test that predictions do not change with the fast path."""
+        crops = make_crops(6, size=32)
+        fast = make_vit_detector(4)
+        slow = make_vit_detector(4)
+        slow._input_size = None
+
+        np.testing.assert_allclose(fast.predict(crops), slow.predict(crops), atol=1e-5)
+
+
+class TestCropStoreInput:
+    """Tests for predicting from a CropStore."""
+
+    @staticmethod
+    def to_store(crops: list[FaceCrop], size: int) -> CropStore:
+        """Copy crops into a store of the given size."""
+        store = CropStore(capacity=len(crops), size=(size, size))
+        for crop in crops:
+            store.add(crop.image, crop.frame_index, crop.box)
+        return store
+
+    def test_batches_are_views(self) -> None:
+        """Test that batches share memory with the store buffer."""
+        detector = make_vit_detector(3)
+        store = self.to_store(make_crops(7, size=32), 32)
+
+        batches = list(detector._iter_batches(store))
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert all(np.shares_memory(batch, store.images) for batch in batches)
+
+    @pytest.mark.parametrize("size", [32, 64])
+    def test_scores_match_list(self, size: int) -> None:
+        """Test that a store scores like the equivalent list of crops."""
+        crops = make_crops(5, size=size)
+        detector = make_vit_detector(2)
+
+        np.testing.assert_allclose(
+            detector.predict(self.to_store(crops, size)),
+            detector.predict(crops),
+            atol=1e-6,
+        )
+
+
+class TestOnnxBackend:
+    """Tests for the ONNX Runtime inference backend."""
+
+    @staticmethod
+    def load_efficientnet(
+        cache_dir, batch_size: int = 3, backend: str = "onnx"
+    ) -> DeepFakeDetector:
+        """Load an EfficientNet with fixed random weights on ONNX Runtime."""
+        torch.manual_seed(0)
+        detector = DeepFakeDetector(
+            model_name="efficientnet",
+            device="cpu",
+            cache_dir=str(cache_dir),
+            batch_size=batch_size,
+            backend=backend,
+        )
+        detector.load_model()
+        return detector
+
+    def test_torchvision_parity(self, tmp_path) -> None:
+        """Test that ONNX scores match PyTorch, including a ragged batch."""
+        detector = self.load_efficientnet(tmp_path)
+        assert detector._onnx is not None
+
+        crops = make_crops(7)
+        onnx_scores = detector.predict(crops)
+        torch_scores = self.load_efficientnet(tmp_path, backend="torch").predict(crops)
+
+        np.testing.assert_allclose(onnx_scores, torch_scores, atol=1e-4)
+
+    def test_cached_graph_is_reused(self, tmp_path, monkeypatch) -> None:
+        """Test that a second load neither exports nor checks parity again."""
+        detector = make_vit_detector(4, cache_dir=str(tmp_path), backend="onnx")
+        detector._weights_id = "0123456789abcdef0123"
+        detector._load_onnx_backend()
+        assert list((tmp_path / "onnx").glob("vit-deepfake-0123456789abcdef.onnx"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached graph exported or checked again")
+
+        monkeypatch.setattr(detector_module, "export_onnx", fail)
+        monkeypatch.setattr(detector_module, "check_parity", fail)
+        detector = make_vit_detector(4, cache_dir=str(tmp_path), backend="onnx")
+        detector._weights_id = "0123456789abcdef0123"
+        detector._load_onnx_backend()
+        assert detector._onnx is not None
+
+    def test_unidentified_weights_are_not_cached(self, tmp_path) -> None:
+        """Test that random torchvision weights leave no graph behind."""
+        detector = self.load_efficientnet(tmp_path)
+
+        assert detector.active_backend == "onnx"
+        assert not detector._onnx.path.exists()
+        assert not (tmp_path / "onnx").exists()
+
+    def test_torch_model_is_released(self, tmp_path) -> None:
+        """Test that the PyTorch model is dropped once ONNX Runtime runs."""
+        detector = make_vit_detector(4, cache_dir=str(tmp_path), backend="onnx")
+        detector._model.config.id2label = {0: "Fake", 1: "Real"}
+        crops = make_crops(3, size=32)
+        torch_scores = detector.predict(crops)
+
+        detector._load_onnx_backend()
+
+        assert detector._model is None
+        np.testing.assert_allclose(detector.predict(crops), torch_scores, atol=1e-4)
+
+    def test_huggingface_parity(self, tmp_path) -> None:
+        """Test that the exported ViT matches the PyTorch model."""
+        detector = make_vit_detector(4, cache_dir=str(tmp_path), backend="onnx")
+        crops = make_crops(5, size=32)
+        torch_scores = detector.predict(crops)
+
+        detector._load_onnx_backend()
+
+        assert detector._onnx is not None
+        np.testing.assert_allclose(detector.predict(crops), torch_scores, atol=1e-4)
+
+    def test_parity_failure_keeps_torch(self, tmp_path, monkeypatch) -> None:
+        """Test that a mismatching graph is discarded."""
+
+        def mismatch(*args, **kwargs):
+            raise RuntimeError("ONNX output differs")
+
+        monkeypatch.setattr(detector_module, "check_parity", mismatch)
+        detector = self.load_efficientnet(tmp_path)
+
+        assert detector.is_loaded
+        assert detector.active_backend == "torch"
+        assert not list((tmp_path / "onnx").glob("*.onnx"))
+
+    def test_int8_scores_close_to_torch(self, tmp_path) -> None:
+        """Test that the INT8 graph tracks PyTorch scores."""
+        detector = self.load_efficientnet(tmp_path, backend="onnx-int8")
+        assert detector.active_backend == "onnx-int8"
+        assert detector._onnx.path.name.endswith(".int8.onnx")
+
+        crops = make_crops(5)
+        int8_scores = detector.predict(crops)
+        torch_scores = self.load_efficientnet(tmp_path, backend="torch").predict(crops)
+
+        np.testing.assert_allclose(int8_scores, torch_scores, atol=0.05)
+
+    def test_int8_huggingface(self, tmp_path) -> None:
+        """Test that the quantized ViT stays close to the PyTorch model."""
+        detector = make_vit_detector(4, cache_dir=str(tmp_path), backend="onnx-int8")
+        crops = make_crops(5, size=32)
+        torch_scores = detector.predict(crops)
+
+        detector._load_onnx_backend()
+
+        assert detector._onnx is not None
+        np.testing.assert_allclose(detector.predict(crops), torch_scores, atol=0.05)
+
+    def test_invalid_backend(self) -> None:
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError, match="inference backend"):
+            DeepFakeDetector(backend="tensorrt")
+
+
+class TestCompiledModel:
+    """Tests for traced and compiled execution."""
+
+    @staticmethod
+    def load_efficientnet(compile_mode: str) -> DeepFakeDetector:
+        """Load an EfficientNet with fixed random weights."""
+        torch.manual_seed(0)
+        detector = DeepFakeDetector(
+            model_name="efficientnet",
+            device="cpu",
+            batch_size=3,
+            compile_mode=compile_mode,
+        )
+        detector.load_model()
+        return detector
+
+    def test_trace_matches_eager(self) -> None:
+        """Test that the traced model scores like eager mode."""
+        detector = self.load_efficientnet("trace")
+        stats = detector.compile_stats
+        assert stats is not None
+        assert stats.mode == "trace"
+        assert stats.batch_size == 3
+        assert stats.compile_time > 0 and stats.latency > 0
+
+        crops = make_crops(7)
+        traced = detector.predict(crops)
+        detector._compiled = None
+        np.testing.assert_allclose(traced, detector.predict(crops), atol=1e-4)
+
+    def test_trace_huggingface(self) -> None:
+        """Test that a traced ViT scores like eager mode."""
+        detector = make_vit_detector(4, compile_mode="trace")
+        crops = make_crops(6, size=32)
+        eager = detector.predict(crops)
+
+        detector._compile_model()
+
+        assert detector._compiled is not None
+        np.testing.assert_allclose(detector.predict(crops), eager, atol=1e-4)
+
+    def test_compile_mode_uses_torch_compile(self, monkeypatch) -> None:
+        """Test that compile mode goes through torch.compile."""
+        compiled = []
+
+        def fake_compile(module):
+            compiled.append(module)
+            return module
+
+        monkeypatch.setattr(torch, "compile", fake_compile)
+        detector = self.load_efficientnet("compile")
+
+        assert len(compiled) == 1
+        assert detector.compile_stats.mode == "compile"
+
+    def test_failed_compile_falls_back_to_eager(self, monkeypatch) -> None:
+        """Test that a compilation error keeps the eager model."""
+
+        def broken_compile(module):
+            raise RuntimeError("no compiler")
+
+        monkeypatch.setattr(torch, "compile", broken_compile)
+        detector = self.load_efficientnet("compile")
+
+        assert detector.is_loaded
+        assert detector._compiled is None
+        assert detector.compile_stats is None
+        assert len(detector.predict(make_crops(2))) == 2
+
+    def test_break_even(self) -> None:
+        """Test the break-even estimate."""
+        stats = CompileStats(
+            "trace", 8, eager_latency=0.3, compile_time=2.0, latency=0.1
+        )
+        assert stats.break_even_batches == pytest.approx(10.0)
+        stats.latency = 0.4
+        assert stats.break_even_batches is None
+
+    def test_invalid_compile_mode(self) -> None:
+        """Test that an unknown compile mode is rejected."""
+        with pytest.raises(ValueError, match="compile mode"):
+            DeepFakeDetector(compile_mode="jit")
+
+
+class TestReducedPrecision:
+    """Tests for bfloat16 inference."""
+
+    # Largest accepted per-crop score change from fp32
+    BF16_TOLERANCE = 0.02
+
+    @staticmethod
+    def load_resnet(**kwargs) -> DeepFakeDetector:
+        """Load a ResNet with fixed random weights."""
+        torch.manual_seed(0)
+        detector = DeepFakeDetector(
+            model_name="resnet", device="cpu", batch_size=4, **kwargs
+        )
+        detector.load_model()
+        return detector
+
+    def test_bf16_score_drift_torchvision(self) -> None:
+        """Test that bf16 scores stay close to fp32 for a torchvision model."""
+        crops = make_crops(6)
+        fp32 = self.load_resnet().predict(crops)
+        bf16 = self.load_resnet(precision="bf16").predict(crops)
+
+        assert all(isinstance(score, float) for score in bf16)
+        np.testing.assert_allclose(bf16, fp32, atol=self.BF16_TOLERANCE)
+
+    def test_bf16_score_drift_huggingface(self) -> None:
+        """Test that bf16 scores stay close to fp32 for a HuggingFace model."""
+        crops = make_crops(5, size=32)
+        fp32 = make_vit_detector(2).predict(crops)
+        bf16 = make_vit_detector(2, precision="bf16").predict(crops)
+
+        np.testing.assert_allclose(bf16, fp32, atol=self.BF16_TOLERANCE)
+
+    def test_bf16_runs_in_bfloat16(self) -> None:
+        """Test that the forward pass autocasts while logits stay float32."""
+        detector = make_vit_detector(2, precision="bf16")
+        dtypes = []
+        detector._model.classifier.register_forward_hook(
+            lambda module, inputs, output: dtypes.append(output.dtype)
+        )
+
+        logits = detector._forward(torch.zeros(2, 3, 32, 32))
+
+        assert dtypes == [torch.bfloat16]
+        assert logits.dtype == torch.float32
+
+    def test_bf16_trace(self) -> None:
+        """Test that a model traced under bf16 scores like bf16 eager mode."""
+        detector = make_vit_detector(4, precision="bf16", compile_mode="trace")
+        crops = make_crops(6, size=32)
+        eager = detector.predict(crops)
+
+        detector._compile_model()
+
+        assert detector._compiled is not None
+        np.testing.assert_allclose(detector.predict(crops), eager, atol=1e-3)
+
+    def test_invalid_precision(self) -> None:
+        """Test that an unknown precision is rejected."""
+        with pytest.raises(ValueError, match="precision"):
+            DeepFakeDetector(precision="fp8")
@@ -0,0 +1,316 @@
+"""Unit tests for face analyzer module."""
+
+import gc
+import weakref
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from deepfake_detector.analyzers.face_analyzer import (
+    BoundingBox,
+    CropStore,
+    FaceAnalyzer,
+    FaceTracker,
+)
+from deepfake_detector.analyzers.video_analyzer import Frame, VideoAnalyzer
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+@pytest.fixture(scope="module")
+def sample_frames() -> list[Frame]:
+    """Decode a handful of frames from the bundled sample video."""
+    with VideoAnalyzer() as video:
+        video.load(str(SAMPLE_VIDEO))
+        return video.extract_frames(num_frames=4)
+
+
+@pytest.fixture(scope="module")
+def dense_frames() -> list[Frame]:
+    """Decode consecutive frames from the start of the sample video."""
+    with VideoAnalyzer() as video:
+        video.load(str(SAMPLE_VIDEO))
+        return list(video.iter_frames(indices=range(0, 24, 2)))
+
+
+@pytest.fixture(scope="module")
+def face_analyzer() -> FaceAnalyzer:
+    """Create a face analyzer with default settings."""
+    return FaceAnalyzer()
+
+
+class TestFaceAnalyzer:
+    """Tests for FaceAnalyzer class."""
+
+    def test_detects_face_in_sample(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that the sample subject's face is found."""
+        boxes = face_analyzer.detect_faces(sample_frames[0].image)
+        assert len(boxes) >= 1
+        assert boxes[0].width > 100
+
+    def test_crops_have_target_size(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that crops are resized to the target size."""
+        crops = face_analyzer.extract_faces_from_frames(sample_frames)
+        assert len(crops) == len(sample_frames)
+        assert all(crop.image.shape == (224, 224, 3) for crop in crops)
+        assert [c.frame_index for c in crops] == [f.index for f in sample_frames]
+
+    def test_no_faces_in_blank_frame(self, face_analyzer: FaceAnalyzer) -> None:
+        """Test that a blank frame yields no crops."""
+        blank = Frame(index=0, timestamp=0.0, image=np.zeros((240, 320, 3), np.uint8))
+        assert not face_analyzer.extract_faces_from_frames([blank])
+        assert face_analyzer.frames_scanned == 1
+        assert face_analyzer.frames_with_faces == 0
+
+
+class TestStreamingFaces:
+    """Tests for the streaming frame-to-crop path."""
+
+    def test_streaming_matches_list(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that streaming from iter_frames matches the list path."""
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            streamed = list(
+                face_analyzer.iter_faces_from_frames(video.iter_frames(num_frames=4))
+            )
+
+        listed = face_analyzer.extract_faces_from_frames(sample_frames)
+        assert [c.frame_index for c in streamed] == [c.frame_index for c in listed]
+        for streamed_crop, listed_crop in zip(streamed, listed):
+            assert np.array_equal(streamed_crop.image, listed_crop.image)
+
+    def test_frames_released_after_cropping(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that each full frame is freed before the next is requested."""
+        refs: list[weakref.ref] = []
+        alive_when_requested: list[int] = []
+
+        def tracked_copy(frame: Frame) -> Frame:
+            image = frame.image.copy()
+            refs.append(weakref.ref(image))
+            return Frame(index=frame.index, timestamp=frame.timestamp, image=image)
+
+        def frame_source():
+            for frame in sample_frames:
+                gc.collect()
+                alive_when_requested.append(sum(r() is not None for r in refs))
+                yield tracked_copy(frame)
+
+        crops = list(face_analyzer.iter_faces_from_frames(frame_source()))
+
+        assert len(crops) == len(sample_frames)
+        assert alive_when_requested == [0] * len(sample_frames)
+
+    def test_iter_frames_requires_load(self) -> None:
+        """Test that iter_frames fails eagerly without a loaded video."""
+        with pytest.raises(ValueError, match="No video loaded"):
+            VideoAnalyzer().iter_frames()
+
+
+def _iou(first, second) -> float:
+    """Intersection over union of two bounding boxes."""
+    left = max(first.x, second.x)
+    top = max(first.y, second.y)
+    right = min(first.x + first.width, second.x + second.width)
+    bottom = min(first.y + first.height, second.y + second.height)
+    inter = max(0, right - left) * max(0, bottom - top)
+    union = first.width * first.height + second.width * second.height - inter
+    return inter / union
+
+
+class TestFaceTracking:
+    """Tests for tracking the primary face between detections."""
+
+    def test_tracker_follows_face(
+        self, face_analyzer: FaceAnalyzer, dense_frames: list[Frame]
+    ) -> None:
+        """Test that the tracked box stays on the detected face."""
+        tracker = FaceTracker()
+        grays = [cv2.cvtColor(f.image, cv2.COLOR_RGB2GRAY) for f in dense_frames]
+        tracker.init(grays[0], face_analyzer.detect_faces(dense_frames[0].image)[0])
+
+        for frame, gray in zip(dense_frames[1:], grays[1:]):
+            box, score = tracker.update(gray)
+            assert box is not None
+            assert score >= tracker.min_score
+            detected = face_analyzer.detect_faces(frame.image)[0]
+            assert _iou(box, detected) > 0.5
+
+    def test_tracker_loses_face_on_blank_frame(
+        self, face_analyzer: FaceAnalyzer, dense_frames: list[Frame]
+    ) -> None:
+        """Test that tracking reports a miss when the face disappears."""
+        tracker = FaceTracker()
+        gray = cv2.cvtColor(dense_frames[0].image, cv2.COLOR_RGB2GRAY)
+        tracker.init(gray, face_analyzer.detect_faces(dense_frames[0].image)[0])
+
+        box, _ = tracker.update(np.zeros_like(gray))
+        assert box is None
+
+    def test_update_without_init(self) -> None:
+        """Test that an uninitialised tracker reports no box."""
+        assert FaceTracker().update(np.zeros((10, 10), np.uint8)) == (None, 0.0)
+
+    def test_interval_tracks_between_keyframes(self, dense_frames: list[Frame]) -> None:
+        """Test that only keyframes run full detection."""
+        analyzer = FaceAnalyzer(detect_interval=4)
+        crops = analyzer.extract_faces_from_frames(dense_frames)
+
+        assert len(crops) == len(dense_frames)
+        assert analyzer.frames_tracked == 9
+        assert all(crop.image.shape == (224, 224, 3) for crop in crops)
+
+    def test_interval_redetects_after_lost_track(
+        self, dense_frames: list[Frame]
+    ) -> None:
+        """Test that a lost track falls back to detection."""
+        blank = Frame(
+            index=99, timestamp=0.0, image=np.zeros_like(dense_frames[0].image)
+        )
+        frames = [dense_frames[0], blank, dense_frames[1], dense_frames[2]]
+        analyzer = FaceAnalyzer(detect_interval=10)
+        crops = analyzer.extract_faces_from_frames(frames)
+
+        assert [c.frame_index for c in crops] == [
+            dense_frames[0].index,
+            dense_frames[1].index,
+            dense_frames[2].index,
+        ]
+        assert analyzer.frames_tracked == 1
+
+
+class TestRoiSearch:
+    """Tests for detection around the previous face box."""
+
+    def test_roi_matches_full_frame(
+        self, face_analyzer: FaceAnalyzer, dense_frames: list[Frame]
+    ) -> None:
+        """Test that ROI detection finds the same face as a full scan."""
+        previous = face_analyzer.detect_faces(dense_frames[0].image)[0]
+        full = face_analyzer.detect_faces(dense_frames[1].image)[0]
+        near = face_analyzer.detect_faces(dense_frames[1].image, near=previous)[0]
+
+        assert _iou(near, full) > 0.8
+
+    def test_roi_miss_falls_back_to_full_frame(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that a wrong previous box still finds the face."""
+        image = sample_frames[0].image
+        stale = BoundingBox(
+            x=0, y=image.shape[0] - 100, width=80, height=80, confidence=1.0
+        )
+        hits = face_analyzer.roi_hits
+
+        boxes = face_analyzer.detect_faces(image, near=stale)
+
+        assert len(boxes) >= 1
+        assert face_analyzer.roi_hits == hits
+
+    def test_roi_mode_uses_previous_face(self, sample_frames: list[Frame]) -> None:
+        """Test that every frame after the first is found in the ROI."""
+        analyzer = FaceAnalyzer(roi_search=True)
+        crops = analyzer.extract_faces_from_frames(sample_frames)
+        reference = FaceAnalyzer().extract_faces_from_frames(sample_frames)
+
+        assert len(crops) == len(sample_frames)
+        assert analyzer.roi_hits == len(sample_frames) - 1
+        for crop, expected in zip(crops, reference):
+            assert _iou(crop.box, expected.box) > 0.8
+
+
+class TestDetectionScale:
+    """Tests for detection on a downscaled frame."""
+
+    def test_boxes_mapped_to_full_resolution(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that downscaled detection returns full-resolution boxes."""
+        image = sample_frames[0].image
+        full = face_analyzer.detect_faces(image)[0]
+        scaled = FaceAnalyzer(detection_scale=0.5).detect_faces(image)[0]
+
+        assert _iou(scaled, full) > 0.8
+
+    def test_crops_come_from_full_frame(self, sample_frames: list[Frame]) -> None:
+        """Test that crops keep the target size at reduced detection scale."""
+        analyzer = FaceAnalyzer(detection_scale=0.25, roi_search=True)
+        crops = analyzer.extract_faces_from_frames(sample_frames)
+
+        assert len(crops) == len(sample_frames)
+        assert all(crop.image.shape == (224, 224, 3) for crop in crops)
+        assert all(crop.box.width > 100 for crop in crops)
+
+    @pytest.mark.parametrize("scale", [0.0, -0.5, 1.5])
+    def test_invalid_scale(self, scale: float) -> None:
+        """Test that out-of-range scales are rejected."""
+        with pytest.raises(ValueError, match="Detection scale"):
+            FaceAnalyzer(detection_scale=scale)
+
+
+class TestCropStore:
+    """Tests for the preallocated crop buffer."""
+
+    def test_add_resizes_into_buffer(self) -> None:
+        """Test that crops land in the buffer with their metadata."""
+        store = CropStore(capacity=2, size=(32, 16))
+        region = np.full((50, 40, 3), 7, dtype=np.uint8)
+        box = BoundingBox(x=1, y=2, width=3, height=4, confidence=0.5)
+
+        store.add(region, frame_index=9, box=box)
+
+        assert len(store) == 1
+        assert store.images.shape == (1, 16, 32, 3)
+        assert np.all(store.images == 7)
+        assert store.frame_indices.tolist() == [9]
+        assert store.boxes.tolist() == [[1, 2, 3, 4]]
+        assert store[0].box == box
+        assert np.shares_memory(store[0].image, store.images)
+
+    def test_grows_when_full(self) -> None:
+        """Test that the buffer doubles and keeps existing crops."""
+        store = CropStore(capacity=1, size=(8, 8))
+        box = BoundingBox(x=0, y=0, width=8, height=8, confidence=1.0)
+        for value in range(3):
+            store.add(np.full((8, 8, 3), value, np.uint8), value, box)
+
+        assert store.capacity == 4
+        assert [int(image[0, 0, 0]) for image in store.images] == [0, 1, 2]
+        assert [crop.frame_index for crop in store] == [0, 1, 2]
+
+    def test_invalid_capacity(self) -> None:
+        """Test that an empty store is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            CropStore(capacity=0)
+
+    def test_matches_crop_faces(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that the store holds the same crops as the list path."""
+        store = face_analyzer.extract_faces_to_store(sample_frames)
+        listed = face_analyzer.extract_faces_from_frames(sample_frames)
+
+        assert len(store) == len(listed)
+        assert store.images.flags.c_contiguous
+        for stored, crop in zip(store, listed):
+            assert stored.frame_index == crop.frame_index
+            assert stored.box == crop.box
+            assert np.array_equal(stored.image, crop.image)
+
+    def test_rejects_mismatched_size(
+        self, face_analyzer: FaceAnalyzer, sample_frames: list[Frame]
+    ) -> None:
+        """Test that a store with another crop size is refused."""
+        with pytest.raises(ValueError, match="does not match"):
+            face_analyzer.extract_faces_to_store(
+                sample_frames, CropStore(size=(64, 64))
+            )
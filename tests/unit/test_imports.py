@@ -0,0 +1,76 @@
+"""Unit tests for lazy package imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import deepfake_detector
+from deepfake_detector.analyzers import face_analyzer
+
+# Modules that must not load just to start the CLI
+HEAVY_MODULES = ("cv2", "numpy", "PIL", "torch", "torchvision", "transformers")
+
+# Cumulative import time allowed for the CLI module, in microseconds; eager
+# imports of OpenCV and NumPy alone take longer than this
+CLI_IMPORT_BUDGET_US = 250_000
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImports:
+    """Tests for deferred loading of heavy dependencies."""
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "deepfake_detector",
+            "deepfake_detector.cli",
+            "deepfake_detector.analysis",
+            "deepfake_detector.utils",
+        ],
+    )
+    def test_no_heavy_modules(self, module: str) -> None:
+        """Test that importing the module loads no heavy dependency."""
+        loaded = set(import_times(module))
+        assert not loaded.intersection(HEAVY_MODULES)
+
+    def test_cli_import_budget(self) -> None:
+        """Test that the CLI imports within the startup budget."""
+        # Best of three absorbs scheduling noise on a busy machine
+        best = min(
+            import_times("deepfake_detector.cli")["deepfake_detector.cli"]
+            for _ in range(3)
+        )
+        assert best < CLI_IMPORT_BUDGET_US
+
+    def test_attribute_access_imports_module(self) -> None:
+        """Test that public names resolve to their defining module."""
+        assert deepfake_detector.FaceAnalyzer is face_analyzer.FaceAnalyzer
+        assert "DeepFakeDetector" in dir(deepfake_detector)
+
+    def test_star_import(self) -> None:
+        """Test that every name in __all__ resolves."""
+        namespace: dict = {}
+        exec("from deepfake_detector import *", namespace)  # pylint: disable=exec-used
+        assert set(deepfake_detector.__all__) <= set(namespace)
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute"):
+            _ = deepfake_detector.NotAName
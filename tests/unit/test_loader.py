@@ -0,0 +1,70 @@
+"""Unit tests for loader module."""
+
+import threading
+import time
+
+import pytest
+
+from deepfake_detector.models.loader import ModelLoader
+
+
+class TestModelLoader:
+    """Tests for ModelLoader class."""
+
+    def test_returns_model(self) -> None:
+        """Test that result() returns what the factory built."""
+        model = object()
+        loader = ModelLoader(lambda: model)
+        assert loader.result() is model
+        assert loader.result() is model
+        assert loader.done
+
+    def test_load_overlaps_caller(self) -> None:
+        """Test that the load runs while the caller works."""
+
+        def slow_factory():
+            time.sleep(0.3)
+            return "model"
+
+        loader = ModelLoader(slow_factory)
+        time.sleep(0.3)  # Caller's own work
+
+        assert loader.result() == "model"
+        assert loader.load_time >= 0.3
+        assert loader.wait_time < 0.2
+        assert loader.overlap > 0.1
+
+    def test_factory_error_is_reraised(self) -> None:
+        """Test that a load failure surfaces from result()."""
+
+        def failing_factory():
+            raise OSError("weights missing")
+
+        loader = ModelLoader(failing_factory)
+        with pytest.raises(OSError, match="weights missing"):
+            loader.result()
+
+    def test_cancel_drops_model(self) -> None:
+        """Test that a cancelled load does not keep its model."""
+        release = threading.Event()
+
+        def blocking_factory():
+            release.wait(timeout=5.0)
+            return "model"
+
+        loader = ModelLoader(blocking_factory)
+        loader.cancel()
+        release.set()
+        loader._thread.join(timeout=5.0)
+
+        assert loader._model is None
+        with pytest.raises(RuntimeError, match="cancelled"):
+            loader.result()
+
+    def test_cancel_is_idempotent(self) -> None:
+        """Test that cancelling twice, or after loading, is harmless."""
+        loader = ModelLoader(lambda: "model")
+        loader.result()
+        loader.cancel()
+        loader.cancel()
+        assert loader._model is None
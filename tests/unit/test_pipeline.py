@@ -0,0 +1,147 @@
+"""Unit tests for pipeline module."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import torch
+
+from deepfake_detector.analysis import run_analysis_pipeline
+from deepfake_detector.models.loader import load_detector
+from deepfake_detector.pipeline import StagedPipeline
+from deepfake_detector.utils.config import Config
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+def double(items):
+    """Stage that doubles every item."""
+    for item in items:
+        yield 2 * item
+
+
+def pairs(items):
+    """Stage that groups items in pairs, flushing a partial pair at the end."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == 2:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+class TestStagedPipeline:
+    """Tests for StagedPipeline class."""
+
+    def test_yields_last_stage_in_order(self) -> None:
+        """Test that items flow through every stage in order."""
+        with StagedPipeline(range(5), [("double", double), ("pairs", pairs)]) as pipe:
+            assert list(pipe) == [(0, 2), (4, 6), (8,)]
+
+        assert [stats.items for stats in pipe.stats] == [5, 5, 3]
+        assert [stats.name for stats in pipe.stats] == ["source", "double", "pairs"]
+
+    def test_backpressure_bounds_read_ahead(self) -> None:
+        """Test that a slow consumer stops the source from running ahead."""
+        produced = []
+
+        def source():
+            for index in range(50):
+                produced.append(index)
+                yield index
+
+        with StagedPipeline(source(), [("double", double)], depth=2) as pipe:
+            first = next(pipe)
+            time.sleep(0.3)
+            # Two full queues, one item in each stage's hands, plus the next
+            assert len(produced) <= 2 * 2 + 3
+            assert first == 0
+
+        assert pipe.stats[0].blocked > 0.1
+
+    def test_utilization_names_bottleneck(self) -> None:
+        """Test that the slowest stage shows the most busy time."""
+
+        def slow(items):
+            for item in items:
+                time.sleep(0.02)
+                yield item
+
+        with StagedPipeline(range(10), [("fast", double), ("slow", slow)]) as pipe:
+            list(pipe)
+
+        assert pipe.bottleneck == "slow"
+        assert pipe.stats[2].utilization(pipe.elapsed) > 0.5
+        assert pipe.stats[1].blocked > pipe.stats[2].blocked
+
+    def test_error_stops_every_stage(self) -> None:
+        """Test that a stage error reaches the consumer and cancels the rest."""
+        closed = threading.Event()
+
+        def source():
+            try:
+                yield from range(1000)
+            finally:
+                closed.set()
+
+        def failing(items):
+            for item in items:
+                if item == 3:
+                    raise ValueError("bad item")
+                yield item
+
+        with StagedPipeline(source(), [("fail", failing)], depth=1) as pipe:
+            with pytest.raises(ValueError, match="bad item"):
+                list(pipe)
+
+        assert closed.wait(timeout=5.0)
+        assert not any(thread.is_alive() for thread in pipe._threads)
+
+    def test_close_cancels_early(self) -> None:
+        """Test that closing before the end stops an unbounded source."""
+
+        def endless():
+            index = 0
+            while True:
+                yield index
+                index += 1
+
+        pipe = StagedPipeline(endless(), [("double", double)], depth=2)
+        assert next(pipe) == 0
+        pipe.close(timeout=5.0)
+
+        assert not any(thread.is_alive() for thread in pipe._threads)
+        with pytest.raises(StopIteration):
+            next(pipe)
+
+    def test_invalid_depth(self) -> None:
+        """Test that a depth below one is rejected."""
+        with pytest.raises(ValueError, match="depth"):
+            StagedPipeline([], [], depth=0)
+
+
+class TestPipelinedAnalysis:
+    """Tests for the pipelined analysis mode."""
+
+    def test_matches_sequential_pipeline(self) -> None:
+        """Test that running stages concurrently does not change the result."""
+        config = Config()
+        config.device = "cpu"
+        config.detection.model = "efficientnet"
+        config.detection.num_frames = 12
+        torch.manual_seed(0)
+        detector = load_detector(config)
+
+        sequential = run_analysis_pipeline(
+            str(SAMPLE_VIDEO), config, verbose=False, detector=detector
+        )
+        config.detection.sampling.pipelined = True
+        pipelined = run_analysis_pipeline(
+            str(SAMPLE_VIDEO), config, verbose=False, detector=detector
+        )
+
+        assert pipelined.frame_results
+        assert pipelined.to_dict() == sequential.to_dict()
@@ -0,0 +1,82 @@
+"""Unit tests for prefetch module."""
+
+import threading
+import time
+
+import pytest
+
+from deepfake_detector.analyzers.prefetch import PrefetchIterator, PrefetchStats
+
+
+class TestPrefetchIterator:
+    """Tests for PrefetchIterator class."""
+
+    def test_preserves_order(self) -> None:
+        """Test that all items arrive in source order."""
+        with PrefetchIterator(range(100), depth=3) as items:
+            assert list(items) == list(range(100))
+        assert items.stats.items == 100
+
+    def test_invalid_depth(self) -> None:
+        """Test that a depth below one raises ValueError."""
+        with pytest.raises(ValueError, match="at least 1"):
+            PrefetchIterator([], depth=0)
+
+    def test_source_error_is_reraised(self) -> None:
+        """Test that producer exceptions surface to the consumer."""
+
+        def failing_source():
+            yield 1
+            raise RuntimeError("decode failed")
+
+        with PrefetchIterator(failing_source(), depth=2) as items:
+            assert next(items) == 1
+            with pytest.raises(RuntimeError, match="decode failed"):
+                next(items)
+
+    def test_bounded_read_ahead(self) -> None:
+        """Test that the producer never runs more than depth items ahead."""
+        produced = []
+
+        def source():
+            for i in range(50):
+                produced.append(i)
+                yield i
+
+        with PrefetchIterator(source(), depth=4) as items:
+            assert next(items) == 0
+            time.sleep(0.2)
+            # One consumed, four queued, one held by the blocked producer
+            assert len(produced) <= 6
+
+    def test_close_stops_producer(self) -> None:
+        """Test that closing early stops an infinite source."""
+
+        def endless():
+            i = 0
+            while True:
+                yield i
+                i += 1
+
+        items = PrefetchIterator(endless(), depth=2)
+        assert next(items) == 0
+        items.close(timeout=2.0)
+        assert not any(t.name == "frame-prefetch" for t in threading.enumerate())
+        with pytest.raises(StopIteration):
+            next(items)
+
+    def test_slow_consumer_is_detect_bottleneck(self) -> None:
+        """Test that a slow consumer is reported as the bottleneck."""
+        with PrefetchIterator(range(5), depth=1) as items:
+            for _ in items:
+                time.sleep(0.05)
+        assert items.stats.bottleneck == "detect"
+
+
+class TestPrefetchStats:
+    """Tests for PrefetchStats dataclass."""
+
+    def test_starved_consumer_is_decode_bottleneck(self) -> None:
+        """Test that consumer waiting means decoding is the bottleneck."""
+        stats = PrefetchStats(items=10, producer_wait=0.1, consumer_wait=2.0)
+        assert stats.bottleneck == "decode"
@@ -0,0 +1,177 @@
+"""Unit tests for sampling module."""
+
+import cv2
+import numpy as np
+
+from deepfake_detector.analysis import _run_coarse_to_fine
+from deepfake_detector.analyzers.face_analyzer import FaceAnalyzer
+from deepfake_detector.analyzers.sampling import (
+    MIN_BUDGET_FRACTION,
+    frame_differences,
+    interleave_rounds,
+    refine_indices,
+    select_adaptive_indices,
+)
+from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+from deepfake_detector.utils.config import Config
+
+
+def _noisy_thumbnails(count: int, seed: int = 0) -> np.ndarray:
+    """Create a sequence of unrelated random thumbnails (high motion)."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(count, 36, 64), dtype=np.uint8)
+
+
+class TestFrameDifferences:
+    """Tests for frame_differences function."""
+
+    def test_static_sequence_has_no_motion(self) -> None:
+        """Test that identical thumbnails produce a zero signal."""
+        thumbnails = np.full((5, 36, 64), 128, dtype=np.uint8)
+        assert np.all(frame_differences(thumbnails) == 0.0)
+
+    def test_step_change(self) -> None:
+        """Test that a brightness step shows up at the right position."""
+        thumbnails = np.zeros((4, 36, 64), dtype=np.uint8)
+        thumbnails[2:] = 100
+        assert frame_differences(thumbnails).tolist() == [0.0, 0.0, 100.0, 0.0]
+
+
+class TestSelectAdaptiveIndices:
+    """Tests for select_adaptive_indices function."""
+
+    def test_static_footage_uses_fewer_frames(self) -> None:
+        """Test that near-identical frames shrink the budget."""
+        probe_indices = np.arange(0, 400, 4)
+        thumbnails = np.full((100, 36, 64), 90, dtype=np.uint8)
+
+        selected = select_adaptive_indices(probe_indices, thumbnails, 20)
+
+        assert len(selected) == int(np.ceil(20 * MIN_BUDGET_FRACTION))
+        assert selected[0] == 0
+
+    def test_shot_boundary_is_sampled(self) -> None:
+        """Test that the first frame after a cut is always selected."""
+        probe_indices = np.arange(0, 400, 4)
+        thumbnails = np.full((100, 36, 64), 40, dtype=np.uint8)
+        thumbnails[61:] = 200
+
+        selected = select_adaptive_indices(probe_indices, thumbnails, 10)
+
+        assert probe_indices[61] in selected
+
+    def test_motion_attracts_samples(self) -> None:
+        """Test that high-motion regions get more samples than static ones."""
+        probe_indices = np.arange(200)
+        thumbnails = np.full((200, 36, 64), 90, dtype=np.uint8)
+        thumbnails[100:] = _noisy_thumbnails(100)
+
+        selected = select_adaptive_indices(probe_indices, thumbnails, 20)
+
+        assert np.sum(selected >= 100) > np.sum(selected < 100)
+        assert len(selected) <= 20
+        assert np.all(np.diff(selected) > 0)
+
+    def test_short_probe_list_is_returned(self) -> None:
+        """Test that fewer probes than the budget are all kept."""
+        probe_indices = np.arange(5)
+        thumbnails = _noisy_thumbnails(5)
+        selected = select_adaptive_indices(probe_indices, thumbnails, 10)
+        assert selected.tolist() == [0, 1, 2, 3, 4]
+
+
+class TestRefineIndices:
+    """Tests for refine_indices function."""
+
+    coarse = [0, 100, 200, 300, 400, 500, 600, 700]
+
+    def test_clearly_real_stops(self) -> None:
+        """Test that uniformly low scores need no second pass."""
+        scores = [0.05, 0.1, 0.02, 0.2, 0.1, 0.0, 0.15, 0.1]
+        assert len(refine_indices(self.coarse, scores, 800, 22)) == 0
+
+    def test_clearly_fake_stops(self) -> None:
+        """Test that uniformly high scores need no second pass."""
+        scores = [0.97, 0.99, 0.95, 0.9, 0.98, 0.96, 0.99, 0.93]
+        assert len(refine_indices(self.coarse, scores, 800, 22)) == 0
+
+    def test_densifies_around_suspicious_frames(self) -> None:
+        """Test that new frames cluster around ambiguous or high scores."""
+        scores = [0.1, 0.1, 0.1, 0.5, 0.1, 0.1, 0.9, 0.1]
+        refined = refine_indices(self.coarse, scores, 800, 10, exclude=self.coarse)
+
+        assert 0 < len(refined) <= 10
+        assert all(250 <= i <= 350 or 550 <= i <= 650 for i in refined)
+        assert not set(refined.tolist()) & set(self.coarse)
+        assert np.all(np.diff(refined) > 0)
+
+    def test_respects_budget(self) -> None:
+        """Test that no more than the budget is returned."""
+        scores = [0.5] * len(self.coarse)
+        assert len(refine_indices(self.coarse, scores, 800, 3)) == 3
+        assert len(refine_indices(self.coarse, scores, 800, 0)) == 0
+
+
+class TestInterleaveRounds:
+    """Tests for interleave_rounds function."""
+
+    def test_rounds_cover_all_indices_once(self) -> None:
+        """Test that rounds partition the indices."""
+        indices = list(range(0, 300, 10))
+        rounds = interleave_rounds(indices, 4)
+        assert len(rounds) == 4
+        assert sorted(np.concatenate(rounds).tolist()) == indices
+
+    def test_first_round_spans_video(self) -> None:
+        """Test that the first round reaches both ends of the video."""
+        rounds = interleave_rounds(list(range(0, 300, 10)), 4)
+        assert rounds[0][0] == 0
+        assert rounds[0][-1] >= 250
+
+    def test_more_rounds_than_indices(self) -> None:
+        """Test that empty rounds are dropped."""
+        assert len(interleave_rounds([1, 2], 4)) == 2
+
+
+class TestCoarseToFine:
+    """Tests for the two-pass analysis mode."""
+
+    def test_faceless_video_stays_within_budget(self, tmp_path) -> None:
+        """Test that a video without faces decodes each frame once, unscored."""
+        path = tmp_path / "blank.avi"
+        writer = cv2.VideoWriter(
+            str(path), cv2.VideoWriter_fourcc(*"MJPG"), 25.0, (64, 48)
+        )
+        for _ in range(100):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()
+
+        config = Config()
+        config.detection.num_frames = 20
+        config.detection.sampling.coarse_frames = 8
+        decoded: list[int] = []
+
+        class RecordingVideo(VideoAnalyzer):
+            """VideoAnalyzer that records the frames it decodes."""
+
+            def iter_frames(self, *args, **kwargs):
+                for frame in super().iter_frames(*args, **kwargs):
+                    decoded.append(frame.index)
+                    yield frame
+
+        class UnusedLoader:  # pylint: disable=too-few-public-methods
+            """Loader that must not be waited for."""
+
+            def result(self):
+                """Fail the test if the model is requested."""
+                raise AssertionError("model load joined without faces")
+
+        with RecordingVideo() as video:
+            video.load(str(path))
+            crops, scores, scanned = _run_coarse_to_fine(
+                video, FaceAnalyzer(), UnusedLoader(), config, verbose=False
+            )
+
+        assert len(crops) == 0 and scores == []
+        assert scanned == len(decoded) == 20
+        assert len(set(decoded)) == len(decoded)
@@ -0,0 +1,111 @@
+"""Unit tests for scheduler module."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceCrop
+from deepfake_detector.models.scheduler import InferenceScheduler
+
+
+def make_crops(first_index: int, count: int) -> list[FaceCrop]:
+    """Create tiny crops whose frame index identifies them."""
+    box = BoundingBox(x=0, y=0, width=4, height=4, confidence=1.0)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    return [FaceCrop(first_index + i, box, image) for i in range(count)]
+
+
+class RecordingDetector:
+    """Detector stand-in that scores a crop by its frame index."""
+
+    def __init__(self, batch_size: int = 4, fail_on: int = -1) -> None:
+        self.batch_size = batch_size
+        self.fail_on = fail_on
+        self.batches: list = []
+
+    def predict(self, face_crops) -> list[float]:
+        """Record the batch and return one score per crop."""
+        self.batches.append(face_crops)
+        indices = [crop.frame_index for crop in face_crops]
+        if self.fail_on in indices:
+            raise RuntimeError("forward pass failed")
+        return [index / 1000 for index in indices]
+
+
+class TestInferenceScheduler:
+    """Tests for InferenceScheduler class."""
+
+    def test_single_request_passes_through(self) -> None:
+        """Test that a lone request reaches the detector unchanged."""
+        detector = RecordingDetector(batch_size=8)
+        scheduler = InferenceScheduler(detector, max_delay=0.0)
+        crops = make_crops(0, 5)
+
+        assert scheduler.predict(crops) == [i / 1000 for i in range(5)]
+        assert detector.batches[0] is crops
+        scheduler.close()
+
+    def test_large_request_is_split(self) -> None:
+        """Test that no forward pass exceeds the max batch size."""
+        detector = RecordingDetector(batch_size=4)
+        scheduler = InferenceScheduler(detector, max_delay=0.0)
+
+        scores = scheduler.predict(make_crops(0, 10))
+
+        assert scores == [i / 1000 for i in range(10)]
+        assert [len(batch) for batch in detector.batches] == [4, 4, 2]
+        scheduler.close()
+
+    def test_concurrent_requests_share_batches(self) -> None:
+        """Test that concurrent crops are merged and scores routed back."""
+        detector = RecordingDetector(batch_size=8)
+        scheduler = InferenceScheduler(detector, max_delay=0.2)
+        results: dict[int, list[float]] = {}
+
+        def client(request_id: int) -> None:
+            crops = make_crops(100 * request_id, 1 + request_id % 3)
+            results[request_id] = scheduler.predict(crops)
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+        scheduler.close()
+
+        for request_id, scores in results.items():
+            count = 1 + request_id % 3
+            assert scores == [(100 * request_id + i) / 1000 for i in range(count)]
+        assert len(results) == 6
+        assert scheduler.stats.merged_batches > 0
+        assert scheduler.stats.batches < 6
+        assert all(len(batch) <= 8 for batch in detector.batches)
+
+    def test_error_reaches_every_request_in_batch(self) -> None:
+        """Test that a failed batch fails its requests but not later ones."""
+        detector = RecordingDetector(batch_size=4, fail_on=1)
+        scheduler = InferenceScheduler(detector, max_delay=0.0)
+
+        with pytest.raises(RuntimeError, match="forward pass failed"):
+            scheduler.predict(make_crops(0, 10))
+        assert scheduler.predict(make_crops(50, 2)) == [0.05, 0.051]
+        # The failed request's remaining crops were dropped
+        assert len(detector.batches) == 2
+        scheduler.close()
+
+    def test_closed_scheduler_rejects_requests(self) -> None:
+        """Test that predict() fails after close()."""
+        scheduler = InferenceScheduler(RecordingDetector(), max_delay=0.0)
+        scheduler.close()
+
+        assert scheduler.predict([]) == []
+        with pytest.raises(RuntimeError, match="closed"):
+            scheduler.predict(make_crops(0, 1))
+
+    def test_invalid_settings(self) -> None:
+        """Test that bad batch sizes and delays are rejected."""
+        with pytest.raises(ValueError, match="batch size"):
+            InferenceScheduler(RecordingDetector(), max_batch_size=0)
+        with pytest.raises(ValueError, match="delay"):
+            InferenceScheduler(RecordingDetector(), max_delay=-1.0)
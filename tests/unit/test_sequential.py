@@ -0,0 +1,129 @@
+"""Unit tests for sequential module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deepfake_detector.analysis import _run_early_stopping, run_analysis_pipeline
+from deepfake_detector.analyzers.face_analyzer import FaceAnalyzer
+from deepfake_detector.analyzers.video_analyzer import VideoAnalyzer
+from deepfake_detector.models.loader import ModelLoader
+from deepfake_detector.models.sequential import SequentialTest
+from deepfake_detector.utils.config import Config
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+class TestSequentialTest:
+    """Tests for SequentialTest class."""
+
+    def test_confident_fake_stops_early(self) -> None:
+        """Test that consistently high scores settle on FAKE quickly."""
+        test = SequentialTest(error_rate=0.01, min_frames=4)
+        decisions = [test.update(0.97) for _ in range(8)]
+
+        assert test.decision == "FAKE"
+        assert decisions.index("FAKE") == 3
+        assert test.frames_seen == 4
+
+    def test_confident_real_stops_early(self) -> None:
+        """Test that consistently low scores settle on NOT_FAKE."""
+        test = SequentialTest()
+        for _ in range(10):
+            if test.update(0.02):
+                break
+        assert test.decision == "NOT_FAKE"
+
+    def test_ambiguous_scores_never_settle(self) -> None:
+        """Test that scores near the threshold carry no evidence."""
+        test = SequentialTest()
+        for _ in range(50):
+            test.update(0.49)
+            test.update(0.55)
+        assert test.decision is None
+        assert test.log_likelihood_ratio == 0.0
+
+    def test_mixed_scores_need_more_frames(self) -> None:
+        """Test that conflicting evidence delays the decision."""
+        test = SequentialTest(min_frames=1)
+        for score in [0.9, 0.1, 0.9, 0.1, 0.9]:
+            assert test.update(score) is None
+
+    def test_stricter_error_rate_needs_more_frames(self) -> None:
+        """Test that a lower error rate consumes more frames."""
+        loose = SequentialTest(error_rate=0.05, min_frames=1)
+        strict = SequentialTest(error_rate=0.001, min_frames=1)
+        while loose.update(0.95) is None:
+            pass
+        while strict.update(0.95) is None:
+            pass
+        assert strict.frames_seen > loose.frames_seen
+
+    def test_invalid_error_rate(self) -> None:
+        """Test that an out-of-range error rate raises ValueError."""
+        with pytest.raises(ValueError, match="Error rate"):
+            SequentialTest(error_rate=0.7)
+
+
+class TestEarlyStoppingAnalysis:
+    """Tests for the early stopping analysis mode."""
+
+    def test_scores_micro_batches(self) -> None:
+        """Test that crops are scored in batches and the run stops early."""
+        config = Config()
+        config.detection.num_frames = 24
+        config.detection.inference.batch_size = 3
+        batches: list[int] = []
+
+        class ConfidentDetector:  # pylint: disable=too-few-public-methods
+            """Detector stand-in that finds every face clearly fake."""
+
+            def predict(self, face_crops) -> list[float]:
+                """Record the batch size and score every crop 0.99."""
+                batches.append(len(face_crops))
+                return [0.99] * len(face_crops)
+
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            loader = ModelLoader(ConfidentDetector)
+            crops, scores, scanned, decision = _run_early_stopping(
+                video, FaceAnalyzer(), loader, config, verbose=False
+            )
+
+        assert decision == "FAKE" and scanned < 24
+        assert batches and max(batches) == 3 and len(batches) < len(scores)
+        assert len(crops) == len(scores) == sum(batches)
+
+    def test_verdict_follows_early_decision(self) -> None:
+        """Test that the verdict agrees with the test that stopped sampling."""
+        config = Config()
+        config.device = "cpu"
+        config.detection.num_frames = 40
+        config.detection.inference.batch_size = 2
+        config.detection.sampling.early_stopping = True
+
+        class SplitDetector:  # pylint: disable=too-few-public-methods
+            """Detector stand-in: one clearly fake face, then real ones."""
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def predict(self, face_crops) -> list[float]:
+                """Score the first crop 0.99 and every later one 0.25."""
+                scores = [0.25] * len(face_crops)
+                if self.calls == 0:
+                    scores[0] = 0.99
+                self.calls += 1
+                return scores
+
+        result = run_analysis_pipeline(
+            str(SAMPLE_VIDEO), config, verbose=False, detector=SplitDetector()
+        )
+        scores = [frame.confidence for frame in result.frame_results]
+        # The mean/max rule alone would call this sample fake
+        assert 0.7 * np.mean(scores) + 0.3 * max(scores) >= 0.5
+
+        assert result.stopped_early
+        assert result.verdict == "NOT_FAKE"
+        assert "sequential_test" in [indicator.name for indicator in result.indicators]
@@ -0,0 +1,210 @@
+"""Unit tests for the analysis server."""
+
+import io
+import json
+import shutil
+import socketserver
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+import torch
+from click.testing import CliRunner
+
+from deepfake_detector import server as server_module
+from deepfake_detector.analysis import run_analysis_pipeline
+from deepfake_detector.cli import main
+from deepfake_detector.models.detector import DeepFakeDetector
+from deepfake_detector.models.results import AggregatedResult
+from deepfake_detector.server import (
+    PROTOCOL_VERSION,
+    AnalysisServer,
+    _RequestHandler,
+    forward_analysis,
+)
+from deepfake_detector.utils.config import Config
+from deepfake_detector.utils.validators import ValidationError
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+def make_config(socket_path: Path) -> Config:
+    """Create a small CPU configuration using the given socket."""
+    config = Config()
+    config.device = "cpu"
+    config.detection.model = "efficientnet"
+    config.detection.num_frames = 6
+    config.detection.server.socket_path = str(socket_path)
+    return config
+
+
+@pytest.fixture(scope="module")
+def detector() -> DeepFakeDetector:
+    """Create a detector with a randomly initialised EfficientNet."""
+    torch.manual_seed(0)
+    detector = DeepFakeDetector(model_name="efficientnet", device="cpu")
+    detector.load_model()
+    return detector
+
+
+@pytest.fixture
+def socket_path():
+    """Return a socket path short enough for AF_UNIX."""
+    directory = Path(tempfile.mkdtemp(prefix="dfd"))
+    yield directory / "detector.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class _FixedReplyHandler(socketserver.StreamRequestHandler):
+    """Answer any request with the server's canned reply."""
+
+    def handle(self) -> None:
+        """Read the request line and write the reply."""
+        self.rfile.readline()
+        self.wfile.write(self.server.reply)  # type: ignore[attr-defined]
+
+
+@pytest.fixture
+def server(socket_path: Path, detector: DeepFakeDetector):
+    """Run a server on a background thread."""
+    server = AnalysisServer(socket_path, make_config(socket_path), detector)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5.0)
+
+
+class TestAnalysisServer:
+    """Tests for AnalysisServer and forward_analysis."""
+
+    def test_result_matches_in_process(
+        self, server: AnalysisServer, detector: DeepFakeDetector
+    ) -> None:
+        """Test that a forwarded analysis equals the in-process pipeline."""
+        config = make_config(server.socket_path)
+
+        forwarded = forward_analysis(str(SAMPLE_VIDEO), config)
+        local = run_analysis_pipeline(
+            str(SAMPLE_VIDEO), config, verbose=False, detector=detector
+        )
+
+        assert forwarded is not None
+        assert forwarded.frame_results
+        assert forwarded.to_dict() == local.to_dict()
+
+    def test_no_server(self, socket_path: Path) -> None:
+        """Test that the client falls back when nothing is listening."""
+        assert forward_analysis(str(SAMPLE_VIDEO), make_config(socket_path)) is None
+
+    def test_settings_mismatch(self, server: AnalysisServer) -> None:
+        """Test that a request for another model is left to the client."""
+        config = make_config(server.socket_path)
+        config.detection.inference.precision = "bf16"
+
+        assert forward_analysis(str(SAMPLE_VIDEO), config) is None
+
+    def test_invalid_video(self, server: AnalysisServer, tmp_path: Path) -> None:
+        """Test that the server's validation error reaches the client."""
+        config = make_config(server.socket_path)
+
+        with pytest.raises(ValidationError):
+            forward_analysis(str(tmp_path / "missing.mp4"), config)
+
+    def test_socket_is_owner_only(self, server: AnalysisServer) -> None:
+        """Test that other users cannot connect to the socket."""
+        mode = stat.S_IMODE(server.socket_path.stat().st_mode)
+        assert mode & 0o077 == 0
+
+    def test_refuses_second_server(
+        self, server: AnalysisServer, detector: DeepFakeDetector
+    ) -> None:
+        """Test that a running server is not displaced."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            AnalysisServer(server.socket_path, server.config, detector)
+
+    def test_replaces_stale_socket(
+        self, socket_path: Path, detector: DeepFakeDetector
+    ) -> None:
+        """Test that a socket left behind by a dead server is reused."""
+        socket_path.touch()
+        server = AnalysisServer(socket_path, make_config(socket_path), detector)
+        server.server_close()
+
+        assert not socket_path.exists()
+
+    def test_socket_of_another_user(
+        self, server: AnalysisServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a socket owned by someone else is not trusted."""
+        owner = server.socket_path.stat().st_uid
+        monkeypatch.setattr(server_module.os, "getuid", lambda: owner + 1)
+
+        assert (
+            forward_analysis(str(SAMPLE_VIDEO), make_config(server.socket_path)) is None
+        )
+
+    def test_analyze_forwards_only_when_enabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that plain 'analyze' never contacts a server."""
+        forwarded = []
+        monkeypatch.setattr(
+            server_module, "forward_analysis", lambda *args: forwarded.append(args)
+        )
+        monkeypatch.setenv("DEFAULT_MODEL", "efficientnet")
+        arguments = ["analyze", str(SAMPLE_VIDEO), "-n", "2", "-d", "cpu", "--json"]
+
+        assert CliRunner().invoke(main, arguments).exit_code == 0
+        assert not forwarded
+        CliRunner().invoke(main, [*arguments, "--server"])
+        assert len(forwarded) == 1
+
+    def test_client_gone_before_response(self, server: AnalysisServer) -> None:
+        """Test that a client hanging up early does not fail the handler."""
+
+        class ClosedStream:  # pylint: disable=too-few-public-methods
+            """Write end of a connection the client has closed."""
+
+            def write(self, data: bytes) -> None:
+                """Fail like a socket without a reader."""
+                raise BrokenPipeError(32, "Broken pipe")
+
+        handler = _RequestHandler.__new__(_RequestHandler)
+        handler.server = server
+        handler.rfile = io.BytesIO(
+            json.dumps({"protocol": PROTOCOL_VERSION, "command": "ping"}).encode()
+        )
+        handler.wfile = ClosedStream()
+
+        handler.handle()
+
+    @pytest.mark.parametrize("reply", [b"not json\n", b"{}\n", b"[1]\n"])
+    def test_unreadable_reply(self, socket_path: Path, reply: bytes) -> None:
+        """Test that a garbled reply falls back to in-process analysis."""
+        fake = socketserver.UnixStreamServer(str(socket_path), _FixedReplyHandler)
+        fake.reply = reply  # type: ignore[attr-defined]
+        thread = threading.Thread(target=fake.serve_forever, daemon=True)
+        thread.start()
+        try:
+            assert forward_analysis(str(SAMPLE_VIDEO), make_config(socket_path)) is None
+        finally:
+            fake.shutdown()
+            fake.server_close()
+            thread.join(timeout=5.0)
+
+
+class TestAggregatedResultSerialization:
+    """Tests for AggregatedResult round trips."""
+
+    def test_round_trip(self, detector: DeepFakeDetector) -> None:
+        """Test that from_dict(to_dict()) rebuilds an equal result."""
+        config = make_config(Path("unused.sock"))
+        result = run_analysis_pipeline(
+            str(SAMPLE_VIDEO), config, verbose=False, detector=detector
+        )
+
+        assert AggregatedResult.from_dict(result.to_dict()) == result
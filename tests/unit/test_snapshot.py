@@ -0,0 +1,194 @@
+"""Unit tests for pinned model snapshots."""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import huggingface_hub
+import numpy as np
+import pytest
+import torch
+import transformers
+from click.testing import CliRunner
+from transformers import ViTConfig, ViTForImageClassification, ViTImageProcessor
+
+from deepfake_detector.analyzers.face_analyzer import BoundingBox, FaceCrop
+from deepfake_detector.cli import main
+from deepfake_detector.models.detector import HUGGINGFACE_MODEL, DeepFakeDetector
+from deepfake_detector.models.snapshot import (
+    SnapshotError,
+    create_manifest,
+    download_snapshot,
+    load_manifest,
+    manifest_path,
+)
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+def save_tiny_vit(directory: Path) -> Path:
+    """Save a tiny randomly initialised ViT and its processor."""
+    torch.manual_seed(0)
+    config = ViTConfig(
+        image_size=32,
+        patch_size=16,
+        hidden_size=32,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=37,
+        num_labels=2,
+        id2label={0: "Real", 1: "Fake"},
+        label2id={"Real": 0, "Fake": 1},
+    )
+    ViTForImageClassification(config).save_pretrained(directory)
+    ViTImageProcessor(size={"height": 32, "width": 32}).save_pretrained(directory)
+    return directory
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    """Create a cache directory with a pinned tiny ViT snapshot."""
+    cache = tmp_path / "cache"
+    directory = save_tiny_vit(cache / "models" / "tiny-vit")
+    create_manifest(HUGGINGFACE_MODEL, "0123abcd", directory).save(cache)
+    return cache
+
+
+class TestSnapshotManifest:
+    """Tests for snapshot manifests."""
+
+    def test_round_trip(self, cache_dir: Path) -> None:
+        """Test that a saved manifest loads with the same files."""
+        manifest = load_manifest(cache_dir, HUGGINGFACE_MODEL)
+
+        assert manifest is not None
+        assert manifest.revision == "0123abcd"
+        assert manifest.directory == cache_dir / "models" / "tiny-vit"
+        names = {entry.path for entry in manifest.files}
+        assert {"config.json", "model.safetensors"} <= names
+        manifest.verify(checksums=True)
+
+    def test_directory_stored_relative_to_cache(self, cache_dir: Path) -> None:
+        """Test that the cache directory can be moved with its snapshots."""
+        path = manifest_path(cache_dir, HUGGINGFACE_MODEL)
+        assert json.loads(path.read_text())["directory"] == "models/tiny-vit"
+
+        moved = cache_dir.parent / "moved"
+        shutil.move(cache_dir, moved)
+        load_manifest(moved, HUGGINGFACE_MODEL).verify()
+
+    def test_missing_manifest(self, tmp_path: Path) -> None:
+        """Test that an unpinned repository has no manifest."""
+        assert load_manifest(tmp_path, HUGGINGFACE_MODEL) is None
+
+    def test_verify_detects_changes(self, cache_dir: Path) -> None:
+        """Test that verification catches missing and altered files."""
+        manifest = load_manifest(cache_dir, HUGGINGFACE_MODEL)
+        config_file = manifest.directory / "config.json"
+
+        # Same size, different content: the new modification time gets the
+        # file hashed
+        content = config_file.read_bytes()
+        config_file.write_bytes(content.replace(b"Fake", b"Faux"))
+        with pytest.raises(RuntimeError, match="checksum"):
+            manifest.verify()
+        with pytest.raises(RuntimeError, match="checksum"):
+            manifest.verify(checksums=True)
+
+        config_file.write_bytes(content + b"\n")
+        with pytest.raises(RuntimeError, match="size"):
+            manifest.verify()
+
+        config_file.unlink()
+        with pytest.raises(RuntimeError, match="missing"):
+            manifest.verify()
+
+    def test_download_pins_commit(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a downloaded snapshot is pinned to its commit hash."""
+        requests = []
+
+        def fake_download(repo_id, revision, cache_dir, allow_patterns):
+            requests.append((repo_id, revision, allow_patterns))
+            return str(save_tiny_vit(Path(cache_dir) / "snapshots-hub" / "f00dfeed"))
+
+        monkeypatch.setattr(huggingface_hub, "snapshot_download", fake_download)
+        manifest = download_snapshot(HUGGINGFACE_MODEL, "main", tmp_path)
+
+        assert requests[0][:2] == (HUGGINGFACE_MODEL, "main")
+        assert "*.safetensors" in requests[0][2]
+        assert manifest.revision == "f00dfeed"
+        assert load_manifest(tmp_path, HUGGINGFACE_MODEL).revision == "f00dfeed"
+
+
+class TestOfflineLoading:
+    """Tests for loading the detector from a pinned snapshot."""
+
+    def test_loads_from_snapshot(self, cache_dir: Path) -> None:
+        """Test that the model loads offline and can score crops."""
+        detector = DeepFakeDetector(
+            device="cpu", cache_dir=str(cache_dir), offline=True
+        )
+        detector.load_model()
+
+        assert detector.is_loaded
+        rng = np.random.default_rng(0)
+        box = BoundingBox(x=0, y=0, width=32, height=32, confidence=1.0)
+        crops = [
+            FaceCrop(i, box, rng.integers(0, 256, (32, 32, 3), dtype=np.uint8))
+            for i in range(3)
+        ]
+        scores = detector.predict(crops)
+        assert len(scores) == 3
+        assert all(0.0 <= score <= 1.0 for score in scores)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+    @pytest.mark.skipif(
+        int(transformers.__version__.split(".")[0]) < 5,
+        reason="transformers 4.x copies the weights",
+    )
+    def test_weights_are_memory_mapped(self, cache_dir: Path) -> None:
+        """Test that the weights stay backed by the snapshot file."""
+        detector = DeepFakeDetector(
+            device="cpu", cache_dir=str(cache_dir), offline=True
+        )
+        detector.load_model()
+
+        weights = load_manifest(cache_dir, HUGGINGFACE_MODEL).directory
+        mapped = Path("/proc/self/maps").read_text()
+        assert str((weights / "model.safetensors").resolve()) in mapped
+
+    def test_offline_without_snapshot(self, tmp_path: Path) -> None:
+        """Test that offline mode never falls back to the hub."""
+        detector = DeepFakeDetector(device="cpu", cache_dir=str(tmp_path), offline=True)
+        with pytest.raises(SnapshotError, match="No snapshot"):
+            detector.load_model()
+
+        assert not detector.is_loaded
+
+    def test_analyze_offline_without_snapshot_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that analyze reports the missing snapshot instead of guessing."""
+        monkeypatch.setenv("MODEL_OFFLINE", "true")
+        monkeypatch.setenv("MODEL_CACHE_DIR", str(tmp_path))
+        result = CliRunner().invoke(
+            main, ["analyze", str(SAMPLE_VIDEO), "-n", "4", "-d", "cpu", "--json"]
+        )
+
+        assert result.exit_code == 2
+        assert "deepfake-detector snapshot" in result.output
+
+    def test_damaged_snapshot_is_not_loaded(self, cache_dir: Path) -> None:
+        """Test that a truncated weights file is rejected before loading."""
+        weights = load_manifest(cache_dir, HUGGINGFACE_MODEL).directory
+        with open(weights / "model.safetensors", "r+b") as handle:
+            handle.truncate(100)
+
+        detector = DeepFakeDetector(
+            device="cpu", cache_dir=str(cache_dir), offline=True
+        )
+        with pytest.raises(SnapshotError, match="size changed"):
+            detector.load_model()
+
+        assert not detector.is_loaded
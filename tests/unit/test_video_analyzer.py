@@ -0,0 +1,145 @@
+"""Unit tests for video analyzer module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deepfake_detector.analyzers import video_analyzer
+from deepfake_detector.analyzers.video_analyzer import (
+    SEQUENTIAL_SCAN_MAX_GAP,
+    VideoAnalyzer,
+    choose_decode_strategy,
+)
+
+SAMPLE_VIDEO = Path(__file__).resolve().parents[2] / "data" / "fake" / "man_hair.1.mp4"
+
+
+class TestChooseDecodeStrategy:
+    """Tests for choose_decode_strategy function."""
+
+    def test_dense_sampling_is_sequential(self) -> None:
+        """Test that closely spaced indices use a linear scan."""
+        indices = np.linspace(0, 191, 30, dtype=int)
+        assert choose_decode_strategy(indices) == "sequential"
+
+    def test_sparse_sampling_is_seek(self) -> None:
+        """Test that widely spaced indices use seeking."""
+        indices = np.arange(
+            0, 100 * SEQUENTIAL_SCAN_MAX_GAP, 2 * SEQUENTIAL_SCAN_MAX_GAP
+        )
+        assert choose_decode_strategy(indices) == "seek"
+
+    def test_single_index_is_seek(self) -> None:
+        """Test that a single frame is read with a seek."""
+        assert choose_decode_strategy(np.array([0])) == "seek"
+
+    def test_explicit_strategy_is_kept(self) -> None:
+        """Test that a non-auto strategy is returned unchanged."""
+        indices = np.linspace(0, 191, 30, dtype=int)
+        assert choose_decode_strategy(indices, "seek") == "seek"
+
+
+class TestVideoAnalyzer:
+    """Tests for VideoAnalyzer class."""
+
+    def test_invalid_decode_strategy(self) -> None:
+        """Test that an unknown decode strategy raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown decode strategy"):
+            VideoAnalyzer(decode_strategy="random")
+
+    def test_extract_without_load(self) -> None:
+        """Test that extracting before loading raises ValueError."""
+        with pytest.raises(ValueError, match="No video loaded"):
+            VideoAnalyzer().extract_frames()
+
+    def test_strategies_return_identical_frames(self) -> None:
+        """Test that sequential decoding matches per-index seeking."""
+        with VideoAnalyzer(decode_strategy="seek") as video:
+            video.load(str(SAMPLE_VIDEO))
+            seek_frames = video.extract_frames(num_frames=10)
+
+        with VideoAnalyzer(decode_strategy="sequential") as video:
+            video.load(str(SAMPLE_VIDEO))
+            sequential_frames = video.extract_frames(num_frames=10)
+
+        assert [f.index for f in seek_frames] == [f.index for f in sequential_frames]
+        for seek_frame, sequential_frame in zip(seek_frames, sequential_frames):
+            assert seek_frame.timestamp == sequential_frame.timestamp
+            assert np.array_equal(seek_frame.image, sequential_frame.image)
+
+    def test_repeated_extraction(self) -> None:
+        """Test that a second extraction rewinds the linear scan."""
+        with VideoAnalyzer(decode_strategy="sequential") as video:
+            video.load(str(SAMPLE_VIDEO))
+            first = video.extract_frames(num_frames=5)
+            second = video.extract_frames(num_frames=5)
+
+        assert [f.index for f in first] == [f.index for f in second]
+        assert np.array_equal(first[0].image, second[0].image)
+
+    def test_parallel_segments_match_serial(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that segment decoding in workers returns the serial frames."""
+        # The sample clip is far shorter than a worthwhile segment
+        monkeypatch.setattr(video_analyzer, "PARALLEL_MIN_SEGMENT_FRAMES", 1)
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            serial_frames = video.extract_frames(num_frames=12)
+
+        with VideoAnalyzer(decode_workers=3) as video:
+            video.load(str(SAMPLE_VIDEO))
+            parallel_frames = video.extract_frames(num_frames=12)
+
+        assert [f.index for f in parallel_frames] == [f.index for f in serial_frames]
+        for parallel_frame, serial_frame in zip(parallel_frames, serial_frames):
+            assert np.array_equal(parallel_frame.image, serial_frame.image)
+
+    def test_parallel_workers_are_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an abandoned iteration does not leak into the next one."""
+        monkeypatch.setattr(video_analyzer, "PARALLEL_MIN_SEGMENT_FRAMES", 1)
+        with VideoAnalyzer(decode_workers=2) as video:
+            video.load(str(SAMPLE_VIDEO))
+            frames = video.iter_frames(num_frames=12)
+            next(frames)
+            frames.close()
+            pool = video._pool  # pylint: disable=W0212
+
+            indices = [f.index for f in video.iter_frames(indices=[5, 90, 150])]
+            assert video._pool is pool  # pylint: disable=W0212
+
+        assert indices == [5, 90, 150]
+
+    def test_short_clip_decodes_in_process(self) -> None:
+        """Test that short clips are not split across workers."""
+        with VideoAnalyzer(decode_workers=4) as video:
+            video.load(str(SAMPLE_VIDEO))
+            indices = np.linspace(0, 191, 30, dtype=int)
+            assert video._num_segments(indices) == 1  # pylint: disable=W0212
+
+    def test_adaptive_sampling_within_budget(self) -> None:
+        """Test that adaptive sampling returns sorted frames within budget."""
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            frames = video.extract_frames(num_frames=20, sampling="adaptive")
+
+        indices = [f.index for f in frames]
+        assert 0 < len(indices) <= 20
+        assert indices[0] == 0
+        assert indices == sorted(set(indices))
+
+    def test_invalid_sampling_strategy(self) -> None:
+        """Test that an unknown sampling strategy raises ValueError."""
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            with pytest.raises(ValueError, match="Unknown sampling strategy"):
+                video.iter_frames(sampling="random")
+
+    def test_explicit_indices(self) -> None:
+        """Test decoding an explicit, unsorted index list."""
+        with VideoAnalyzer() as video:
+            video.load(str(SAMPLE_VIDEO))
+            frames = list(video.iter_frames(indices=[50, 10, 10, 5000]))
+
+        assert [f.index for f in frames] == [10, 50]